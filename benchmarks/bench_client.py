@@ -0,0 +1,176 @@
+"""
+Measures the client end to end against the bundled `StubServer`.
+
+Each scenario drives `APICaller` through one of its paths: single requests,
+pagination with and without prefetching, cache hits, bulk lookups and 429
+retries. The pool scenarios run 32 worker threads against transports of
+different pool sizes; with `--delay` set, their throughput should scale with
+the pool size. It reports the operations per second, the requests per second
+reaching the server, the p50 and p99 latency of each operation and the peak
+memory allocated while running it.
+Responses are served from a recording file when one is given, and from
+synthetic pages of `bench_models.RECORD` otherwise.
+
+Run with `python benchmarks/bench_client.py [--delay SECONDS] [recording.json]`.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Flights import Flights
+from aeroapi_python.ResponseCache import ResponseCache
+from aeroapi_python.RetryPolicy import RetryPolicy
+from aeroapi_python.StubServer import StubServer
+from aeroapi_python.Transport import HTTPXTransport, RequestsTransport
+
+from bench_models import RECORD
+
+OPERATIONS = 300
+PAGES = 20
+PAGE_SIZE = 100
+FLIGHT_IDS = [f"UAL{i}" for i in range(OPERATIONS)]
+PAGED_PATH = "/airports/KLAX/flights/arrivals?max_pages=1"
+
+
+def setup(server):
+    for flight_id in FLIGHT_IDS:
+        server.routes[f"/flights/{flight_id}"] = (
+            200,
+            {"flights": [dict(RECORD, ident=flight_id)]},
+        )
+    server.add_pages(PAGED_PATH, "arrivals", [RECORD] * (PAGES * PAGE_SIZE), PAGE_SIZE)
+
+
+def single(server):
+    api_caller = APICaller(server.base_url, "test_api_key")
+    return [lambda i=i: api_caller.get(f"flights/{i}") for i in FLIGHT_IDS]
+
+
+def paginate(prefetch_pages):
+    def scenario(server):
+        api_caller = APICaller(
+            server.base_url, "test_api_key", prefetch_pages=prefetch_pages
+        )
+        path = api_caller.base_url + PAGED_PATH.lstrip("/")
+
+        def walk():
+            for _ in api_caller.iter_records(path, ("arrivals",)):
+                pass
+
+        return [walk] * 5
+
+    return scenario
+
+
+def cached(server):
+    api_caller = APICaller(
+        server.base_url, "test_api_key", cache=ResponseCache(default_ttl=3600)
+    )
+    return [lambda i=i: api_caller.get(f"flights/{i}") for i in FLIGHT_IDS[:10]] * 30
+
+
+def bulk(server):
+    flights = Flights(APICaller(server.base_url, "test_api_key"))
+    return [lambda: flights.get_flights_bulk(FLIGHT_IDS, concurrency=8)]
+
+
+def pooled(make_transport):
+    def scenario(server):
+        flights = Flights(
+            APICaller(server.base_url, "test_api_key", transport=make_transport())
+        )
+        return [lambda: flights.get_flights_bulk(FLIGHT_IDS, concurrency=32)]
+
+    return scenario
+
+
+def retried(server):
+    api_caller = APICaller(
+        server.base_url,
+        "test_api_key",
+        retry_policy=RetryPolicy(backoff_factor=0, jitter=0),
+    )
+
+    def call(i):
+        server.add_failures(f"/flights/{i}", 429, 1, {"Retry-After": "0"})
+        return api_caller.get(f"flights/{i}")
+
+    return [lambda i=i: call(i) for i in FLIGHT_IDS[:100]]
+
+
+SCENARIOS = {
+    "get": single,
+    "pagination": paginate(0),
+    "pagination (prefetch 2)": paginate(2),
+    "cache hits": cached,
+    "bulk (8 threads)": bulk,
+    "429 retries": retried,
+    # Blocking pools make threads wait for a connection instead of opening
+    # throwaway ones, which is what bounds throughput by the pool size.
+    "bulk (32 threads, pool 4)": pooled(
+        lambda: RequestsTransport(pool_maxsize=4, pool_block=True)
+    ),
+    "bulk (32 threads, pool 32)": pooled(
+        lambda: RequestsTransport(pool_maxsize=32, pool_block=True)
+    ),
+    "bulk (32 threads, httpx)": pooled(lambda: HTTPXTransport(http2=False)),
+    "bulk (32 threads, per-thread)": pooled(
+        lambda: RequestsTransport(pool_maxsize=32, per_thread=True)
+    ),
+}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run(server, scenario, trace):
+    operations = scenario(server)
+    sent = len(server.requests)
+    if trace:
+        tracemalloc.start()
+    latencies = []
+    start = time.perf_counter()
+    for operation in operations:
+        began = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - began)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return len(server.requests) - sent, elapsed, latencies, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recording", nargs="?", help="a StubServer recording file")
+    parser.add_argument("--delay", type=float, default=0.0, help="server latency")
+    args = parser.parse_args()
+
+    with StubServer(delay=args.delay) as server:
+        setup(server)
+        if args.recording:
+            server.load(args.recording)
+        print(
+            f"{'scenario':>30}  {'ops/s':>8}  {'req/s':>8}  "
+            f"{'p50 ms':>8}  {'p99 ms':>8}  {'peak MB':>8}"
+        )
+        for name, scenario in SCENARIOS.items():
+            sent, elapsed, latencies, _ = run(server, scenario, trace=False)
+            # Memory is measured in a second run: tracing slows allocation down.
+            _, _, _, peak = run(server, scenario, trace=True)
+            print(
+                f"{name:>30}  {len(latencies) / elapsed:8.0f}  "
+                f"{sent / elapsed:8.0f}  "
+                f"{percentile(latencies, 0.5) * 1e3:8.2f}  "
+                f"{percentile(latencies, 0.99) * 1e3:8.2f}  {peak / 1e6:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
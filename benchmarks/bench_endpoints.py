@@ -0,0 +1,47 @@
+"""
+Compares the per-call cost of building and resolving a request URL: the former
+`_build_path` followed by `urljoin`, against an `Endpoint` from the endpoint
+table followed by the absolute-URL fast path of `_url`.
+
+Run with `python benchmarks/bench_endpoints.py`.
+"""
+
+import timeit
+from urllib.parse import urljoin
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Endpoints import ENDPOINTS
+
+ROUNDS = 100_000
+
+
+def main():
+    api_caller = APICaller("https://aeroapi.flightaware.com/aeroapi/", "key")
+    base_url = api_caller.base_url
+    endpoint = ENDPOINTS["airports/{airport_id}/flights/arrivals"]
+    query = {
+        "airline": "UAL",
+        "type": None,
+        "start": None,
+        "end": None,
+        "max_pages": 1,
+        "cursor": None,
+    }
+
+    def before():
+        path = api_caller._build_path("airports", "KLAX/flights/arrivals", query)
+        return urljoin(base_url, path)
+
+    def after():
+        return api_caller._url(endpoint.url(base_url, "KLAX", **query))
+
+    assert before() == after()
+    baseline = None
+    for name, build in (("_build_path + urljoin", before), ("Endpoint.url", after)):
+        elapsed = min(timeit.repeat(build, number=ROUNDS, repeat=5)) / ROUNDS
+        baseline = baseline or elapsed
+        print(f"{name:>22}: {elapsed * 1e6:6.2f} us  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
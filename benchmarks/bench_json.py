@@ -0,0 +1,75 @@
+"""
+Compares the JSON decoders available to `APICaller(json_decoder=...)`.
+
+Decodes recorded response bodies, given as file paths on the command line, or
+synthetic `airports/{id}/flights` and `flights/search` pages otherwise. The
+`response.json()` row reproduces what the client does by default: decode the
+bytes to text, then parse the text with the standard library.
+
+Run with `python benchmarks/bench_json.py [recorded.json ...]`.
+"""
+
+import json
+import sys
+import time
+
+from aeroapi_python.JSONDecoder import DECODERS
+
+from bench_models import RECORD
+
+ROUNDS = 20
+
+
+def synthetic_payloads():
+    board = {
+        key: [RECORD] * 500
+        for key in (
+            "arrivals",
+            "departures",
+            "scheduled_arrivals",
+            "scheduled_departures",
+        )
+    }
+    board["links"] = {"next": "/airports/KLAX/flights?cursor=abc"}
+    board["num_pages"] = 1
+    search = {"flights": [RECORD] * 1000, "links": None, "num_pages": 1}
+    return {
+        "airports/KLAX/flights": json.dumps(board).encode(),
+        "flights/search": json.dumps(search).encode(),
+    }
+
+
+def response_json(data):
+    return json.loads(data.decode("utf-8"))
+
+
+def main(paths):
+    if paths:
+        payloads = {}
+        for path in paths:
+            with open(path, "rb") as f:
+                payloads[path] = f.read()
+    else:
+        payloads = synthetic_payloads()
+
+    decoders = {"response.json()": response_json}
+    for name, factory in DECODERS.items():
+        try:
+            decoders[name] = factory()
+        except ImportError:
+            print(f"{name}: not installed")
+
+    for label, data in payloads.items():
+        print(f"{label} ({len(data) / 1e6:.1f} MB)")
+        baseline = None
+        for name, decode in decoders.items():
+            start = time.perf_counter()
+            for _ in range(ROUNDS):
+                decode(data)
+            elapsed = (time.perf_counter() - start) / ROUNDS
+            baseline = baseline or elapsed
+            print(f"  {name:>16}: {elapsed * 1e3:7.1f} ms  ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,114 @@
+"""
+Compares plain dict records with the slotted models of `aeroapi_python.Models`.
+
+Reports the memory retained per flight and the time to parse a page of
+flights and read one field of each, the typical first use of a search result
+(the best of a few runs). Models that decode every timestamp and nested object
+up front are included to show what lazy decoding saves.
+
+Models save memory, not time. They are built from the dicts `json.loads`
+returns, so their time to first use is that of the dicts plus construction,
+several microseconds per flight: they do not reach first use sooner than raw
+dicts. The benchmark asserts the memory saving over dicts and the time saved
+by lazy over eager decoding, and reports the time models add over dicts.
+
+Run with `python benchmarks/bench_models.py`.
+"""
+
+import json
+import time
+import tracemalloc
+
+from aeroapi_python.Models import Flight
+
+N = 20_000
+RUNS = 5
+
+# AeroAPI returns every flight field, using null for unknown values.
+RECORD = dict.fromkeys(Flight._slot_for)
+RECORD.update(
+    {
+        "ident": "UAL123",
+        "ident_icao": "UAL123",
+        "ident_iata": "UA123",
+        "fa_flight_id": "UAL123-1696161600-airline-0123",
+        "operator": "UAL",
+        "flight_number": "123",
+        "registration": "N12345",
+        "status": "En Route",
+        "aircraft_type": "B738",
+        "progress_percent": 42,
+        "route_distance": 1846,
+        "origin": {"code": "KSFO", "code_icao": "KSFO", "code_iata": "SFO"},
+        "destination": {"code": "KORD", "code_icao": "KORD", "code_iata": "ORD"},
+        "scheduled_out": "2024-10-01T12:30:00Z",
+        "estimated_out": "2024-10-01T12:35:00Z",
+        "actual_out": "2024-10-01T12:41:00Z",
+        "scheduled_off": "2024-10-01T12:45:00Z",
+        "scheduled_on": "2024-10-01T16:50:00Z",
+        "scheduled_in": "2024-10-01T17:00:00Z",
+    }
+)
+
+
+def first_use(build, payload):
+    records = build(json.loads(payload)["flights"])
+    for record in records:
+        record["ident"]
+    return records
+
+
+def measure(build, payload):
+    elapsed = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        first_use(build, payload)
+        elapsed = min(elapsed, time.perf_counter() - start)
+    tracemalloc.start()
+    records = first_use(build, payload)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return elapsed, size
+
+
+def main():
+    def dicts(records):
+        return records
+
+    def models(records):
+        return [Flight(record) for record in records]
+
+    def eager_models(records):
+        flights = [Flight(record) for record in records]
+        for flight in flights:
+            for name in Flight._slot_for:
+                getattr(flight, name)
+        return flights
+
+    payload = json.dumps({"flights": [RECORD] * N})
+    results = {}
+    for name, build in (
+        ("dict", dicts),
+        ("Flight", models),
+        ("Flight (eagerly decoded)", eager_models),
+    ):
+        elapsed, size = results[name] = measure(build, payload)
+        print(
+            f"{name:>24}: {elapsed * 1e3:7.1f} ms to first use, "
+            f"{size / N:6.0f} bytes retained per flight"
+        )
+
+    (dict_time, dict_size), (time_, size) = results["dict"], results["Flight"]
+    print(
+        f"Flight vs dict: {1 - size / dict_size:.0%} less memory, "
+        f"{(time_ - dict_time) / N * 1e6:.1f} us more per flight to first use"
+    )
+    assert size < dict_size, "models should retain less memory than dicts"
+    assert (
+        time_ < results["Flight (eagerly decoded)"][0]
+    ), "lazy decoding should beat eager decoding to first use"
+
+
+if __name__ == "__main__":
+    main()
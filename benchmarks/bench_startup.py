@@ -0,0 +1,74 @@
+"""
+Measures the startup cost of the client: importing `aeroapi_python.AeroAPI`,
+constructing an `AeroAPI`, and the first access to a resource and to the
+session, each in a fresh interpreter.
+
+Also lists the heavy dependencies loaded after construction, which should be
+none: `requests`, `httpx`, `numpy`, `asyncio` and `multiprocessing` are
+imported on first use.
+
+Run with `python benchmarks/bench_startup.py [--runs N] [--budget MS]`; with
+`--budget`, exits with status 1 if the median import and construction time
+exceeds it.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY = ("requests", "httpx", "numpy", "asyncio", "multiprocessing")
+
+SCRIPT = """
+import json, sys, time
+
+start = time.perf_counter()
+from aeroapi_python.AeroAPI import AeroAPI
+imported = time.perf_counter()
+aeroapi = AeroAPI("key")
+constructed = time.perf_counter()
+loaded = [name for name in %r if name in sys.modules]
+aeroapi.flights
+resource = time.perf_counter()
+aeroapi.api_caller.session
+session = time.perf_counter()
+print(json.dumps({
+    "import": imported - start,
+    "construct": constructed - imported,
+    "first resource": resource - constructed,
+    "first session": session - resource,
+    "loaded": loaded,
+}))
+""" % (HEAVY,)
+
+
+def run_once():
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT], capture_output=True, check=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    stages = ("import", "construct", "first resource", "first session")
+    medians = {stage: statistics.median(run[stage] for run in runs) for stage in stages}
+    for stage in stages:
+        print(f"{stage:>15}: {medians[stage] * 1e3:7.2f} ms")
+    loaded = sorted({name for run in runs for name in run["loaded"]})
+    print(f"heavy modules loaded by construction: {', '.join(loaded) or 'none'}")
+
+    startup = (medians["import"] + medians["construct"]) * 1e3
+    if args.budget is not None and startup > args.budget:
+        print(f"import and construction took {startup:.1f} ms > {args.budget} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
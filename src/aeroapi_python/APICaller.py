@@ -1,48 +1,773 @@
+import contextvars
 import logging
-from typing import Any, Dict, Optional
-from urllib.parse import urlencode, urljoin
+import os
+import queue
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+from urllib.parse import urlencode, urljoin, urlsplit
 
-import requests
+from aeroapi_python import Models
+from aeroapi_python.Deadline import DeadlineExceeded, deadline, time_left
+from aeroapi_python.JSONDecoder import Decoder, get_decoder
+from aeroapi_python.Metrics import Hook, RequestInfo
+from aeroapi_python.Models import Model, ModelSpec
+from aeroapi_python.RateLimiter import RateLimiter
+from aeroapi_python.ResponseCache import ResponseCache
+from aeroapi_python.RetryPolicy import RetryPolicy
+from aeroapi_python.SingleFlight import SingleFlight
+from aeroapi_python.StreamingJSON import DEFAULT_CHUNK_SIZE, ArrayStreamParser
+from aeroapi_python.ValidatorCache import ValidatorCache
 
+if TYPE_CHECKING:
+    import requests
 
-class APICaller:
+    from aeroapi_python.Transport import Transport
+
+
+# The error of the last call made in the current context, or None if it
+# succeeded, which tells bulk lookups why a call returned None.
+_last_error: "contextvars.ContextVar[Optional[Exception]]" = contextvars.ContextVar(
+    "aeroapi_last_error", default=None
+)
+
+
+class BulkResult(NamedTuple):
+    """
+    The outcome of one item of a bulk lookup.
+
+    Attributes:
+        item (Any): The input item, such as a flight ID.
+        result (Any): The parsed response, or None if the request failed.
+        error (Exception): The exception raised for this item or, when the
+        result is None, the error of the request that failed; None on success.
+    """
+
+    item: Any
+    result: Any
+    error: Optional[Exception]
+
+
+class BaseAPICaller(ABC):
+    """
+    Configuration and URL building shared by the synchronous and asynchronous
+    API callers.
+
+    Attributes:
+        base_url (str): The base URL for the API.
+        api_key (str): The API key to use for authentication.
+        prefetch_pages (int): The default read-ahead depth used when iterating
+        over pages (0 disables prefetching).
+        rate_limiter (RateLimiter): The rate limiter every request waits on, or
+        None to send requests immediately.
+        retry_policy (RetryPolicy): The policy for retrying failed requests, or
+        None to give up on the first failure.
+        cache (ResponseCache): The cache of GET responses, or None.
+        coalesce (bool): Whether concurrent identical GET requests share one
+        upstream call.
+        validator_cache (ValidatorCache): The store of response validators used
+        to make GET requests conditional, or None.
+        models (bool): Whether resource methods return typed models (see
+        `aeroapi_python.Models`) instead of plain dicts.
+        json_decoder (callable): The function parsing response bodies from
+        bytes, or None to use the HTTP client's `response.json()`.
+        stats (Counter): Counters of client events, such as `retries`.
+
+    Methods:
+        get(endpoint: str, headers: Optional[Dict[str, Any]] = None, model:
+          Optional[ModelSpec] = None, transform: Optional[Callable[[Any], Any]] =
+          None) -> Any:
+            Sends a GET request to the API (implemented by subclasses).
+
+        post(endpoint: str, payload: Dict[str, Any], headers: Optional[Dict[str, Any]]
+          = None) -> Any:
+            Sends a POST request to the API (implemented by subclasses).
+
+        map_concurrent(fn: Callable[[Any], Any], items: Iterable[Any], concurrency:
+          int = 8, ordered: bool = True, timeout: Optional[float] = None) -> Any:
+            Calls `fn` for every item with bounded concurrency (implemented by
+            subclasses).
+
+        _build_path(endpoint: str, sub_path: Optional[str]
+          = None, query: Union[Dict[str, Any], str, None] = None) -> str:
+            Builds a URL path for an API request.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        *,
+        prefetch_pages: int = 0,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        validator_cache: Optional[ValidatorCache] = None,
+        models: bool = False,
+        json_decoder: Union[str, Decoder, None] = None,
+        before_request: Iterable[Hook] = (),
+        after_request: Iterable[Hook] = (),
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+    ) -> None:
+        """
+        Initializes the BaseAPICaller class.
+
+        Args:
+            base_url (str): The base URL for the API.
+            api_key (str): The API key to use for authentication.
+            prefetch_pages (int): Optional, how many pages to fetch ahead of the
+            consumer when iterating over pages (default 0, no prefetching).
+            rate_limiter (RateLimiter): Optional, a rate limiter to wait on before
+            every request. It may be shared with other callers, threads and
+            processes (default None, no limiting).
+            retry_policy (RetryPolicy): Optional, the policy for retrying
+            transient failures (default None, no retries).
+            cache (ResponseCache): Optional, a cache of GET responses keyed on the
+            request URL, with per-endpoint TTLs (default None, no caching).
+            coalesce (bool): Optional, whether concurrent identical GET requests
+            share one upstream call and its parsed result (default False).
+            validator_cache (ValidatorCache): Optional, a store of `ETag` and
+            `Last-Modified` validators; GET requests for known URLs are sent with
+            `If-None-Match`/`If-Modified-Since` and a 304 response returns the
+            remembered body (default None, unconditional requests).
+            models (bool): Optional, whether resource methods return slotted,
+            typed models whose timestamps and nested objects are decoded on
+            first access, instead of plain dicts (default False).
+            json_decoder (str or callable): Optional, how to parse response
+            bodies: `"auto"` for the fastest installed of orjson, msgspec and
+            the standard library, parsing straight from the body bytes; the name
+            of one of those (`"orjson"`, `"msgspec"`, `"json"`); or a callable
+            taking the bytes (default None, `response.json()`).
+            before_request (Iterable[callable]): Optional, functions called with
+            a `RequestInfo` before each call; they may add headers to it.
+            after_request (Iterable[callable]): Optional, functions called with
+            the filled-in `RequestInfo` after each call, cache hits included,
+            such as a `Metrics.MetricsCollector`.
+            connect_timeout (float): Optional, the seconds to wait for a
+            connection to be established (default 10, None to wait forever).
+            read_timeout (float): Optional, the seconds to wait for the server
+            between bytes of a response (default 60, None to wait forever).
+            Both are shortened to the time left when a `Deadline.deadline` or a
+            per-call `timeout` is in effect.
+        """
+        self.base_url = base_url
+        self.api_key = api_key
+        self.prefetch_pages = prefetch_pages
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.cache = cache
+        self.coalesce = coalesce
+        self.validator_cache = validator_cache
+        self.models = models
+        self.json_decoder = None if json_decoder is None else get_decoder(json_decoder)
+        self._json_decoder_spec = json_decoder
+        self.before_request: List[Hook] = list(before_request)
+        self.after_request: List[Hook] = list(after_request)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.stats: "Counter[str]" = Counter()
+        self._stats_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Locks, counters and in-flight calls stay behind; the decoder is
+        # resolved again from its name, as resolved decoders may be closures.
+        state = self.__dict__.copy()
+        for name in ("_stats_lock", "_single_flight", "json_decoder", "stats"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        spec = self._json_decoder_spec
+        self.json_decoder = None if spec is None else get_decoder(spec)
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str, value: int = 1) -> None:
+        """
+        Increments one of the `stats` counters.
+
+        Args:
+            name (str): The counter name.
+            value (int): Optional, the increment (default 1).
+        """
+        with self._stats_lock:
+            self.stats[name] += value
+
+    def add_hooks(
+        self, before: Optional[Hook] = None, after: Optional[Hook] = None
+    ) -> None:
+        """
+        Registers request hooks.
+
+        Args:
+            before (callable): Optional, a function called with a `RequestInfo`
+            before each call.
+            after (callable): Optional, a function called with the filled-in
+            `RequestInfo` after each call.
+        """
+        if before is not None:
+            self.before_request.append(before)
+        if after is not None:
+            self.after_request.append(after)
+
+    def _run_hooks(self, hooks: List[Hook], info: RequestInfo) -> None:
+        for hook in hooks:
+            try:
+                hook(info)
+            except Exception as e:
+                logging.error(e)
+
+    def _start_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, Any]],
+        template: Optional[str] = None,
+    ) -> Tuple[RequestInfo, Optional[Dict[str, Any]]]:
+        """
+        Creates the `RequestInfo` of a call and runs the before-request hooks.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The request URL.
+            headers (dict): The headers given for the request.
+            template (str): Optional, the endpoint template of the call, or None
+            to derive it from `url`.
+
+        Returns:
+            tuple: The `RequestInfo` and the headers to send, including those
+            added by the hooks.
+        """
+        info = RequestInfo(method, url, template, base_url=self.base_url)
+        if self.before_request:
+            info.headers = dict(headers or {})
+            self._run_hooks(self.before_request, info)
+            headers = info.headers or headers
+        return info, headers
+
+    def _finish_request(self, info: RequestInfo) -> None:
+        """
+        Records the total time of a call and runs the after-request hooks.
+
+        Args:
+            info (RequestInfo): The call.
+        """
+        info.finish()
+        _last_error.set(info.error)
+        self._run_hooks(self.after_request, info)
+
+    def _report_cache_hit(self, url: str, template: Optional[str] = None) -> None:
+        """
+        Runs the request hooks for a call answered by the response cache.
+
+        Args:
+            url (str): The request URL.
+            template (str): Optional, the endpoint template of the call.
+        """
+        if self.before_request or self.after_request:
+            info, _ = self._start_request("GET", url, None, template)
+            info.cache_hit = True
+            self._finish_request(info)
+
+    def _report_coalesced(
+        self, url: str, error: Optional[Exception], template: Optional[str] = None
+    ) -> None:
+        """
+        Counts a GET request that shared the result of an identical call in
+        flight, and runs the request hooks for it.
+
+        Args:
+            url (str): The request URL.
+            error (Exception): The error of the shared call, or None.
+            template (str): Optional, the endpoint template of the call.
+        """
+        self._count("coalesced")
+        _last_error.set(error)
+        if self.before_request or self.after_request:
+            info, _ = self._start_request("GET", url, None, template)
+            info.coalesced = True
+            info.error = error
+            self._finish_request(info)
+
+    def _url(self, endpoint: str) -> str:
+        """
+        Resolves an endpoint against the base URL. URLs built by `_build_path`
+        and the endpoint table are already absolute and returned as is.
+
+        Args:
+            endpoint (str): The API endpoint (path or URL).
+
+        Returns:
+            str: The absolute URL.
+        """
+        if endpoint.startswith(self.base_url):
+            return endpoint
+        return urljoin(self.base_url, endpoint)
+
+    def _cache_ttl(
+        self, endpoint: str, headers: Optional[Dict[str, Any]]
+    ) -> Tuple[str, float]:
+        """
+        Resolves the cache key and TTL of a GET request.
+
+        Requests with custom headers are never cached.
+
+        Args:
+            endpoint (str): The API endpoint (path).
+            headers (dict): The headers given for the request.
+
+        Returns:
+            tuple: The cache key (the full URL) and the TTL in seconds; a TTL of 0
+            means the response must not be cached.
+        """
+        if self.cache is None or headers:
+            return endpoint, 0.0
+        url = self._url(endpoint)
+        if url.startswith(self.base_url):
+            path = url[len(self.base_url) :]
+        else:
+            path = urlsplit(url).path.lstrip("/")
+        return url, self.cache.ttl_for(path.split("?", 1)[0])
+
+    def _conditional_headers(
+        self, method: str, url: str, headers: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[Dict[str, Any]], Any]:
+        """
+        Adds the remembered validators of a URL to a GET request's headers.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The request URL.
+            headers (dict): The headers given for the request.
+
+        Returns:
+            tuple: The headers to send and the body to return on a 304 response
+            (None if the request is not conditional).
+        """
+        if self.validator_cache is None or method != "GET":
+            return headers, None
+        entry = self.validator_cache.lookup(url)
+        if entry is None:
+            return headers, None
+        return {**entry[0], **(headers or {})}, entry[1]
+
+    def _store_validators(
+        self, method: str, url: str, response_headers: Any, result: Any
+    ) -> None:
+        """
+        Remembers the validators of a successful GET response.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The request URL.
+            response_headers (Mapping[str, str]): The response headers.
+            result (Any): The parsed response body.
+        """
+        if self.validator_cache is not None and method == "GET":
+            self.validator_cache.store(url, response_headers, result)
+
+    def _decode(self, response: Any) -> Any:
+        """
+        Parses the JSON body of a response with the configured decoder.
+
+        Args:
+            response: A `requests` or `httpx` response.
+
+        Returns:
+            Any: The parsed body.
+
+        Raises:
+            ValueError: If the body is not valid JSON.
+        """
+        if self.json_decoder is None:
+            return response.json()
+        return self.json_decoder(response.content)
+
+    def _request_timeout(
+        self, expires: Optional[float] = None
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Returns the connect and read timeouts of the next attempt, shortened to
+        the time left before the deadline.
+
+        Args:
+            expires (float): Optional, a deadline other than the context's, as a
+            `time.monotonic()` timestamp.
+
+        Returns:
+            tuple: The connect and read timeouts, in seconds or None.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        left = time_left(expires)
+        if left is None:
+            return self.connect_timeout, self.read_timeout
+        if left <= 0:
+            raise DeadlineExceeded("Deadline exceeded before the request was sent")
+        return (
+            left if self.connect_timeout is None else min(self.connect_timeout, left),
+            left if self.read_timeout is None else min(self.read_timeout, left),
+        )
+
+    @staticmethod
+    def _budget(expires: Optional[float]) -> Optional[float]:
+        """
+        Returns the time left before `expires`, as the `timeout` of a call.
+
+        Args:
+            expires (float): A `time.monotonic()` timestamp, or None.
+
+        Returns:
+            float: The seconds left, at least 0, or None without a deadline.
+        """
+        return None if expires is None else max(0.0, expires - time.monotonic())
+
+    def _retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        status: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        expires: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Asks the retry policy how long to wait before retrying a failed attempt.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt that failed, starting at 1.
+            status (int): Optional, the HTTP status received; None if the request
+            failed to connect or timed out.
+            retry_after (str): Optional, the response's `Retry-After` header.
+            expires (float): Optional, a deadline other than the context's, as a
+            `time.monotonic()` timestamp.
+
+        Returns:
+            float: The delay in seconds, or None if the request should not be
+            retried, including when the retry could not start before the deadline.
+        """
+        if self.retry_policy is None:
+            return None
+        if status is None:
+            delay = self.retry_policy.delay_for_error(method, attempt)
+        else:
+            delay = self.retry_policy.delay_for_status(
+                method, attempt, status, retry_after
+            )
+        left = time_left(expires)
+        if delay is not None and left is not None and delay >= left:
+            return None
+        return delay
+
+    def _convert(
+        self,
+        result: Any,
+        model: Optional[ModelSpec],
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Converts a parsed response into models when `models` is enabled, then
+        applies `transform`.
+
+        The cache and validator stores keep the plain parsed responses, so the
+        conversion runs on every call and cached values are never shared as
+        models.
+
+        Args:
+            result (Any): The parsed JSON response.
+            model (ModelSpec): The model of the response, or a mapping of its
+            top-level list fields to the model of their records.
+            transform (callable): Optional, a function applied to the result.
+
+        Returns:
+            Any: The converted response, or None if `result` is None.
+        """
+        if result is None:
+            return None
+        if self.models and model is not None:
+            result = Models.decode(result, model)
+        if transform is not None:
+            result = transform(result)
+        return result
+
+    @abstractmethod
+    def get(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]] = None,
+        model: Optional[ModelSpec] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> Any:
+        """
+        Sends a GET request to the API. Implemented by subclasses.
+        """
+
+    @abstractmethod
+    def post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Sends a POST request to the API. Implemented by subclasses.
+        """
+
+    @abstractmethod
+    def map_concurrent(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Calls `fn` for every item with bounded concurrency. Implemented by
+        subclasses.
+        """
+
+    def _build_path(
+        self,
+        endpoint: str,
+        sub_path: Optional[str] = None,
+        query: Union[Dict[str, Any], str, None] = None,
+    ) -> str:
+        """
+        Builds a URL path for an API request, including optional sub-path and query
+        parameters.
+
+        Args:
+            endpoint (str): The endpoint of the API request.
+            sub_path (str): Optional, a sub-path to append to the endpoint.
+            query (dict or str): Optional, a dictionary of query parameters to
+            include in the URL, or an already URL-encoded query string.
+
+        Returns:
+            str: The complete URL path for the API request.
+        """
+        path = f"{self.base_url}{endpoint}"
+        if sub_path is not None:
+            path += f"/{sub_path}"
+        if isinstance(query, str):
+            if query:
+                path += f"?{query}"
+        elif query:
+            filtered_query = {k: v for k, v in query.items() if v is not None}
+            query_string = urlencode(filtered_query)
+            path += f"?{query_string}"
+        return path
+
+    def _next_page_path(self, page: Dict[str, Any]) -> Optional[str]:
+        """
+        Resolves the `links.next` cursor of a paginated response to a full URL.
+
+        AeroAPI returns the next link relative to the API root (for example
+        `/airports/KLAX/flights?cursor=...`), so it is appended to the base URL
+        rather than joined against the host.
+
+        Args:
+            page (dict): A parsed JSON response.
+
+        Returns:
+            str: The URL of the next page, or None if this was the last page.
+        """
+        next_link = (page.get("links") or {}).get("next")
+        if not next_link:
+            return None
+        if next_link.startswith("/"):
+            return self.base_url.rstrip("/") + next_link
+        return urljoin(self.base_url, next_link)
+
+
+class APICaller(BaseAPICaller):
     """
     A class for making API calls.
 
+    An `APICaller` can be pickled, for example to send it to `multiprocessing`
+    workers: only its configuration is serialized, and the copy starts with
+    empty caches and opens connections of its own. In the child of a fork it
+    transparently replaces the connection pool inherited from the parent.
+
     Attributes:
         base_url (str): The base URL for the API.
-        session (requests.Session): The session object for making requests.
+        transport (Transport): The transport requests are sent through, created
+        on first use unless one was given.
+        session (requests.Session): The transport's session (the calling
+        thread's in thread-safe mode) with a `RequestsTransport`; None with
+        other transports.
 
     Methods:
         _send_request(method: str, endpoint: str, payload: Optional[Dict[str, Any]]
          = None, headers: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
             Sends a request to the API.
 
-        get(endpoint: str, headers: Optional[Dict[str, Any]] = None) ->
-        Optional[Dict[str, Any]]:
+        get(endpoint: str, headers: Optional[Dict[str, Any]] = None, model:
+          Optional[ModelSpec] = None, transform: Optional[Callable[[Any], Any]] =
+          None) -> Optional[Dict[str, Any]]:
             Sends a GET request to the API.
 
         post(endpoint: str, payload: Dict[str, Any], headers: Optional[Dict[str, Any]]
           = None) -> Optional[Dict[str, Any]]:
             Sends a POST request to the API.
 
-        _build_path(endpoint: str, sub_path: Optional[str]
-          = None, query: Optional[Dict[str, Any]] = None) -> str:
-            Builds a URL path for an API request.
+        iter_pages(endpoint: str, headers: Optional[Dict[str, Any]] = None,
+          prefetch: Optional[int] = None, model: Optional[ModelSpec] = None) ->
+          Iterator[Dict[str, Any]]:
+            Lazily yields every page of a paginated endpoint.
+
+        iter_records(endpoint: str, keys: Sequence[str], headers: Optional[Dict[str,
+          Any]] = None, prefetch: Optional[int] = None, model: Optional[Type[Model]]
+          = None) -> Iterator[Dict[str, Any]]:
+            Lazily yields the records of a paginated endpoint across pages.
+
+        stream_records(endpoint: str, keys: Sequence[str], headers: Optional[Dict[str,
+          Any]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, model:
+          Optional[Type[Model]] = None) -> Iterator[Dict[str, Any]]:
+            Yields records while each response body is still downloading.
+
+        map_concurrent(fn: Callable[[Any], Any], items: Iterable[Any], concurrency:
+          int = 8, ordered: bool = True) -> List[BulkResult]:
+            Calls `fn` for every item on a bounded pool of worker threads.
     """
 
-    def __init__(self, base_url: str, api_key: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        transport: Union[str, "Transport", None] = None,
+        thread_safe: bool = False,
+        **options: Any,
+    ) -> None:
         """
         Initializes the APICaller class.
 
         Args:
             base_url (str): The base URL for the API.
             api_key (str): The API key to use for authentication.
+            transport (str or Transport): Optional, the HTTP backend: a
+            `Transport.Transport` such as `RequestsTransport(pool_maxsize=128)`
+            or `HTTPXTransport(http2=True)`, or the name of one with default
+            settings (`"requests"`, `"httpx"` or `"http2"`). Defaults to a
+            `RequestsTransport`, created (with `requests`) by the first request.
+            thread_safe (bool): Optional, whether the caller will be shared by
+            many threads (default False). The default transport then gives each
+            thread a `requests.Session` of its own over one shared connection
+            pool; the API key, headers, hooks, caches and rate limiter stay
+            shared.
+            **options: Optional settings shared with `AsyncAPICaller`; see
+            `BaseAPICaller`.
         """
-        self.base_url = base_url
+        super().__init__(base_url, api_key, **options)
+
+        self.thread_safe = thread_safe
+        self._transport: "Optional[Transport]" = None
+        self._transport_lock = threading.Lock()
+        if transport not in (None, "requests"):
+            self._set_transport(transport)
+        self._single_flight = SingleFlight() if self.coalesce else None
+        _callers.add(self)
+
+    def _set_transport(self, transport: Union[str, "Transport", None]) -> None:
+        """
+        Resolves and configures the transport.
+
+        Args:
+            transport (str or Transport): The transport, or the name of one.
+
+        Raises:
+            ValueError: If `thread_safe` is set and the transport is not
+            thread-safe.
+        """
+        from aeroapi_python.Transport import RequestsTransport, get_transport
 
-        self.session = requests.Session()
-        self.session.headers.update({"x-apikey": api_key})
+        if self.thread_safe and transport in (None, "requests"):
+            transport = RequestsTransport(per_thread=True)
+        resolved = get_transport(transport)
+        if self.thread_safe and not resolved.thread_safe:
+            raise ValueError(
+                f"{type(resolved).__name__} is not thread-safe; use "
+                "RequestsTransport(per_thread=True) or HTTPXTransport"
+            )
+        resolved.headers.update({"x-apikey": self.api_key})
+        self._transport = resolved
+
+    @property
+    def transport(self) -> "Transport":
+        if self._transport is None:
+            with self._transport_lock:
+                if self._transport is None:
+                    self._set_transport(None)
+        return self._transport  # type: ignore[return-value]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        state.pop("_transport_lock", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._transport_lock = threading.Lock()
+        self._single_flight = SingleFlight() if self.coalesce else None
+        _callers.add(self)
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the state a forked child inherits but cannot use: the
+        connection pool, calls in flight in other threads of the parent, and
+        locks those threads may have held.
+        """
+        self._stats_lock = threading.Lock()
+        self._single_flight = SingleFlight() if self.coalesce else None
+        self._transport_lock = threading.Lock()
+        if self._transport is not None:
+            self._transport._after_fork()
+        for part in (
+            self.cache,
+            self.validator_cache,
+            self.rate_limiter,
+            *self.before_request,
+            *self.after_request,
+        ):
+            reinit = getattr(part, "_after_fork", None)
+            if reinit is not None:
+                reinit()
+
+    @property
+    def session(self) -> "Optional[requests.Session]":
+        return getattr(self.transport, "session", None)
+
+    def close(self) -> None:
+        """
+        Closes the transport's pooled connections.
+        """
+        if self._transport is not None:
+            self._transport.close()
 
     def _send_request(
         self,
@@ -50,6 +775,7 @@ class APICaller:
         endpoint: str,
         payload: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, Any]] = None,
+        template: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Sends a request to the API.
@@ -59,24 +785,75 @@ class APICaller:
             endpoint (str): The API endpoint (path).
             payload (dict): Optional, the data to send in the request body.
             headers (dict): Optional, headers to include in the request.
+            template (str): Optional, the endpoint template reported to request
+            hooks, such as `flights/{id}` (default None, derived from the URL).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        url = urljoin(self.base_url, endpoint)
+        url = self._url(endpoint)
+        headers, revalidated = self._conditional_headers(method, url, headers)
+        info, headers = self._start_request(method, url, headers, template)
         try:
-            response = self.session.request(method, url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logging.error(e)
-            return None
-        except ValueError as e:
-            logging.error(e)
-            return None
+            while True:
+                info.attempts += 1
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                try:
+                    response = self.transport.request(
+                        method,
+                        url,
+                        json=payload,
+                        headers=headers,
+                        timeout=self._request_timeout(),
+                    )
+                    info.status = response.status_code
+                    info.ttfb = response.elapsed.total_seconds()
+                    delay = self._retry_delay(
+                        method,
+                        info.attempts,
+                        response.status_code,
+                        response.headers.get("Retry-After"),
+                    )
+                    if delay is None:
+                        if revalidated is not None and response.status_code == 304:
+                            self._count("not_modified")
+                            info.revalidated = True
+                            return revalidated
+                        response.raise_for_status()
+                        info.response_bytes = len(response.content)
+                        parse_start = time.perf_counter()
+                        result = self._decode(response)
+                        info.parse = time.perf_counter() - parse_start
+                        self._store_validators(method, url, response.headers, result)
+                        return result
+                except self.transport.connection_errors as e:
+                    delay = self._retry_delay(method, info.attempts)
+                    if delay is None:
+                        logging.error(e)
+                        info.error = e
+                        return None
+                except self.transport.errors as e:
+                    logging.error(e)
+                    info.error = e
+                    return None
+                except (DeadlineExceeded, ValueError) as e:
+                    logging.error(e)
+                    info.error = e
+                    return None
+                self._count("retries")
+                time.sleep(delay)
+        finally:
+            self._finish_request(info)
 
     def get(
-        self, endpoint: str, headers: Optional[Dict[str, Any]] = None
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]] = None,
+        model: Optional[ModelSpec] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Sends a GET request to the API.
@@ -84,11 +861,50 @@ class APICaller:
         Args:
             endpoint (str): The API endpoint (path).
             headers (dict): Optional, headers to include in the request.
+            model (ModelSpec): Optional, the model to convert the response into
+            when `models` is enabled.
+            transform (callable): Optional, a function applied to a successful
+            response after any model conversion, such as
+            `TrackFrame.from_response`.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None, no budget beyond the connect and
+            read timeouts).
+            template (str): Optional, the endpoint template reported to request
+            hooks, such as `flights/{id}` (default None, derived from the URL).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        return self._send_request("GET", endpoint, headers=headers)
+        if timeout is not None:
+            with deadline(timeout):
+                return self.get(endpoint, headers, model, transform, template=template)
+        key, ttl = self._cache_ttl(endpoint, headers)
+        cache = self.cache if ttl else None
+        if cache is not None:
+            result = cache.get(key)
+            if result is not None:
+                self._report_cache_hit(key, template)
+                return self._convert(result, model, transform)
+        if self._single_flight is None or headers:
+            result = self._send_request(
+                "GET", endpoint, headers=headers, template=template
+            )
+        else:
+            url = self._url(endpoint)
+            (result, error), shared = self._single_flight.do(
+                ("GET", url),
+                lambda: (
+                    self._send_request(
+                        "GET", endpoint, headers=headers, template=template
+                    ),
+                    _last_error.get(),
+                ),
+            )
+            if shared:
+                self._report_coalesced(url, error, template)
+        if cache is not None and result is not None:
+            cache.set(key, result, ttl)
+        return self._convert(result, model, transform)
 
     def post(
         self,
@@ -109,30 +925,356 @@ class APICaller:
         """
         return self._send_request("POST", endpoint, payload, headers)
 
-    def _build_path(
+    def iter_pages(
         self,
         endpoint: str,
-        sub_path: Optional[str] = None,
-        query: Optional[Dict[str, Any]] = None,
-    ) -> str:
+        headers: Optional[Dict[str, Any]] = None,
+        prefetch: Optional[int] = None,
+        model: Optional[ModelSpec] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Builds a URL path for an API request, including optional sub-path and query
-        parameters.
+        Lazily yields every page of a paginated endpoint, following `links.next`.
+
+        With prefetching enabled, a background thread requests the next page as
+        soon as the current page's cursor is known, keeping at most `prefetch`
+        pages buffered ahead of the consumer.
 
         Args:
-            endpoint (str): The endpoint of the API request.
-            sub_path (str): Optional, a sub-path to append to the endpoint.
-            query (dict): Optional, a dictionary of query parameters to include in the
-            URL.
+            endpoint (str): The API endpoint (path) of the first page.
+            headers (dict): Optional, headers to include in each request.
+            prefetch (int): Optional, the read-ahead depth for this iteration
+            (defaults to `prefetch_pages`).
+            model (ModelSpec): Optional, the model to convert each page into when
+            `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds, counted from the first page.
+            template (str): Optional, the endpoint template reported to request
+            hooks for every page (default None, derived from each URL).
+
+        Yields:
+            dict: Each parsed JSON page. Iteration stops after the last page or at
+            the first failed request.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        depth = self.prefetch_pages if prefetch is None else prefetch
+        if depth > 0:
+            yield from self._iter_pages_prefetched(
+                endpoint, headers, depth, model, expires, template
+            )
+            return
+        next_path: Optional[str] = endpoint
+        while next_path:
+            page = self.get(
+                next_path,
+                headers=headers,
+                model=model,
+                timeout=self._budget(expires),
+                template=template,
+            )
+            if page is None:
+                return
+            yield page
+            next_path = self._next_page_path(page)
+
+    def _iter_pages_prefetched(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]],
+        depth: int,
+        model: Optional[ModelSpec] = None,
+        expires: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields pages fetched by a background thread into a bounded queue.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            headers (dict): Headers to include in each request.
+            depth (int): The maximum number of pages buffered ahead of the consumer.
+            model (ModelSpec): Optional, the model to convert each page into.
+            expires (float): Optional, the deadline of the iteration, as a
+            `time.monotonic()` timestamp.
+            template (str): Optional, the endpoint template reported to request
+            hooks.
+
+        Yields:
+            dict: Each parsed JSON page.
+        """
+        pages: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+        stopped = threading.Event()
+        done = object()
+        failure: Optional[Exception] = None
+
+        def put(item: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            nonlocal failure
+            next_path: Optional[str] = endpoint
+            try:
+                while next_path:
+                    page = self.get(
+                        next_path,
+                        headers=headers,
+                        model=model,
+                        timeout=self._budget(expires),
+                        template=template,
+                    )
+                    if page is None:
+                        failure = _last_error.get()
+                        break
+                    next_path = self._next_page_path(page)
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+
+        worker = threading.Thread(
+            target=contextvars.copy_context().run, args=(produce,), daemon=True
+        )
+        worker.start()
+        try:
+            while True:
+                item = pages.get()
+                if item is done:
+                    # Leave the error of a failed page in the consumer's context,
+                    # as the unbuffered iteration does.
+                    _last_error.set(failure)
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
+    def iter_records(
+        self,
+        endpoint: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, Any]] = None,
+        prefetch: Optional[int] = None,
+        model: Optional[Type[Model]] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields the records of a paginated endpoint across pages.
+
+        Only one page is held in memory at a time, and the first records are
+        yielded as soon as the first page arrives.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            keys (Sequence[str]): The top-level list fields to yield records from,
+            in order, for each page.
+            headers (dict): Optional, headers to include in each request.
+            prefetch (int): Optional, the read-ahead depth for this iteration
+            (defaults to `prefetch_pages`).
+            model (Type[Model]): Optional, the model to convert each record into
+            when `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds, counted from the first page.
+            template (str): Optional, the endpoint template reported to request
+            hooks for every page (default None, derived from each URL).
+
+        Yields:
+            dict: Each record of the listed fields.
+        """
+        spec = None if model is None else {key: model for key in keys}
+        for page in self.iter_pages(
+            endpoint,
+            headers=headers,
+            prefetch=prefetch,
+            model=spec,
+            timeout=timeout,
+            template=template,
+        ):
+            for key in keys:
+                yield from page.get(key) or ()
+
+    def stream_records(
+        self,
+        endpoint: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model: Optional[Type[Model]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of a paginated endpoint while each response body is
+        still downloading.
+
+        The body is read in chunks and parsed incrementally, so the first
+        records are available before the download finishes and memory stays
+        bounded however large a page (`max_pages`) is. Requests wait on the rate
+        limiter and are retried until the first record of a page has been
+        yielded; streamed responses bypass the response and validator caches.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            keys (Sequence[str]): The top-level list fields to yield records from;
+            records are yielded in the order they appear in each body.
+            headers (dict): Optional, headers to include in each request.
+            chunk_size (int): Optional, the number of bytes read at a time
+            (default 64 KiB).
+            model (Type[Model]): Optional, the model to convert each record into
+            when `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds; it bounds connecting and each read, and no page is requested
+            once it is spent.
+
+        Yields:
+            dict: Each record of the listed fields. Iteration stops after the last
+            page, or when a request fails before its body starts downloading.
+
+        Raises:
+            Exception: The error that cut a response body short, such as a
+            dropped connection once retries are exhausted, or `ValueError` if
+            the body is malformed or truncated; the records yielded before it
+            are valid, but the listing is incomplete.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        next_path: Optional[str] = endpoint
+        while next_path:
+            url = self._url(next_path)
+            started = False
+            attempt = 0
+            while True:
+                attempt += 1
+                reading = False
+                # A retried attempt reads the body from the start again.
+                parser = ArrayStreamParser(keys)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                try:
+                    with closing(
+                        self.transport.request(
+                            "GET",
+                            url,
+                            headers=headers,
+                            timeout=self._request_timeout(expires),
+                            stream=True,
+                        )
+                    ) as response:
+                        delay = self._retry_delay(
+                            "GET",
+                            attempt,
+                            response.status_code,
+                            response.headers.get("Retry-After"),
+                            expires,
+                        )
+                        if delay is None:
+                            response.raise_for_status()
+                            reading = True
+                            for chunk in self.transport.iter_bytes(
+                                response, chunk_size
+                            ):
+                                for _, record in parser.feed(chunk):
+                                    started = True
+                                    yield self._convert(record, model)
+                            for _, record in parser.close():
+                                yield self._convert(record, model)
+                            break
+                except self.transport.connection_errors as e:
+                    if started:
+                        delay = None
+                    else:
+                        delay = self._retry_delay("GET", attempt, expires=expires)
+                    if delay is None:
+                        logging.error(e)
+                        if reading:
+                            raise
+                        return
+                except self.transport.errors as e:
+                    logging.error(e)
+                    if reading:
+                        raise
+                    return
+                except (DeadlineExceeded, ValueError) as e:
+                    logging.error(e)
+                    if reading:
+                        raise
+                    return
+                self._count("retries")
+                time.sleep(delay)
+            next_path = self._next_page_path(parser.rest)
+
+    def map_concurrent(
+        self,
+        fn: Callable[[Any], Any],
+        items: Iterable[Any],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[BulkResult]:
+        """
+        Calls `fn` for every item on a bounded pool of worker threads.
+
+        Requests still go through the rate limiter, retry policy and caches, and
+        each worker runs in a copy of the caller's context, so an enclosing
+        `Deadline.deadline` applies to them.
+
+        Args:
+            fn (callable): The function to call with each item, typically a
+            resource method such as `Flights.get_flight`.
+            items (Iterable[Any]): The items to look up.
+            concurrency (int): Optional, the maximum number of calls in flight
+            (default 8).
+            ordered (bool): Optional, whether to return results in input order
+            rather than completion order (default True).
+            timeout (float): Optional, the time budget of all the calls together,
+            in seconds; calls not sent in time fail.
 
         Returns:
-            str: The complete URL path for the API request.
+            List[BulkResult]: One result per item.
         """
-        path = f"{self.base_url}{endpoint}"
-        if sub_path is not None:
-            path += f"/{sub_path}"
-        if query:
-            filtered_query = {k: v for k, v in query.items() if v is not None}
-            query_string = urlencode(filtered_query)
-            path += f"?{query_string}"
-        return path
+        if timeout is not None:
+            with deadline(timeout):
+                return self.map_concurrent(fn, items, concurrency, ordered)
+        items = list(items)
+
+        def call(item: Any) -> BulkResult:
+            _last_error.set(None)
+            try:
+                result = fn(item)
+            except Exception as e:
+                return BulkResult(item, None, e)
+            return BulkResult(
+                item, result, None if result is not None else _last_error.get()
+            )
+
+        workers = max(1, min(concurrency, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(contextvars.copy_context().run, call, item)
+                for item in items
+            ]
+            if not ordered:
+                futures = list(as_completed(futures))
+            return [future.result() for future in futures]
+
+
+# The callers to repair in the child of a fork, such as a worker of a
+# fork-based `multiprocessing` pool.
+_callers: "weakref.WeakSet[APICaller]" = weakref.WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    for caller in list(_callers):
+        caller._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
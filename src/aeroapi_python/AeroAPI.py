@@ -1,15 +1,23 @@
-from aeroapi_python.Airports import Airports
-from aeroapi_python.APICaller import APICaller
-from aeroapi_python.Flights import Flights
-from aeroapi_python.History import History
-from aeroapi_python.Miscellaneous import Miscellaneous
-from aeroapi_python.Operators import Operators
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional
+
+from aeroapi_python.APICaller import APICaller, BulkResult
+
+if TYPE_CHECKING:
+    from aeroapi_python.Airports import Airports
+    from aeroapi_python.Flights import Flights
+    from aeroapi_python.History import History
+    from aeroapi_python.Miscellaneous import Miscellaneous
+    from aeroapi_python.Operators import Operators
 
 
 class AeroAPI:
     """
     A class for interacting with the FlightAware AeroAPI.
 
+    The resource objects are created, and their modules imported, on first
+    access.
+
     Attributes:
         base_url (str): The base URL for the AeroAPI.
         api_key (str): The API key for the AeroAPI.
@@ -21,22 +29,80 @@ class AeroAPI:
         flights (Flights): An instance of the `Flights` class.
 
     Methods:
-        __init__(self, api_key: str) -> None:
+        __init__(self, api_key: str, **options: Any) -> None:
             Initializes an `RWYAeroAPI` instance.
+
+        process_map(self, fn: Callable[[AeroAPI, Any], Any], items: Iterable[Any], processes: Optional[int] = None, ordered: bool = True) -> List[BulkResult]:
+            Calls `fn(aeroapi, item)` for every item on a pool of processes.
     """
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, **options: Any) -> None:
         """
         Initializes an `RWYAeroAPI` instance.
 
         Args:
             api_key (str): The API key for the AeroAPI.
+            **options: Optional `APICaller` settings, such as `prefetch_pages`,
+            `rate_limiter` or `transport` (for example `"http2"`); see
+            `APICaller` and `BaseAPICaller`.
         """
         self.base_url = "https://aeroapi.flightaware.com/aeroapi/"
         self.api_key = api_key
-        self.api_caller = APICaller(self.base_url, self.api_key)
-        self.airports = Airports(self.api_caller)
-        self.operators = Operators(self.api_caller)
-        self.history = History(self.api_caller)
-        self.miscellaneous = Miscellaneous(self.api_caller)
-        self.flights = Flights(self.api_caller)
+        self.api_caller = APICaller(self.base_url, self.api_key, **options)
+
+    @cached_property
+    def airports(self) -> "Airports":
+        from aeroapi_python.Airports import Airports
+
+        return Airports(self.api_caller)
+
+    @cached_property
+    def operators(self) -> "Operators":
+        from aeroapi_python.Operators import Operators
+
+        return Operators(self.api_caller)
+
+    @cached_property
+    def history(self) -> "History":
+        from aeroapi_python.History import History
+
+        return History(self.api_caller)
+
+    @cached_property
+    def miscellaneous(self) -> "Miscellaneous":
+        from aeroapi_python.Miscellaneous import Miscellaneous
+
+        return Miscellaneous(self.api_caller)
+
+    @cached_property
+    def flights(self) -> "Flights":
+        from aeroapi_python.Flights import Flights
+
+        return Flights(self.api_caller)
+
+    def process_map(
+        self,
+        fn: Callable[["AeroAPI", Any], Any],
+        items: Iterable[Any],
+        processes: Optional[int] = None,
+        ordered: bool = True,
+    ) -> List[BulkResult]:
+        """
+        Calls `fn(aeroapi, item)` for every item on a pool of worker processes,
+        each with its own copy of this client. See `ProcessPool.process_map`.
+
+        Args:
+            fn (callable): A picklable (module-level) function taking a client
+            and an item.
+            items (Iterable[Any]): The items to process.
+            processes (int): Optional, the number of worker processes (defaults
+            to the number of CPUs).
+            ordered (bool): Optional, whether to return results in input order
+            rather than completion order (default True).
+
+        Returns:
+            List[BulkResult]: One `(item, result, error)` entry per item.
+        """
+        from aeroapi_python.ProcessPool import process_map
+
+        return process_map(fn, items, self, processes=processes, ordered=ordered)
@@ -1,54 +1,93 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 
-from aeroapi_python.APICaller import APICaller
+from aeroapi_python.APICaller import BaseAPICaller
+from aeroapi_python.Endpoints import ENDPOINTS
 
 
 class Airports:
     """
     An Airport class for interacting with the FlightAware AeroAPI.
+
+    Every method that calls the API also takes an optional `timeout`, the time
+    budget of the call (or of the whole iteration or bulk lookup) in seconds.
     """
 
-    def __init__(self, api_caller: APICaller) -> None:
+    def __init__(self, api_caller: BaseAPICaller) -> None:
         """
         Initializes an `Airports` instance.
 
         Args:
-            api_caller (Any): An instance of the `APICaller` class.
+            api_caller (BaseAPICaller): An instance of `APICaller` or `AsyncAPICaller`.
         """
         self.api_caller = api_caller
         self.endpoint = "airports"
 
     def get_airports(
-        self, max_pages: int = 1, cursor: Optional[str] = None
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a list of all airports.
         Args:
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"max_pages": max_pages, "cursor": cursor}
-        path = self.api_caller._build_path(self.endpoint, query=query)
-        return self.api_caller.get(path)
+        return ENDPOINTS["airports"].get(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
+        )
 
-    def get_airport(self, airport_id: str) -> Optional[Dict[str, Any]]:
+    def iter_airports(
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields all airports, following pagination cursors.
+        Args:
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `airports` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["airports"].iter_records(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
+        )
+
+    def get_airport(
+        self, airport_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about a specific airport.
 
         Args:
             airport_id (str): The airport identifier (ICAO code).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path(self.endpoint, airport_id)
-        return self.api_caller.get(path)
+        return ENDPOINTS["airports/{airport_id}"].get(
+            self.api_caller, airport_id, timeout=timeout
+        )
 
     def get_canonical(
-        self, airport_id: str, code: Optional[str] = None
+        self,
+        airport_id: str,
+        code: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the canonical information for a specific airport.
@@ -56,18 +95,21 @@ class Airports:
         Args:
             airport_id (str): The airport identifier (ICAO code).
             code (str): Optional, the type of identifier to use in the response.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"id_type": code}
-        path = self.api_caller._build_path(
-            self.endpoint, airport_id + "/canonical", query
+        return ENDPOINTS["airports/{airport_id}/canonical"].get(
+            self.api_caller, airport_id, id_type=code, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def get_airports_with_delays(
-        self, max_pages: int = 1, cursor: Optional[str] = None
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a list of airports with delays.
@@ -75,16 +117,38 @@ class Airports:
         Args:
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = "delays"
-        query = {"max_pages": max_pages, "cursor": cursor}
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/delays"].get(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
+        )
+
+    def iter_airports_with_delays(
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields airports with delays, following pagination cursors.
+
+        Args:
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `delays` list. With an `AsyncAPICaller` this is an
+            async generator.
+        """
+        return ENDPOINTS["airports/delays"].iter_records(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def all_flights(
         self,
@@ -95,6 +159,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about all flights for a specific airport.
@@ -107,36 +172,125 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/flights"
-        query = {
-            "airline": airline,
-            "type": flight_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{airport_id}/flights"].get(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_all_flights(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields all flights for a specific airport, following pagination cursors.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `arrivals`, `departures`, `scheduled_arrivals` and
+            `scheduled_departures` lists, in that order for each page. With an
+            `AsyncAPICaller` this is an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/flights"].iter_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def stream_all_flights(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields all flights for a specific airport while each response is still
+        downloading, keeping memory bounded for large `max_pages` values.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `arrivals`, `departures`, `scheduled_arrivals` and
+            `scheduled_departures` lists, in the order they appear in each response.
+            With an `AsyncAPICaller` this is an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/flights"].stream_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
-    def get_counts(self, airport_id: str) -> Optional[Dict[str, Any]]:
+    def get_counts(
+        self, airport_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the flight counts for a specific airport.
 
         Args:
             airport_id (str): The airport identifier (ICAO code).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, airport_id + "/flights/counts")
+        return ENDPOINTS["airports/{airport_id}/flights/counts"].get(
+            self.api_caller, airport_id, timeout=timeout
         )
 
     def recent_arrivals(
@@ -148,6 +302,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about recent arrivals for a specific airport.
@@ -160,27 +315,65 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/flights/arrivals"
+        return ENDPOINTS["airports/{airport_id}/flights/arrivals"].get(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_recent_arrivals(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields recent arrivals for a specific airport, following pagination
+        cursors.
 
-        query = {
-            "airline": airline,
-            "type": flight_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
 
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        Yields:
+            dict: Each record of the `arrivals` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/flights/arrivals"].iter_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        response = self.api_caller.get(path)  # Make API call
-
-        return response  # Return parsed JSON response or None if the request failed
 
     def recent_departures(
         self,
@@ -191,6 +384,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about recent departures for a specific airport.
@@ -203,27 +397,65 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/flights/departures"
+        return ENDPOINTS["airports/{airport_id}/flights/departures"].get(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
 
-        query = {
-            "airline": airline,
-            "type": flight_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
+    def iter_recent_departures(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields recent departures for a specific airport, following pagination
+        cursors.
 
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
-        )
-        response = self.api_caller.get(path)  # Make API call
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
 
-        return response  # Return parsed JSON response or None if the request failed
+        Yields:
+            dict: Each record of the `departures` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/flights/departures"].iter_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
 
     def scheduled_arrivals(
         self,
@@ -234,6 +466,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about scheduled arrivals for a specific airport.
@@ -246,27 +479,67 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/flights/scheduled_arrivals"
+        return ENDPOINTS["airports/{airport_id}/flights/scheduled_arrivals"].get(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
 
-        query = {
-            "airline": airline,
-            "type": flight_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
+    def iter_scheduled_arrivals(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields scheduled arrivals for a specific airport, following pagination
+        cursors.
 
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
-        )
-        response = self.api_caller.get(path)  # Make API call
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
 
-        return response  # Return parsed JSON response or None if the request failed
+        Yields:
+            dict: Each record of the `scheduled_arrivals` list. With an `AsyncAPICaller`
+            this is an async generator.
+        """
+        return ENDPOINTS[
+            "airports/{airport_id}/flights/scheduled_arrivals"
+        ].iter_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
 
     def scheduled_departures(
         self,
@@ -277,6 +550,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about scheduled departures for a specific airport.
@@ -289,23 +563,67 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/flights/scheduled_departures"
-        query = {
-            "airline": airline,
-            "type": flight_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{airport_id}/flights/scheduled_departures"].get(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_scheduled_departures(
+        self,
+        airport_id: str,
+        airline: Optional[str] = None,
+        flight_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields scheduled departures for a specific airport, following pagination
+        cursors.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            airline (str): Optional, the airline to filter by.
+            flight_type (str): Optional, the type of flight to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `scheduled_departures` list. With an
+            `AsyncAPICaller` this is an async generator.
+        """
+        return ENDPOINTS[
+            "airports/{airport_id}/flights/scheduled_departures"
+        ].iter_records(
+            self.api_caller,
+            airport_id,
+            airline=airline,
+            type=flight_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def get_nearby_airports(
         self,
@@ -314,6 +632,7 @@ class Airports:
         only_iap: bool = False,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about nearby airports for a specific airport.
@@ -325,21 +644,58 @@ class Airports:
             approach procedures.
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/nearby"
-        query = {
-            "radius": radius,
-            "only_iap": only_iap,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{airport_id}/nearby"].get(
+            self.api_caller,
+            airport_id,
+            radius=radius,
+            only_iap=only_iap,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_nearby_airports(
+        self,
+        airport_id: str,
+        radius: int,
+        only_iap: bool = False,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields nearby airports for a specific airport, following pagination
+        cursors.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            radius (int): The radius (in kilometers) to search for nearby airports.
+            only_iap (bool): Optional, whether to only include airports with instrument
+            approach procedures.
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `airports` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/nearby"].iter_records(
+            self.api_caller,
+            airport_id,
+            radius=radius,
+            only_iap=only_iap,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def get_flights_between_airports(
         self,
@@ -351,6 +707,7 @@ class Airports:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about flights between two airports.
@@ -364,29 +721,75 @@ class Airports:
             end (int): Optional, the end timestamp for the flight data (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{origin_id}/flights/to/{dest_id}"
-        query = {
-            "type": flight_type,
-            "connection": connection,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{origin_id}/flights/to/{dest_id}"].get(
+            self.api_caller,
+            origin_id,
+            dest_id,
+            type=flight_type,
+            connection=connection,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_flights_between_airports(
+        self,
+        origin_id: str,
+        dest_id: str,
+        flight_type: Optional[str] = None,
+        connection: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields flights between two airports, following pagination cursors.
+
+        Args:
+            origin_id (str): The origin airport identifier (ICAO code).
+            dest_id (str): The destination airport identifier (ICAO code).
+            flight_type (str): Optional, the type of flight to filter by.
+            connection (str): Optional, the connection type to filter by.
+            start (int): Optional, the start timestamp for the flight data (Unix time).
+            end (int): Optional, the end timestamp for the flight data (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `flights` list. With an `AsyncAPICaller` this is an
+            async generator.
+        """
+        return ENDPOINTS["airports/{origin_id}/flights/to/{dest_id}"].iter_records(
+            self.api_caller,
+            origin_id,
+            dest_id,
+            type=flight_type,
+            connection=connection,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def get_airport_weather_forecast(
         self,
         airport_id: str,
         timestamp: Optional[int] = None,
         return_nearby_weather: bool = False,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the weather forecast for a specific airport.
@@ -397,19 +800,19 @@ class Airports:
             weather forecast (Unix time).
             return_nearby_weather (bool): Optional, whether to include nearby weather
             observations in the response.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/weather/forecast"
-        query = {
-            "timestamp": timestamp,
-            "return_nearby_weather": return_nearby_weather,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{airport_id}/weather/forecast"].get(
+            self.api_caller,
+            airport_id,
+            timestamp=timestamp,
+            return_nearby_weather=return_nearby_weather,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def get_airport_weather_conditions(
         self,
@@ -419,6 +822,7 @@ class Airports:
         timestamp: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the weather conditions for a specific airport.
@@ -433,19 +837,61 @@ class Airports:
             weather conditions (in Unix time).
             max_pages (int): Optional, the maximum number of pages to retrieve.
             cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{airport_id}/weather/observations"
-        query = {
-            "temperature_units": temperature_units,
-            "return_nearby_weather": return_nearby_weather,
-            "timestamp": timestamp,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["airports/{airport_id}/weather/observations"].get(
+            self.api_caller,
+            airport_id,
+            temperature_units=temperature_units,
+            return_nearby_weather=return_nearby_weather,
+            timestamp=timestamp,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_airport_weather_conditions(
+        self,
+        airport_id: str,
+        temperature_units: str = "Celsius",
+        return_nearby_weather: bool = False,
+        timestamp: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields the weather conditions for a specific airport, following
+        pagination cursors.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+            temperature_units (str): Optional, the temperature units to use in the
+            response ('Celsius' or 'Fahrenheit').
+            return_nearby_weather (bool): Optional, whether to include nearby weather
+            observations in the response.
+            timestamp (int): Optional, the timestamp for the
+            weather conditions (in Unix time).
+            max_pages (int): Optional, the maximum number of pages to retrieve.
+            cursor (str): Optional, a cursor for paginating through the results.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `conditions` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["airports/{airport_id}/weather/observations"].iter_records(
+            self.api_caller,
+            airport_id,
+            temperature_units=temperature_units,
+            return_nearby_weather=return_nearby_weather,
+            timestamp=timestamp,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
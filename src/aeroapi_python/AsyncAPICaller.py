@@ -0,0 +1,622 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from aeroapi_python.APICaller import BaseAPICaller, BulkResult, _last_error
+from aeroapi_python.Deadline import DeadlineExceeded, deadline
+from aeroapi_python.Metrics import RequestInfo
+from aeroapi_python.Models import Model, ModelSpec
+from aeroapi_python.SingleFlight import AsyncSingleFlight
+from aeroapi_python.StreamingJSON import DEFAULT_CHUNK_SIZE, ArrayStreamParser
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - exercised only without the extra
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncAPICaller(BaseAPICaller):
+    """
+    A class for making API calls from asyncio code.
+
+    All requests made through one instance share a single pooled
+    `httpx.AsyncClient`, so many requests can be in flight on one event loop
+    without opening a connection per call.
+
+    Attributes:
+        base_url (str): The base URL for the API.
+        client (httpx.AsyncClient): The pooled client used for making requests.
+
+    Methods:
+        _send_request(method: str, endpoint: str, payload: Optional[Dict[str, Any]]
+         = None, headers: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+            Sends a request to the API.
+
+        get(endpoint: str, headers: Optional[Dict[str, Any]] = None, model:
+          Optional[ModelSpec] = None, transform: Optional[Callable[[Any], Any]] =
+          None) -> Optional[Dict[str, Any]]:
+            Sends a GET request to the API.
+
+        post(endpoint: str, payload: Dict[str, Any], headers: Optional[Dict[str, Any]]
+          = None) -> Optional[Dict[str, Any]]:
+            Sends a POST request to the API.
+
+        iter_pages(endpoint: str, headers: Optional[Dict[str, Any]] = None,
+          prefetch: Optional[int] = None, model: Optional[ModelSpec] = None) ->
+          AsyncIterator[Dict[str, Any]]:
+            Lazily yields every page of a paginated endpoint.
+
+        iter_records(endpoint: str, keys: Sequence[str], headers: Optional[Dict[str,
+          Any]] = None, prefetch: Optional[int] = None, model: Optional[Type[Model]]
+          = None) -> AsyncIterator[Dict[str, Any]]:
+            Lazily yields the records of a paginated endpoint across pages.
+
+        stream_records(endpoint: str, keys: Sequence[str], headers: Optional[Dict[str,
+          Any]] = None, chunk_size: int = DEFAULT_CHUNK_SIZE, model:
+          Optional[Type[Model]] = None) -> AsyncIterator[Dict[str, Any]]:
+            Yields records while each response body is still downloading.
+
+        map_concurrent(fn: Callable[[Any], Awaitable[Any]], items: Iterable[Any],
+          concurrency: int = 8, ordered: bool = True) -> List[BulkResult]:
+            Awaits `fn` for every item with a bounded number in flight.
+
+        aclose() -> None:
+            Closes the underlying connection pool.
+    """
+
+    def __init__(
+        self, base_url: str, api_key: str, max_connections: int = 100, **options: Any
+    ) -> None:
+        """
+        Initializes the AsyncAPICaller class.
+
+        Args:
+            base_url (str): The base URL for the API.
+            api_key (str): The API key to use for authentication.
+            max_connections (int): Optional, the maximum number of pooled
+            connections (default 100).
+            **options: Optional settings shared with `APICaller`; see
+            `BaseAPICaller`.
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncAPICaller requires httpx; install it with "
+                "`pip install aeroapi-python[async]`"
+            )
+        super().__init__(base_url, api_key, **options)
+
+        self.client = httpx.AsyncClient(
+            headers={"x-apikey": api_key},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._single_flight = AsyncSingleFlight() if self.coalesce else None
+
+    @staticmethod
+    def _trace(info: RequestInfo) -> Callable[[str, Any], Awaitable[None]]:
+        """
+        Returns an httpx trace callback that records connection and
+        time-to-first-byte timings.
+
+        Args:
+            info (RequestInfo): The call to record the timings on.
+
+        Returns:
+            callable: The callback, for the `trace` request extension.
+        """
+        marks: Dict[str, float] = {}
+
+        async def trace(event: str, _: Any) -> None:
+            now = time.perf_counter()
+            if event == "connection.connect_tcp.started":
+                marks["connect"] = now
+            elif event in (
+                "connection.connect_tcp.complete",
+                "connection.start_tls.complete",
+            ):
+                info.connect = now - marks.get("connect", now)
+            elif event.endswith(".send_request_headers.started"):
+                marks["send"] = now
+            elif event.endswith(".receive_response_headers.complete"):
+                info.ttfb = now - marks.get("send", now)
+
+        return trace
+
+    def _httpx_timeout(self, expires: Optional[float] = None) -> "httpx.Timeout":
+        """
+        Returns the timeouts of the next attempt as an `httpx.Timeout`.
+
+        Args:
+            expires (float): Optional, a deadline other than the context's, as a
+            `time.monotonic()` timestamp.
+
+        Returns:
+            httpx.Timeout: The connect (and pool) and read (and write) timeouts.
+
+        Raises:
+            DeadlineExceeded: If the deadline has passed.
+        """
+        connect, read = self._request_timeout(expires)
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        template: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sends a request to the API.
+
+        Args:
+            method (str): The HTTP method to use for the request.
+            endpoint (str): The API endpoint (path).
+            payload (dict): Optional, the data to send in the request body.
+            headers (dict): Optional, headers to include in the request.
+            template (str): Optional, the endpoint template reported to request
+            hooks, such as `flights/{id}` (default None, derived from the URL).
+
+        Returns:
+            dict: The parsed JSON response, or None if the request failed.
+        """
+        url = self._url(endpoint)
+        headers, revalidated = self._conditional_headers(method, url, headers)
+        info, headers = self._start_request(method, url, headers, template)
+        extensions = {"trace": self._trace(info)} if self.after_request else None
+        try:
+            while True:
+                info.attempts += 1
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                try:
+                    response = await self.client.request(
+                        method,
+                        url,
+                        json=payload,
+                        headers=headers,
+                        timeout=self._httpx_timeout(),
+                        extensions=extensions,
+                    )
+                    info.status = response.status_code
+                    delay = self._retry_delay(
+                        method,
+                        info.attempts,
+                        response.status_code,
+                        response.headers.get("Retry-After"),
+                    )
+                    if delay is None:
+                        if revalidated is not None and response.status_code == 304:
+                            self._count("not_modified")
+                            info.revalidated = True
+                            return revalidated
+                        response.raise_for_status()
+                        info.response_bytes = len(response.content)
+                        parse_start = time.perf_counter()
+                        result = self._decode(response)
+                        info.parse = time.perf_counter() - parse_start
+                        self._store_validators(method, url, response.headers, result)
+                        return result
+                except httpx.TransportError as e:
+                    delay = self._retry_delay(method, info.attempts)
+                    if delay is None:
+                        logging.error(e)
+                        info.error = e
+                        return None
+                except httpx.HTTPError as e:
+                    logging.error(e)
+                    info.error = e
+                    return None
+                except (DeadlineExceeded, ValueError) as e:
+                    logging.error(e)
+                    info.error = e
+                    return None
+                self._count("retries")
+                await asyncio.sleep(delay)
+        finally:
+            self._finish_request(info)
+
+    async def get(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]] = None,
+        model: Optional[ModelSpec] = None,
+        transform: Optional[Callable[[Any], Any]] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sends a GET request to the API.
+
+        Args:
+            endpoint (str): The API endpoint (path).
+            headers (dict): Optional, headers to include in the request.
+            model (ModelSpec): Optional, the model to convert the response into
+            when `models` is enabled.
+            transform (callable): Optional, a function applied to a successful
+            response after any model conversion, such as
+            `TrackFrame.from_response`.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None, no budget beyond the connect and
+            read timeouts).
+            template (str): Optional, the endpoint template reported to request
+            hooks, such as `flights/{id}` (default None, derived from the URL).
+
+        Returns:
+            dict: The parsed JSON response, or None if the request failed.
+        """
+        if timeout is not None:
+            with deadline(timeout):
+                return await self.get(
+                    endpoint, headers, model, transform, template=template
+                )
+        key, ttl = self._cache_ttl(endpoint, headers)
+        cache = self.cache if ttl else None
+        if cache is not None:
+            result = cache.get(key)
+            if result is not None:
+                self._report_cache_hit(key, template)
+                return self._convert(result, model, transform)
+        if self._single_flight is None or headers:
+            result = await self._send_request(
+                "GET", endpoint, headers=headers, template=template
+            )
+        else:
+
+            async def send() -> Tuple[Any, Optional[Exception]]:
+                result = await self._send_request(
+                    "GET", endpoint, headers=headers, template=template
+                )
+                return result, _last_error.get()
+
+            url = self._url(endpoint)
+            (result, error), shared = await self._single_flight.do(("GET", url), send)
+            if shared:
+                self._report_coalesced(url, error, template)
+        if cache is not None and result is not None:
+            cache.set(key, result, ttl)
+        return self._convert(result, model, transform)
+
+    async def post(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sends a POST request to the API.
+
+        Args:
+            endpoint (str): The API endpoint (path).
+            payload (dict): The data to send in the request body.
+            headers (dict): Optional, headers to include in the request.
+
+        Returns:
+            dict: The parsed JSON response, or None if the request failed.
+        """
+        return await self._send_request("POST", endpoint, payload, headers)
+
+    async def iter_pages(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]] = None,
+        prefetch: Optional[int] = None,
+        model: Optional[ModelSpec] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily yields every page of a paginated endpoint, following `links.next`.
+
+        With prefetching enabled, a background task requests the next page as
+        soon as the current page's cursor is known, keeping at most `prefetch`
+        pages buffered ahead of the consumer.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            headers (dict): Optional, headers to include in each request.
+            prefetch (int): Optional, the read-ahead depth for this iteration
+            (defaults to `prefetch_pages`).
+            model (ModelSpec): Optional, the model to convert each page into when
+            `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds, counted from the first page.
+            template (str): Optional, the endpoint template reported to request
+            hooks for every page (default None, derived from each URL).
+
+        Yields:
+            dict: Each parsed JSON page. Iteration stops after the last page or at
+            the first failed request.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        depth = self.prefetch_pages if prefetch is None else prefetch
+        if depth > 0:
+            async for prefetched in self._iter_pages_prefetched(
+                endpoint, headers, depth, model, expires, template
+            ):
+                yield prefetched
+            return
+        next_path: Optional[str] = endpoint
+        while next_path:
+            page = await self.get(
+                next_path,
+                headers=headers,
+                model=model,
+                timeout=self._budget(expires),
+                template=template,
+            )
+            if page is None:
+                return
+            yield page
+            next_path = self._next_page_path(page)
+
+    async def _iter_pages_prefetched(
+        self,
+        endpoint: str,
+        headers: Optional[Dict[str, Any]],
+        depth: int,
+        model: Optional[ModelSpec] = None,
+        expires: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields pages fetched by a background task into a bounded queue.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            headers (dict): Headers to include in each request.
+            depth (int): The maximum number of pages buffered ahead of the consumer.
+            model (ModelSpec): Optional, the model to convert each page into.
+            expires (float): Optional, the deadline of the iteration, as a
+            `time.monotonic()` timestamp.
+            template (str): Optional, the endpoint template reported to request
+            hooks.
+
+        Yields:
+            dict: Each parsed JSON page.
+        """
+        pages: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=depth)
+        done = object()
+        failure: Optional[Exception] = None
+
+        async def produce() -> None:
+            nonlocal failure
+            next_path: Optional[str] = endpoint
+            try:
+                while next_path:
+                    page = await self.get(
+                        next_path,
+                        headers=headers,
+                        model=model,
+                        timeout=self._budget(expires),
+                        template=template,
+                    )
+                    if page is None:
+                        failure = _last_error.get()
+                        break
+                    next_path = self._next_page_path(page)
+                    await pages.put(page)
+            except Exception as e:
+                await pages.put(e)
+                return
+            await pages.put(done)
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while True:
+                item = await pages.get()
+                if item is done:
+                    # Leave the error of a failed page in the consumer's context,
+                    # as the unbuffered iteration does.
+                    _last_error.set(failure)
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def iter_records(
+        self,
+        endpoint: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, Any]] = None,
+        prefetch: Optional[int] = None,
+        model: Optional[Type[Model]] = None,
+        timeout: Optional[float] = None,
+        template: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Lazily yields the records of a paginated endpoint across pages.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            keys (Sequence[str]): The top-level list fields to yield records from,
+            in order, for each page.
+            headers (dict): Optional, headers to include in each request.
+            prefetch (int): Optional, the read-ahead depth for this iteration
+            (defaults to `prefetch_pages`).
+            model (Type[Model]): Optional, the model to convert each record into
+            when `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds, counted from the first page.
+            template (str): Optional, the endpoint template reported to request
+            hooks for every page (default None, derived from each URL).
+
+        Yields:
+            dict: Each record of the listed fields.
+        """
+        spec = None if model is None else {key: model for key in keys}
+        async for page in self.iter_pages(
+            endpoint,
+            headers=headers,
+            prefetch=prefetch,
+            model=spec,
+            timeout=timeout,
+            template=template,
+        ):
+            for key in keys:
+                for record in page.get(key) or ():
+                    yield record
+
+    async def stream_records(
+        self,
+        endpoint: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model: Optional[Type[Model]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields the records of a paginated endpoint while each response body is
+        still downloading. See `APICaller.stream_records`.
+
+        Args:
+            endpoint (str): The API endpoint (path) of the first page.
+            keys (Sequence[str]): The top-level list fields to yield records from;
+            records are yielded in the order they appear in each body.
+            headers (dict): Optional, headers to include in each request.
+            chunk_size (int): Optional, the number of bytes read at a time
+            (default 64 KiB).
+            model (Type[Model]): Optional, the model to convert each record into
+            when `models` is enabled.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds; it bounds connecting and each read, and no page is requested
+            once it is spent.
+
+        Yields:
+            dict: Each record of the listed fields. Iteration stops after the last
+            page, or when a request fails before its body starts downloading.
+
+        Raises:
+            Exception: The error that cut a response body short, such as a
+            dropped connection once retries are exhausted, or `ValueError` if
+            the body is malformed or truncated; the records yielded before it
+            are valid, but the listing is incomplete.
+        """
+        expires = None if timeout is None else time.monotonic() + timeout
+        next_path: Optional[str] = endpoint
+        while next_path:
+            url = self._url(next_path)
+            started = False
+            attempt = 0
+            while True:
+                attempt += 1
+                reading = False
+                # A retried attempt reads the body from the start again.
+                parser = ArrayStreamParser(keys)
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async()
+                try:
+                    async with self.client.stream(
+                        "GET",
+                        url,
+                        headers=headers,
+                        timeout=self._httpx_timeout(expires),
+                    ) as response:
+                        delay = self._retry_delay(
+                            "GET",
+                            attempt,
+                            response.status_code,
+                            response.headers.get("Retry-After"),
+                            expires,
+                        )
+                        if delay is None:
+                            response.raise_for_status()
+                            reading = True
+                            async for chunk in response.aiter_bytes(chunk_size):
+                                for _, record in parser.feed(chunk):
+                                    started = True
+                                    yield self._convert(record, model)
+                            for _, record in parser.close():
+                                yield self._convert(record, model)
+                            break
+                except httpx.TransportError as e:
+                    if started:
+                        delay = None
+                    else:
+                        delay = self._retry_delay("GET", attempt, expires=expires)
+                    if delay is None:
+                        logging.error(e)
+                        if reading:
+                            raise
+                        return
+                except (httpx.HTTPError, DeadlineExceeded, ValueError) as e:
+                    logging.error(e)
+                    if reading:
+                        raise
+                    return
+                self._count("retries")
+                await asyncio.sleep(delay)
+            next_path = self._next_page_path(parser.rest)
+
+    async def map_concurrent(
+        self,
+        fn: Callable[[Any], Awaitable[Any]],
+        items: Iterable[Any],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[BulkResult]:
+        """
+        Awaits `fn` for every item with a bounded number of calls in flight.
+
+        Each call runs in its own task, which inherits the caller's context, so
+        an enclosing `Deadline.deadline` applies to them.
+
+        Args:
+            fn (callable): The coroutine function to call with each item,
+            typically a resource method such as `Flights.get_flight`.
+            items (Iterable[Any]): The items to look up.
+            concurrency (int): Optional, the maximum number of calls in flight
+            (default 8).
+            ordered (bool): Optional, whether to return results in input order
+            rather than completion order (default True).
+            timeout (float): Optional, the time budget of all the calls together,
+            in seconds; calls not sent in time fail.
+
+        Returns:
+            List[BulkResult]: One result per item.
+        """
+        if timeout is not None:
+            with deadline(timeout):
+                return await self.map_concurrent(fn, items, concurrency, ordered)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def call(item: Any) -> BulkResult:
+            async with semaphore:
+                _last_error.set(None)
+                try:
+                    result = await fn(item)
+                except Exception as e:
+                    return BulkResult(item, None, e)
+                error = None if result is not None else _last_error.get()
+                return BulkResult(item, result, error)
+
+        calls = [call(item) for item in items]
+        if ordered:
+            return list(await asyncio.gather(*calls))
+        return [await result for result in asyncio.as_completed(calls)]
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying connection pool.
+        """
+        await self.client.aclose()
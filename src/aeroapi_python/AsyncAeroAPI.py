@@ -0,0 +1,103 @@
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+
+if TYPE_CHECKING:
+    from aeroapi_python.Airports import Airports
+    from aeroapi_python.Flights import Flights
+    from aeroapi_python.History import History
+    from aeroapi_python.Miscellaneous import Miscellaneous
+    from aeroapi_python.Operators import Operators
+
+
+class AsyncAeroAPI:
+    """
+    An asyncio counterpart of `AeroAPI`.
+
+    The resource classes are shared with `AeroAPI`; because they are bound to an
+    `AsyncAPICaller`, every resource method returns an awaitable instead of the
+    parsed response. As with `AeroAPI`, each is created on first access.
+
+    Attributes:
+        base_url (str): The base URL for the AeroAPI.
+        api_key (str): The API key for the AeroAPI.
+        api_caller (AsyncAPICaller): An instance of the `AsyncAPICaller` class.
+        airports (Airports): An instance of the `Airports` class.
+        operators (Operators): An instance of the `Operators` class.
+        history (History): An instance of the `History` class.
+        miscellaneous (Miscellaneous): An instance of the `Miscellaneous` class.
+        flights (Flights): An instance of the `Flights` class.
+
+    Methods:
+        __init__(self, api_key: str, max_connections: int = 100, **options: Any)
+          -> None:
+            Initializes an `AsyncAeroAPI` instance.
+
+        aclose(self) -> None:
+            Closes the shared connection pool.
+    """
+
+    def __init__(
+        self, api_key: str, max_connections: int = 100, **options: Any
+    ) -> None:
+        """
+        Initializes an `AsyncAeroAPI` instance.
+
+        Args:
+            api_key (str): The API key for the AeroAPI.
+            max_connections (int): Optional, the maximum number of pooled
+            connections shared by all resources (default 100).
+            **options: Optional `AsyncAPICaller` settings, such as
+            `prefetch_pages` or `rate_limiter`; see `BaseAPICaller`.
+        """
+        self.base_url = "https://aeroapi.flightaware.com/aeroapi/"
+        self.api_key = api_key
+        self.api_caller = AsyncAPICaller(
+            self.base_url,
+            self.api_key,
+            max_connections=max_connections,
+            **options,
+        )
+
+    @cached_property
+    def airports(self) -> "Airports":
+        from aeroapi_python.Airports import Airports
+
+        return Airports(self.api_caller)
+
+    @cached_property
+    def operators(self) -> "Operators":
+        from aeroapi_python.Operators import Operators
+
+        return Operators(self.api_caller)
+
+    @cached_property
+    def history(self) -> "History":
+        from aeroapi_python.History import History
+
+        return History(self.api_caller)
+
+    @cached_property
+    def miscellaneous(self) -> "Miscellaneous":
+        from aeroapi_python.Miscellaneous import Miscellaneous
+
+        return Miscellaneous(self.api_caller)
+
+    @cached_property
+    def flights(self) -> "Flights":
+        from aeroapi_python.Flights import Flights
+
+        return Flights(self.api_caller)
+
+    async def aclose(self) -> None:
+        """
+        Closes the shared connection pool.
+        """
+        await self.api_caller.aclose()
+
+    async def __aenter__(self) -> "AsyncAeroAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
@@ -0,0 +1,405 @@
+import asyncio
+import inspect
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+# The airport boards polled by default, as `Airports` method names.
+DEFAULT_BOARDS = (
+    "scheduled_arrivals",
+    "scheduled_departures",
+    "recent_arrivals",
+    "recent_departures",
+)
+
+# The list of flights in the response of each board method.
+BOARD_KEYS = {
+    "scheduled_arrivals": "scheduled_arrivals",
+    "scheduled_departures": "scheduled_departures",
+    "recent_arrivals": "arrivals",
+    "recent_departures": "departures",
+}
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+class BoardEvent(NamedTuple):
+    """
+    A change to the flights on an airport's boards.
+
+    Attributes:
+        kind (str): `added`, `changed` or `removed`.
+        airport_id (str): The airport identifier.
+        board (str): The board the flight is (or was last) listed on.
+        flight_id (str): The `fa_flight_id` of the flight.
+        flight (Any): The flight record; for `removed`, the last one seen.
+        previous (Any): For `changed`, the record it replaces, otherwise None.
+    """
+
+    kind: str
+    airport_id: str
+    board: str
+    flight_id: str
+    flight: Any
+    previous: Any
+
+
+class _AirportState:
+    """
+    The last snapshot and poll schedule of one airport.
+    """
+
+    __slots__ = ("snapshot", "interval", "rate", "polled", "due")
+
+    def __init__(self, interval: float, rate: float) -> None:
+        self.snapshot: Optional[Dict[str, Tuple[str, Any, Any]]] = None
+        self.interval = interval
+        self.rate = rate
+        self.polled: Optional[float] = None
+        self.due = 0.0
+
+
+class BoardPoller:
+    """
+    Polls the boards of many airports and reports only what changed.
+
+    The poller keeps the last snapshot of each airport, keyed by `fa_flight_id`,
+    and turns every poll into `added`, `changed` and `removed` events. Each
+    airport is polled on its own schedule: its interval is derived from an
+    exponentially weighted average of the changes seen per second, aiming for
+    `target_changes` per poll, so quiet airports are polled less and less often
+    (down to every `max_interval` seconds) and busy ones up to every
+    `min_interval` seconds.
+
+    Each board is read up to `max_pages` pages deep. When a board has more
+    pages than that, flights missing from the pages read are kept in the
+    snapshot rather than reported as `removed`, since they may only have moved
+    further down the board.
+
+    Attributes:
+        airports (Airports): The `Airports` resource to poll with.
+        boards (Tuple[str, ...]): The `Airports` board methods to poll.
+        max_pages (int): The number of pages read from each board per poll.
+        min_interval (float): The shortest poll interval, in seconds.
+        max_interval (float): The longest poll interval, in seconds.
+        target_changes (float): The number of changes aimed for per poll.
+        smoothing (float): The weight of the latest poll in the change rate.
+        ignore_fields (frozenset): Record fields whose changes are not reported.
+        concurrency (int): The maximum number of requests in flight.
+
+    Methods:
+        add_airport(airport_id: str) -> None:
+            Starts polling an airport.
+
+        remove_airport(airport_id: str) -> None:
+            Stops polling an airport and forgets its snapshot.
+
+        interval(airport_id: str) -> float:
+            Returns the current poll interval of an airport.
+
+        poll_due() -> Union[List[BoardEvent], Awaitable[List[BoardEvent]]]:
+            Polls every airport that is due and returns the changes.
+
+        watch() -> Union[Iterator[BoardEvent], AsyncIterator[BoardEvent]]:
+            Polls airports as they fall due, forever, yielding the changes.
+    """
+
+    def __init__(
+        self,
+        airports: Any,
+        airport_ids: Iterable[str] = (),
+        boards: Iterable[str] = DEFAULT_BOARDS,
+        max_pages: int = 1,
+        interval: float = 60.0,
+        min_interval: float = 30.0,
+        max_interval: float = 600.0,
+        target_changes: float = 1.0,
+        smoothing: float = 0.3,
+        ignore_fields: Collection[str] = (),
+        concurrency: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a `BoardPoller` instance.
+
+        Args:
+            airports (Airports): The `Airports` resource, using an `APICaller` or
+            an `AsyncAPICaller`.
+            airport_ids (Iterable[str]): Optional, the airports to poll.
+            boards (Iterable[str]): Optional, the board methods to poll (default
+            scheduled and recent arrivals and departures).
+            max_pages (int): Optional, the number of pages read from each board
+            per poll (default 1).
+            interval (float): Optional, the initial poll interval in seconds
+            (default 60).
+            min_interval (float): Optional, the shortest poll interval (default 30).
+            max_interval (float): Optional, the longest poll interval (default 600).
+            target_changes (float): Optional, the number of changes aimed for per
+            poll (default 1).
+            smoothing (float): Optional, the weight in (0, 1] of the latest poll
+            in the change rate (default 0.3).
+            ignore_fields (Collection[str]): Optional, record fields whose changes
+            are not reported, such as `progress_percent`.
+            concurrency (int): Optional, the maximum number of requests in flight
+            (default 8).
+            clock (callable): Optional, the time source (default `time.monotonic`).
+
+        Raises:
+            ValueError: If a board is not supported, or `max_pages`, the intervals
+            or `smoothing` are out of range.
+        """
+        self.boards = tuple(boards)
+        for board in self.boards:
+            if board not in BOARD_KEYS:
+                raise ValueError(
+                    f"Unknown board {board!r}; expected one of "
+                    f"{', '.join(sorted(BOARD_KEYS))}"
+                )
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must satisfy 0 < smoothing <= 1")
+        self.airports = airports
+        self.max_pages = max_pages
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.target_changes = target_changes
+        self.smoothing = smoothing
+        self.ignore_fields = frozenset(ignore_fields)
+        self.concurrency = concurrency
+        self._initial_interval = min(max(interval, min_interval), max_interval)
+        self._clock = clock
+        self._states: Dict[str, _AirportState] = {}
+        for airport_id in airport_ids:
+            self.add_airport(airport_id)
+
+    def add_airport(self, airport_id: str) -> None:
+        """
+        Starts polling an airport; it is due immediately.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+        """
+        if airport_id not in self._states:
+            interval = self._initial_interval
+            # Start from the rate the initial interval is tuned for, so that the
+            # interval drifts from it rather than jumping after one poll.
+            self._states[airport_id] = _AirportState(
+                interval, self.target_changes / interval
+            )
+
+    def remove_airport(self, airport_id: str) -> None:
+        """
+        Stops polling an airport and forgets its snapshot.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+        """
+        self._states.pop(airport_id, None)
+
+    def interval(self, airport_id: str) -> float:
+        """
+        Returns the current poll interval of an airport.
+
+        Args:
+            airport_id (str): The airport identifier (ICAO code).
+
+        Returns:
+            float: The interval in seconds.
+        """
+        return self._states[airport_id].interval
+
+    def _is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.airports.api_caller.get)
+
+    def _due(self) -> List[str]:
+        now = self._clock()
+        return [a for a, state in self._states.items() if state.due <= now]
+
+    def _next_due(self) -> float:
+        if not self._states:
+            return self.min_interval
+        return max(0.0, min(s.due for s in self._states.values()) - self._clock())
+
+    def _fingerprint(self, record: Any) -> Any:
+        if hasattr(record, "to_dict"):
+            record = record.to_dict()
+        if not self.ignore_fields:
+            return record
+        return {k: v for k, v in record.items() if k not in self.ignore_fields}
+
+    def _snapshot(
+        self, responses: List[Any]
+    ) -> Optional[Tuple[Dict[str, Tuple[str, Any, Any]], Set[str]]]:
+        """
+        Builds the snapshot of an airport from its board responses.
+
+        Args:
+            responses (List[Any]): The response of each board, in `boards` order.
+
+        Returns:
+            tuple: `(board, record, fingerprint)` by `fa_flight_id`, and the boards
+            that have more pages than were read; or None if a board could not be
+            retrieved.
+        """
+        snapshot = {}
+        truncated = set()
+        for board, response in zip(self.boards, responses):
+            if response is None:
+                return None
+            if (response.get("links") or {}).get("next"):
+                truncated.add(board)
+            for record in response.get(BOARD_KEYS[board]) or ():
+                flight_id = record.get("fa_flight_id")
+                if flight_id is not None:
+                    snapshot[flight_id] = (board, record, self._fingerprint(record))
+        return snapshot, truncated
+
+    def _update(
+        self,
+        airport_id: str,
+        snapshot: Optional[Dict[str, Tuple[str, Any, Any]]],
+        truncated: Collection[str] = (),
+    ) -> List[BoardEvent]:
+        """
+        Diffs a new snapshot against the last one and reschedules the airport.
+
+        A failed poll produces no events and keeps the last snapshot; the airport
+        is retried after its current interval. Flights last seen on a truncated
+        board and missing from the new snapshot are carried over, not removed.
+
+        Args:
+            airport_id (str): The airport identifier.
+            snapshot (dict): The new snapshot, or None if the poll failed.
+            truncated (Collection[str]): Optional, the boards that have more
+            pages than were read.
+
+        Returns:
+            List[BoardEvent]: The changes since the last snapshot.
+        """
+        state = self._states.get(airport_id)
+        if state is None:
+            return []
+        now = self._clock()
+        if snapshot is None:
+            state.due = now + state.interval
+            return []
+        events = []
+        previous = state.snapshot or {}
+        for flight_id, (board, record, fingerprint) in snapshot.items():
+            old = previous.get(flight_id)
+            if old is None:
+                events.append(
+                    BoardEvent(ADDED, airport_id, board, flight_id, record, None)
+                )
+            elif old[0] != board or old[2] != fingerprint:
+                events.append(
+                    BoardEvent(CHANGED, airport_id, board, flight_id, record, old[1])
+                )
+        for flight_id, entry in previous.items():
+            if flight_id in snapshot:
+                continue
+            board, record, _ = entry
+            if board in truncated:
+                snapshot[flight_id] = entry
+            else:
+                events.append(
+                    BoardEvent(REMOVED, airport_id, board, flight_id, record, None)
+                )
+        if state.snapshot is not None and state.polled is not None:
+            elapsed = max(now - state.polled, 1e-9)
+            state.rate += self.smoothing * (len(events) / elapsed - state.rate)
+            if state.rate > 0:
+                interval = self.target_changes / state.rate
+            else:
+                interval = self.max_interval
+            state.interval = min(max(interval, self.min_interval), self.max_interval)
+        state.snapshot = snapshot
+        state.polled = now
+        state.due = now + state.interval
+        return events
+
+    def _fetch(self, airport_id: str, board: str) -> Any:
+        return getattr(self.airports, board)(airport_id, max_pages=self.max_pages)
+
+    def poll_due(self) -> Union[List[BoardEvent], Awaitable[List[BoardEvent]]]:
+        """
+        Polls every airport that is due and returns the changes.
+
+        The first poll of an airport reports all its flights as `added`.
+
+        Returns:
+            List[BoardEvent]: The changes, grouped by airport. With an
+            `AsyncAPICaller` this is an awaitable.
+        """
+        if self._is_async():
+            return self._poll_due_async()
+        return self._poll_due()
+
+    def _poll_due(self) -> List[BoardEvent]:
+        due = self._due()
+        jobs = [(a, board) for a in due for board in self.boards]
+        results = self.airports.api_caller.map_concurrent(
+            lambda job: self._fetch(*job), jobs, self.concurrency
+        )
+        return self._collect(due, [r.result for r in results])
+
+    async def _poll_due_async(self) -> List[BoardEvent]:
+        due = self._due()
+        jobs = [(a, board) for a in due for board in self.boards]
+        results = await self.airports.api_caller.map_concurrent(
+            lambda job: self._fetch(*job), jobs, self.concurrency
+        )
+        return self._collect(due, [r.result for r in results])
+
+    def _collect(self, due: List[str], responses: List[Any]) -> List[BoardEvent]:
+        events = []
+        size = len(self.boards)
+        for i, airport_id in enumerate(due):
+            built = self._snapshot(responses[i * size : (i + 1) * size])
+            if built is None:
+                events.extend(self._update(airport_id, None))
+            else:
+                events.extend(self._update(airport_id, *built))
+        return events
+
+    def watch(self) -> Union[Iterator[BoardEvent], AsyncIterator[BoardEvent]]:
+        """
+        Polls airports as they fall due, forever, yielding the changes.
+
+        Yields:
+            BoardEvent: Each change. With an `AsyncAPICaller` this is an async
+            generator.
+        """
+        if self._is_async():
+            return self._watch_async()
+        return self._watch()
+
+    def _watch(self) -> Iterator[BoardEvent]:
+        while True:
+            yield from self._poll_due()
+            time.sleep(self._next_due())
+
+    async def _watch_async(self) -> AsyncIterator[BoardEvent]:
+        while True:
+            for event in await self._poll_due_async():
+                yield event
+            await asyncio.sleep(self._next_due())
@@ -0,0 +1,72 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_deadline: "ContextVar[Optional[float]]" = ContextVar("aeroapi_deadline", default=None)
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised internally, and reported to request hooks, when the time budget of a
+    call runs out.
+    """
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """
+    Bounds every API call made within the block to finish within `seconds`.
+
+    The deadline is held in a context variable, so it covers every page of a
+    pagination loop, the worker threads of `map_concurrent` and prefetching,
+    and the tasks of an `AsyncAPICaller`. Connect and read timeouts are
+    shortened to the time left, retries that would end after the deadline are
+    not attempted, and once it has passed calls fail (returning None) without
+    being sent. Nested deadlines can only shorten the enclosing one.
+
+    Args:
+        seconds (float): The time budget, in seconds.
+
+    Yields:
+        float: The deadline, as a `time.monotonic()` timestamp.
+    """
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None and current < expires:
+        expires = current
+    token = _deadline.set(expires)
+    try:
+        yield expires
+    finally:
+        _deadline.reset(token)
+
+
+def current_deadline() -> Optional[float]:
+    """
+    Returns the deadline of the current context.
+
+    Returns:
+        float: The deadline as a `time.monotonic()` timestamp, or None.
+    """
+    return _deadline.get()
+
+
+def time_left(expires: Optional[float] = None) -> Optional[float]:
+    """
+    Returns the time left before the earliest of `expires` and the current
+    context's deadline.
+
+    Args:
+        expires (float): Optional, another deadline, as a `time.monotonic()`
+        timestamp.
+
+    Returns:
+        float: The seconds left (possibly negative), or None without a deadline.
+    """
+    current = _deadline.get()
+    if current is None or (expires is not None and expires < current):
+        current = expires
+    if current is None:
+        return None
+    return current - time.monotonic()
@@ -0,0 +1,476 @@
+import re
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote_plus
+
+from aeroapi_python.Models import (
+    Airport,
+    Flight,
+    ModelSpec,
+    Operator,
+    Position,
+    Track,
+)
+
+MINUTE = 60.0
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+_PARAM = re.compile(r"\{(\w+)\}")
+_MISSING: Any = object()
+
+# The query parameters of AeroAPI's cursor pagination.
+PAGES = ("max_pages", "cursor")
+
+# The record lists of an airport or operator flight board.
+AIRPORT_BOARDS = (
+    "arrivals",
+    "departures",
+    "scheduled_arrivals",
+    "scheduled_departures",
+)
+OPERATOR_BOARDS = ("scheduled", "arrivals", "enroute")
+
+# The airline, type and time filters of the airport flight boards.
+BOARD_QUERY = ("airline", "type", "start", "end") + PAGES
+
+
+def _encode(value: Any) -> str:
+    """
+    Encodes a query value exactly as `urlencode` does, skipping the quoting of
+    numbers.
+    """
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, bytes):
+        return quote_plus(value)
+    return quote_plus(str(value))
+
+
+class Endpoint:
+    """
+    An AeroAPI endpoint, from which resource methods build and send requests.
+
+    The path template is compiled once, into a format string taking the path
+    parameters in order, and the query parameters are encoded in their declared
+    order with their names pre-encoded, so building a URL costs one
+    `str.format` and one join. The endpoint also declares how its responses are
+    paginated, converted into models and cached, so every resource method built
+    on it behaves the same way.
+
+    Attributes:
+        template (str): The path relative to the API root, with path parameters
+        in braces, such as `airports/{airport_id}/flights/arrivals`.
+        params (Tuple[str, ...]): The names of the path parameters, in order.
+        metric_template (str): The template reported to request hooks, with
+        every path parameter as `{id}`, such as `airports/{id}/flights/arrivals`.
+        query (Tuple[str, ...]): The query parameters the endpoint accepts, in
+        the order they are encoded.
+        records (Tuple[str, ...]): The keys of the record lists of a response.
+        paginated (bool): Whether the endpoint follows `links.next` cursors.
+        model (ModelSpec): The model of each record (or of the whole response
+        without `records`), or None.
+        cache_ttl (float): The TTL of cached responses in seconds, or None to
+        use the cache's `default_ttl`.
+
+    Methods:
+        path(*params: Any, encoded: str = "", **query: Any) -> str:
+            Builds the path and query string of a request.
+
+        url(base_url: str, *params: Any, encoded: str = "", **query: Any) -> str:
+            Builds the URL of a request.
+
+        get(api_caller: BaseAPICaller, *params: Any, encoded: str = "", timeout: Optional[float] = None, **query: Any) -> Optional[Dict[str, Any]]:
+            Sends a GET request for the endpoint.
+
+        iter_records(api_caller: BaseAPICaller, *params: Any, encoded: str = "", timeout: Optional[float] = None, **query: Any) -> Iterator[Dict[str, Any]]:
+            Lazily yields the records of every page.
+
+        stream_records(api_caller: BaseAPICaller, *params: Any, encoded: str = "", timeout: Optional[float] = None, **query: Any) -> Iterator[Dict[str, Any]]:
+            Yields the records of every page as each response downloads.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        query: Sequence[str] = (),
+        records: Sequence[str] = (),
+        paginated: bool = False,
+        model: Optional[ModelSpec] = None,
+        cache_ttl: Optional[float] = None,
+    ) -> None:
+        """
+        Initializes an `Endpoint` instance.
+
+        Args:
+            template (str): The path relative to the API root, with path
+            parameters in braces.
+            query (Sequence[str]): Optional, the accepted query parameters, in
+            the order they are encoded.
+            records (Sequence[str]): Optional, the keys of the record lists of a
+            response.
+            paginated (bool): Optional, whether the endpoint follows
+            `links.next` cursors (default False).
+            model (ModelSpec): Optional, the model of each record, or of the
+            whole response without `records`.
+            cache_ttl (float): Optional, the TTL of cached responses in seconds
+            (default None, the cache's `default_ttl`).
+        """
+        self.template = template
+        self.params = tuple(_PARAM.findall(template))
+        self.metric_template = _PARAM.sub("{id}", template)
+        self.query = tuple(query)
+        self.records = tuple(records)
+        self.paginated = paginated
+        self.model = model
+        self.cache_ttl = cache_ttl
+        self._format = _PARAM.sub("{}", template)
+        self._prefixes = tuple((name, quote_plus(name) + "=") for name in self.query)
+        self._response_model: Optional[ModelSpec] = (
+            {key: model for key in self.records}
+            if isinstance(model, type) and self.records
+            else model
+        )
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.template!r})"
+
+    def path(self, *params: Any, encoded: str = "", **query: Any) -> str:
+        """
+        Builds the path and query string of a request, relative to the API root.
+
+        Path parameters are inserted as given, like the rest of the client
+        does; query parameters that are None are left out.
+
+        Args:
+            *params (Any): The path parameters, in order.
+            encoded (str): Optional, an already URL-encoded query string to
+            append, such as `SearchQuery.encoded`.
+            **query (Any): The query parameters.
+
+        Returns:
+            str: The path, with its query string if any.
+
+        Raises:
+            TypeError: If the number of path parameters is wrong or a query
+            parameter is not accepted by the endpoint.
+        """
+        if len(params) != len(self.params):
+            raise TypeError(
+                f"{self.template} takes {len(self.params)} path parameters "
+                f"({len(params)} given)"
+            )
+        path = self._format.format(*params) if params else self._format
+        if not query:
+            return f"{path}?{encoded}" if encoded else path
+        parts: List[str] = []
+        found = 0
+        for name, prefix in self._prefixes:
+            value = query.get(name, _MISSING)
+            if value is _MISSING:
+                continue
+            found += 1
+            if value is not None:
+                parts.append(prefix + _encode(value))
+        if found != len(query):
+            unknown = sorted(set(query) - set(self.query))
+            raise TypeError(f"{self.template} does not accept {', '.join(unknown)}")
+        if encoded:
+            parts.append(encoded)
+        return f"{path}?{'&'.join(parts)}" if parts else path
+
+    def url(self, base_url: str, *params: Any, encoded: str = "", **query: Any) -> str:
+        """
+        Builds the URL of a request. See `path`.
+
+        Args:
+            base_url (str): The base URL of the API, ending with a slash.
+            *params (Any): The path parameters, in order.
+            encoded (str): Optional, an already URL-encoded query string to
+            append.
+            **query (Any): The query parameters.
+
+        Returns:
+            str: The absolute URL.
+        """
+        return base_url + self.path(*params, encoded=encoded, **query)
+
+    def get(
+        self,
+        api_caller: Any,
+        *params: Any,
+        encoded: str = "",
+        timeout: Optional[float] = None,
+        **query: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Sends a GET request for the endpoint, converting the response into the
+        endpoint's models when the client has `models` enabled.
+
+        Args:
+            api_caller (BaseAPICaller): An `APICaller` or `AsyncAPICaller`.
+            *params (Any): The path parameters, in order.
+            encoded (str): Optional, an already URL-encoded query string to
+            append.
+            timeout (float): Optional, the time budget of the call in seconds.
+            **query (Any): The query parameters.
+
+        Returns:
+            dict: The parsed JSON response, or None if the request failed. With
+            an `AsyncAPICaller` this is an awaitable.
+        """
+        url = api_caller.base_url + self.path(*params, encoded=encoded, **query)
+        return api_caller.get(
+            url,
+            model=self._response_model,
+            timeout=timeout,
+            template=self.metric_template,
+        )
+
+    def iter_records(
+        self,
+        api_caller: Any,
+        *params: Any,
+        encoded: str = "",
+        timeout: Optional[float] = None,
+        **query: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields the records of every page, following pagination cursors.
+
+        Args:
+            api_caller (BaseAPICaller): An `APICaller` or `AsyncAPICaller`.
+            *params (Any): The path parameters, in order.
+            encoded (str): Optional, an already URL-encoded query string to
+            append.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds.
+            **query (Any): The query parameters.
+
+        Yields:
+            dict: Each record of the `records` lists. With an `AsyncAPICaller`
+            this is an async generator.
+        """
+        url = api_caller.base_url + self.path(*params, encoded=encoded, **query)
+        return api_caller.iter_records(
+            url,
+            self.records,
+            model=self.model,
+            timeout=timeout,
+            template=self.metric_template,
+        )
+
+    def stream_records(
+        self,
+        api_caller: Any,
+        *params: Any,
+        encoded: str = "",
+        timeout: Optional[float] = None,
+        **query: Any,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the records of every page while each response is still
+        downloading.
+
+        Args:
+            api_caller (BaseAPICaller): An `APICaller` or `AsyncAPICaller`.
+            *params (Any): The path parameters, in order.
+            encoded (str): Optional, an already URL-encoded query string to
+            append.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds.
+            **query (Any): The query parameters.
+
+        Yields:
+            dict: Each record of the `records` lists, in the order they appear
+            in each response. With an `AsyncAPICaller` this is an async
+            generator.
+        """
+        url = api_caller.base_url + self.path(*params, encoded=encoded, **query)
+        return api_caller.stream_records(
+            url, self.records, model=self.model, timeout=timeout
+        )
+
+
+def _board(template: str, *records: str) -> Endpoint:
+    return Endpoint(
+        template,
+        BOARD_QUERY,
+        records or AIRPORT_BOARDS,
+        paginated=True,
+        model=Flight,
+        cache_ttl=30.0,
+    )
+
+
+# Every endpoint the resource classes call, keyed by template.
+ENDPOINTS: Dict[str, Endpoint] = {
+    endpoint.template: endpoint
+    for endpoint in (
+        # Airports
+        Endpoint("airports", PAGES, ("airports",), paginated=True, model=Airport),
+        Endpoint(
+            "airports/delays", PAGES, ("delays",), paginated=True, cache_ttl=MINUTE
+        ),
+        Endpoint("airports/{airport_id}", model=Airport, cache_ttl=DAY),
+        Endpoint(
+            "airports/{airport_id}/canonical",
+            ("id_type",),
+            ("airports",),
+            model=Airport,
+            cache_ttl=DAY,
+        ),
+        _board("airports/{airport_id}/flights"),
+        _board("airports/{airport_id}/flights/arrivals", "arrivals"),
+        _board("airports/{airport_id}/flights/departures", "departures"),
+        _board(
+            "airports/{airport_id}/flights/scheduled_arrivals", "scheduled_arrivals"
+        ),
+        _board(
+            "airports/{airport_id}/flights/scheduled_departures",
+            "scheduled_departures",
+        ),
+        Endpoint("airports/{airport_id}/flights/counts", cache_ttl=30.0),
+        Endpoint(
+            "airports/{origin_id}/flights/to/{dest_id}",
+            ("type", "connection", "start", "end") + PAGES,
+            ("flights",),
+            paginated=True,
+            cache_ttl=30.0,
+        ),
+        Endpoint(
+            "airports/{airport_id}/nearby",
+            ("radius", "only_iap") + PAGES,
+            ("airports",),
+            paginated=True,
+            model=Airport,
+            cache_ttl=DAY,
+        ),
+        Endpoint(
+            "airports/{airport_id}/weather/forecast",
+            ("timestamp", "return_nearby_weather"),
+            cache_ttl=5 * MINUTE,
+        ),
+        Endpoint(
+            "airports/{airport_id}/weather/observations",
+            ("temperature_units", "return_nearby_weather", "timestamp") + PAGES,
+            ("conditions",),
+            paginated=True,
+            cache_ttl=5 * MINUTE,
+        ),
+        # Flights
+        Endpoint("flights/{flight_id}", records=("flights",), model=Flight),
+        Endpoint("flights/all", ("time", "icao24")),
+        Endpoint("flights/states", ("time", "icao24")),
+        Endpoint("flights/search", records=("flights",), model=Flight, cache_ttl=15.0),
+        Endpoint("flights/search/count", cache_ttl=15.0),
+        Endpoint(
+            "flights/search/positions",
+            ("max_pages",),
+            ("positions",),
+            paginated=True,
+            model=Position,
+            cache_ttl=15.0,
+        ),
+        # History
+        Endpoint(
+            "history/flights/{flight_id}/map",
+            (
+                "height",
+                "width",
+                "layer_on",
+                "layer_off",
+                "show_data_block",
+                "airports_expand_view",
+                "show_airports",
+                "bounding_box",
+            ),
+        ),
+        Endpoint("history/flights/{flight_id}/route"),
+        Endpoint(
+            "history/flights/{flight_id}/track",
+            ("include_estimated_positions",),
+            model=Track,
+        ),
+        Endpoint(
+            "history/aircraft/{registration}/last_flight",
+            records=("flights",),
+            model=Flight,
+        ),
+        Endpoint(
+            "history/flights/{ident}",
+            ("ident_type", "start", "end") + PAGES,
+            ("flights",),
+            paginated=True,
+            model=Flight,
+        ),
+        # Miscellaneous
+        Endpoint("aircraft/{ident}/owner", cache_ttl=DAY),
+        Endpoint("aircraft/types/{aircraft_type}", cache_ttl=DAY),
+        Endpoint(
+            "disruption_counts/{entity_type}",
+            ("time_period",) + PAGES,
+            ("entities",),
+            paginated=True,
+        ),
+        Endpoint("disruption_counts/{entity_type}/{entity_id}", ("time_period",)),
+        Endpoint(
+            "schedules/{date_start}/{date_end}",
+            (
+                "origin",
+                "destination",
+                "airline",
+                "flight_number",
+                "include_codeshares",
+                "include_regional",
+            )
+            + PAGES,
+            ("scheduled",),
+            paginated=True,
+        ),
+        # Operators
+        Endpoint("operators", PAGES, ("operators",), paginated=True),
+        Endpoint("operators/{operator_id}", model=Operator, cache_ttl=DAY),
+        Endpoint("operators/{operator_id}/canonical", ("country_code",), cache_ttl=DAY),
+        Endpoint(
+            "operators/{operator_id}/flights",
+            ("start", "end") + PAGES,
+            OPERATOR_BOARDS,
+            paginated=True,
+            model=Flight,
+            cache_ttl=30.0,
+        ),
+    )
+}
+
+
+def cache_rules() -> Tuple[Tuple[str, float], ...]:
+    """
+    Returns the `(pattern, ttl)` rules of the endpoints with a `cache_ttl`, for
+    `ResponseCache`.
+
+    Path parameters become `*`. As the first matching rule wins and `*` also
+    matches `/`, longer templates come first, then those with fewer parameters,
+    so `airports/delays` precedes `airports/{airport_id}`.
+
+    Returns:
+        tuple: The rules, most specific first.
+    """
+    endpoints = sorted(
+        ENDPOINTS.values(), key=lambda e: (-e.template.count("/"), len(e.params))
+    )
+    return tuple(
+        (_PARAM.sub("*", e.template), e.cache_ttl)
+        for e in endpoints
+        if e.cache_ttl is not None
+    )
+
+
+def literal_segments() -> Iterator[str]:
+    """
+    Yields the fixed path segments of every endpoint, such as `flights` and
+    `arrivals`, which metrics keep when replacing identifiers with `{id}`.
+    """
+    for endpoint in ENDPOINTS.values():
+        for segment in endpoint.template.split("/"):
+            if not _PARAM.fullmatch(segment):
+                yield segment
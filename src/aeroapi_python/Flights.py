@@ -1,67 +1,128 @@
-from typing import Optional, Dict, Any, List, Tuple
-from aeroapi_python.APICaller import APICaller
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Awaitable,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+)
+
+from aeroapi_python.APICaller import BaseAPICaller, BulkResult
+from aeroapi_python.Endpoints import ENDPOINTS
+from aeroapi_python.SearchQuery import SearchQuery
+from aeroapi_python.TiledSearch import BoundingBox, TiledSearch
+from aeroapi_python.TrackFrame import TrackFrame
 
 
 class Flights:
     """
     A class for interacting with the OpenSky Network Flights API.
 
+    Every method that calls the API also takes an optional `timeout`, the time
+    budget of the call (or of the whole iteration or bulk lookup) in seconds.
+
     Attributes:
         api_caller (APICaller): An instance of the `APICaller` class.
         endpoint (str): The API endpoint for flights.
 
     Methods:
-        __init__(self, api_caller: APICaller) -> None:
+        __init__(self, api_caller: BaseAPICaller) -> None:
             Initializes a `Flights` instance.
 
         get_flight(self, flight_id: str) -> Optional[Dict[str, Any]]:
             Retrieves information about a specific flight.
 
+        get_flights_bulk(self, flight_ids: Iterable[str], concurrency: int = 8,
+                         ordered: bool = True) -> List[BulkResult]:
+            Retrieves information about many flights concurrently.
+
         get_all_states(self, time: int = None, icao24: Optional[str] = None) -> Optional[Dict[str, Any]]:
             Retrieves the state vectors of all aircraft.
 
-        get_states(self, time: int = None, icao24s: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        get_states(self, time: int = None, icao24s: Optional[List[str]] = None, query: Union[SearchQuery, List[Tuple[str, Any]], None] = None) -> Optional[Dict[str, Any]]:
             Retrieves the state vectors of specific aircraft.
 
-        search_flights(self, operators: List[Tuple[str, Any]]) -> Optional[Dict[str, Any]]:
+        search_flights(self, operators: Union[SearchQuery, List[Tuple[str, Any]]]) -> Optional[Dict[str, Any]]:
             Searches for flights based on specified criteria.
 
-        count_search_flights(self, operators: List[Tuple[str, Any]]) -> Optional[Dict[str, Any]]:
+        count_search_flights(self, operators: Union[SearchQuery, List[Tuple[str, Any]]]) -> Optional[Dict[str, Any]]:
             Counts the number of flights that match specified criteria.
 
-        search_flights_positions(self, operators: List[Tuple[str, Any]]) -> Optional[Dict[str, Any]]:
+        search_flights_positions(self, operators: Union[SearchQuery, List[Tuple[str, Any]]], as_frame: bool = False) -> Union[Dict[str, Any], TrackFrame, None]:
             Searches for flights and returns their positions.
 
+        iter_search_flights_positions(self, operators: Union[SearchQuery, List[Tuple[str, Any]]], max_pages: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+            Lazily yields the positions of matching flights across pages.
+
+        search_flights_positions_tiled(self, bbox: BoundingBox, operators: Union[SearchQuery, Iterable[Tuple[str, Any]]] = (), **options: Any) -> Union[Dict[str, Any], Awaitable[Dict[str, Any]]]:
+            Searches the positions of the flights over a large area in tiles.
+
         print_search_query_keys() -> None:
             Prints the available query keys for `search_flights`.
     """
 
-    def __init__(self, api_caller: APICaller) -> None:
+    def __init__(self, api_caller: BaseAPICaller) -> None:
         """
         Initializes a `Flights` instance.
 
         Args:
-            api_caller (APICaller): An instance of the `APICaller` class.
+            api_caller (BaseAPICaller): An instance of `APICaller` or `AsyncAPICaller`.
         """
         self.api_caller = api_caller
         self.endpoint = "flights"
 
-    def get_flight(self, flight_id: str) -> Optional[Dict[str, Any]]:
+    def get_flight(
+        self, flight_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about a specific flight.
 
         Args:
             flight_id (str): The unique identifier of the flight.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, flight_id)
+        return ENDPOINTS["flights/{flight_id}"].get(
+            self.api_caller, flight_id, timeout=timeout
+        )
+
+    def get_flights_bulk(
+        self,
+        flight_ids: Iterable[str],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[BulkResult]:
+        """
+        Retrieves information about many flights concurrently.
+
+        Args:
+            flight_ids (Iterable[str]): The unique identifiers of the flights.
+            concurrency (int): Optional, the maximum number of requests in flight
+            (default 8).
+            ordered (bool): Optional, whether to return results in input order
+            rather than completion order (default True).
+            timeout (float): Optional, the time budget of all the lookups together,
+            in seconds (default None).
+
+        Returns:
+            List[BulkResult]: One `(item, result, error)` entry per flight ID.
+        """
+        return self.api_caller.map_concurrent(
+            self.get_flight, flight_ids, concurrency, ordered, timeout=timeout
         )
 
     def get_all_states(
-        self, time: Optional[int] = None, icao24: Optional[str] = None
+        self,
+        time: Optional[int] = None,
+        icao24: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the state vectors of all aircraft.
@@ -69,21 +130,22 @@ class Flights:
         Args:
             time (int): Optional, the time of the request in seconds since epoch.
             icao24 (str): Optional, the ICAO 24-bit address of the aircraft.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {}
-        if time is not None:
-            query["time"] = time
-        if icao24 is not None:
-            query["icao24"] = icao24
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, "all", query)
+        return ENDPOINTS["flights/all"].get(
+            self.api_caller, time=time, icao24=icao24, timeout=timeout
         )
 
     def get_states(
-        self, time: Optional[int] = None, icao24s: Optional[List[str]] = None
+        self,
+        time: Optional[int] = None,
+        icao24s: Optional[List[str]] = None,
+        query: Union[SearchQuery, List[Tuple[str, Any]], None] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the state vectors of specific aircraft.
@@ -91,154 +153,170 @@ class Flights:
         Args:
             time (int): Optional, the time of the request in seconds since epoch.
             icao24s (List[str]): Optional, a list of ICAO 24-bit addresses of the aircraft.
+            query (SearchQuery or List[Tuple[str, Any]]): Optional, search criteria
+            to filter the aircraft by.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {}
-        if time is not None:
-            query["time"] = time
-        if icao24s is not None:
-            query["icao24"] = ",".join(icao24s)
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, "states", query)
+        return ENDPOINTS["flights/states"].get(
+            self.api_caller,
+            encoded="" if query is None else SearchQuery.coerce(query).encoded,
+            time=time,
+            icao24=None if icao24s is None else ",".join(icao24s),
+            timeout=timeout,
         )
 
     def search_flights(
-        self, operators: List[Tuple[str, Any]]
+        self,
+        operators: Union[SearchQuery, List[Tuple[str, Any]]],
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Searches for flights based on specified criteria.
 
         Args:
-            operators (List[Tuple[str, Any]]): A list of tuples representing the search criteria.
+            operators (SearchQuery or List[Tuple[str, Any]]): A precompiled query,
+            or a list of tuples representing the search criteria.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
+
+        Raises:
+            ValueError: If a search operator is not supported.
         """
-        query_string = ""
-        for op, args in operators:
-            if op in {"false", "true", "null", "notnull"}:
-                query_string += f"{{{op} {args}}}"
-            elif op in {
-                "=",
-                "!=",
-                "<",
-                ">",
-                "<=",
-                ">=",
-                "match",
-                "notmatch",
-                "range",
-                "in",
-                "orig_or_dest",
-                "airline",
-                "aircraftType",
-                "ident",
-                "ident_or_reg",
-            }:
-                if isinstance(args, (list, tuple, set)):
-                    args_str = " ".join(map(str, args))
-                else:
-                    args_str = str(args)
-                query_string += f"{{{op} {args_str}}}"
-
-        query = {"query": query_string}
-
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, "search", query)
+        return ENDPOINTS["flights/search"].get(
+            self.api_caller,
+            encoded=SearchQuery.coerce(operators).encoded,
+            timeout=timeout,
         )
 
     def count_search_flights(
-        self, operators: List[Tuple[str, Any]]
+        self,
+        operators: Union[SearchQuery, List[Tuple[str, Any]]],
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Counts the number of flights that match specified criteria.
 
         Args:
-            operators (List[Tuple[str, Any]]): A list of tuples representing the search criteria.
+            operators (SearchQuery or List[Tuple[str, Any]]): A precompiled query,
+            or a list of tuples representing the search criteria.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
+
+        Raises:
+            ValueError: If a search operator is not supported.
         """
-        query_string = ""
-        for op, args in operators:
-            if op in {"false", "true", "null", "notnull"}:
-                query_string += f"{{{op} {args}}}"
-            elif op in {
-                "=",
-                "!=",
-                "<",
-                ">",
-                "<=",
-                ">=",
-                "match",
-                "notmatch",
-                "range",
-                "in",
-                "orig_or_dest",
-                "airline",
-                "aircraftType",
-                "ident",
-                "ident_or_reg",
-            }:
-                if isinstance(args, (list, tuple, set)):
-                    args_str = " ".join(map(str, args))
-                else:
-                    args_str = str(args)
-                query_string += f"{{{op} {args_str}}}"
-
-        query = {"query": query_string}
-
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, "search/count", query)
+        return ENDPOINTS["flights/search/count"].get(
+            self.api_caller,
+            encoded=SearchQuery.coerce(operators).encoded,
+            timeout=timeout,
         )
 
     def search_flights_positions(
-        self, operators: List[Tuple[str, Any]]
-    ) -> Optional[Dict[str, Any]]:
+        self,
+        operators: Union[SearchQuery, List[Tuple[str, Any]]],
+        as_frame: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict[str, Any], TrackFrame, None]:
         """
         Searches for flights and returns their positions.
 
         Args:
-            operators (List[Tuple[str, Any]]): A list of tuples representing the search criteria.
+            operators (SearchQuery or List[Tuple[str, Any]]): A precompiled query,
+            or a list of tuples representing the search criteria.
+            as_frame (bool): Optional, whether to return the positions as a
+            columnar `TrackFrame` (default False).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
-            dict: The parsed JSON response, or None if the request failed.
+            dict: The parsed JSON response, or None if the request failed. With
+            `as_frame`, a `TrackFrame` whose `meta` holds the pagination links;
+            it interleaves the positions of every matching flight, so split it
+            with `by_flight()` before using the track operations.
+
+        Raises:
+            ValueError: If a search operator is not supported.
+        """
+        endpoint = ENDPOINTS["flights/search/positions"]
+        encoded = SearchQuery.coerce(operators).encoded
+        if as_frame:
+            return self.api_caller.get(
+                endpoint.url(self.api_caller.base_url, encoded=encoded),
+                transform=TrackFrame.from_response,
+                timeout=timeout,
+                template=endpoint.metric_template,
+            )
+        return endpoint.get(self.api_caller, encoded=encoded, timeout=timeout)
+
+    def iter_search_flights_positions(
+        self,
+        operators: Union[SearchQuery, List[Tuple[str, Any]]],
+        max_pages: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        query_string = ""
-        for op, args in operators:
-            if op in {"false", "true", "null", "notnull"}:
-                query_string += f"{{{op} {args}}}"
-            elif op in {
-                "=",
-                "!=",
-                "<",
-                ">",
-                "<=",
-                ">=",
-                "match",
-                "notmatch",
-                "range",
-                "in",
-                "orig_or_dest",
-                "airline",
-                "aircraftType",
-                "ident",
-                "ident_or_reg",
-            }:
-                if isinstance(args, (list, tuple, set)):
-                    args_str = " ".join(map(str, args))
-                else:
-                    args_str = str(args)
-                query_string += f"{{{op} {args_str}}}"
-
-        query = {"query": query_string}
-
-        return self.api_caller.get(
-            self.api_caller._build_path(self.endpoint, "search/positions", query)
+        Lazily yields the positions of the flights matching the search criteria,
+        following pagination cursors.
+
+        Args:
+            operators (SearchQuery or List[Tuple[str, Any]]): A precompiled query,
+            or a list of tuples representing the search criteria.
+            max_pages (int): Optional, the maximum number of pages to retrieve per
+            request.
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `positions` list. With an `AsyncAPICaller` this
+            is an async generator.
+
+        Raises:
+            ValueError: If a search operator is not supported.
+        """
+        return ENDPOINTS["flights/search/positions"].iter_records(
+            self.api_caller,
+            encoded=SearchQuery.coerce(operators).encoded,
+            max_pages=max_pages,
+            timeout=timeout,
         )
 
+    def search_flights_positions_tiled(
+        self,
+        bbox: BoundingBox,
+        operators: Union[SearchQuery, Iterable[Tuple[str, Any]]] = (),
+        **options: Any,
+    ) -> Union[Dict[str, Any], Awaitable[Dict[str, Any]]]:
+        """
+        Searches the positions of the flights over a large area, split into
+        adaptive tiles that are searched concurrently.
+
+        Args:
+            bbox (BoundingBox): The `(min_lat, min_lon, max_lat, max_lon)` box.
+            operators (SearchQuery or Iterable[Tuple[str, Any]]): Optional,
+            additional search criteria.
+            **options: Optional `TiledSearch` settings, such as `max_count` or
+            `concurrency`.
+
+        Returns:
+            dict: The merged `positions`, one per flight, the `tiles` that were
+            searched, and the `failed` tiles, whose positions are missing. With an
+            `AsyncAPICaller` this is an awaitable.
+
+        Raises:
+            ValueError: If a search operator is not supported.
+        """
+        return TiledSearch(self, **options).search(bbox, operators)
+
     @staticmethod
     def print_search_query_keys() -> None:
         """
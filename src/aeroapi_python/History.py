@@ -1,17 +1,22 @@
-from typing import Optional, Dict, Any
-from aeroapi_python.APICaller import APICaller
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+from aeroapi_python.APICaller import BaseAPICaller, BulkResult
+from aeroapi_python.Endpoints import ENDPOINTS
+from aeroapi_python.TrackFrame import TrackFrame
 
 
 class History:
     """
     A class for interacting with the OpenSky Network History API.
 
+    Every method that calls the API also takes an optional `timeout`, the time
+    budget of the call (or of the whole iteration or bulk lookup) in seconds.
+
     Attributes:
         api_caller (APICaller): An instance of the `APICaller` class.
         endpoint (str): The API endpoint for history.
 
     Methods:
-        __init__(self, api_caller: APICaller) -> None:
+        __init__(self, api_caller: BaseAPICaller) -> None:
             Initializes a `History` instance.
 
         flight_map(self, flight_id: str, height: int = 480, width: int = 640, layer_on: Optional[str] = None,
@@ -23,23 +28,30 @@ class History:
         flight_route(self, flight_id: str) -> Optional[Dict[str, Any]]:
             Retrieves the route of a specific flight.
 
-        flight_track(self, flight_id: str, include_estimated_positions: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        flight_track(self, flight_id: str, include_estimated_positions: Optional[bool] = None, as_frame: bool = False) -> Union[Dict[str, Any], TrackFrame, None]:
             Retrieves the track of a specific flight.
 
         last_flight(self, registration: str) -> Optional[Dict[str, Any]]:
             Retrieves the last flight of a specific aircraft.
 
+        last_flights_bulk(self, registrations: Iterable[str], concurrency: int = 8,
+                          ordered: bool = True) -> List[BulkResult]:
+            Retrieves the last flight of many aircraft concurrently.
+
         flight_info(self, ident: str, ident_type: Optional[str] = None, start: Optional[int] = None,
                     end: Optional[int] = None, max_pages: int = 1, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
             Retrieves information about a specific flight or set of flights.
+
+        iter_flight_info(...) -> Iterator[Dict[str, Any]]:
+            Lazily yields the flights of `flight_info` across pages.
     """
 
-    def __init__(self, api_caller: APICaller) -> None:
+    def __init__(self, api_caller: BaseAPICaller) -> None:
         """
         Initializes a `History` instance.
 
         Args:
-            api_caller (APICaller): An instance of the `APICaller` class.
+            api_caller (BaseAPICaller): An instance of `APICaller` or `AsyncAPICaller`.
         """
         self.api_caller = api_caller
         self.endpoint = "history"
@@ -55,6 +67,7 @@ class History:
         airports_expand_view: Optional[bool] = None,
         show_airports: Optional[bool] = None,
         bounding_box: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a map of a specific flight.
@@ -69,73 +82,128 @@ class History:
             airports_expand_view (bool): Optional, whether to expand the view to include airports (default False).
             show_airports (bool): Optional, whether to show airports on the map (default False).
             bounding_box (str): Optional, a bounding box to restrict the map view.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {
-            "height": height,
-            "width": width,
-            "layer_on": layer_on,
-            "layer_off": layer_off,
-            "show_data_block": show_data_block,
-            "airports_expand_view": airports_expand_view,
-            "show_airports": show_airports,
-            "bounding_box": bounding_box,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"flights/{flight_id}/map", query=query
+        return ENDPOINTS["history/flights/{flight_id}/map"].get(
+            self.api_caller,
+            flight_id,
+            height=height,
+            width=width,
+            layer_on=layer_on,
+            layer_off=layer_off,
+            show_data_block=show_data_block,
+            airports_expand_view=airports_expand_view,
+            show_airports=show_airports,
+            bounding_box=bounding_box,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
-    def flight_route(self, flight_id: str) -> Optional[Dict[str, Any]]:
+    def flight_route(
+        self, flight_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the route of a specific flight.
 
         Args:
             flight_id (str): The unique identifier of the flight.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"flights/{flight_id}/route"
+        return ENDPOINTS["history/flights/{flight_id}/route"].get(
+            self.api_caller, flight_id, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def flight_track(
-        self, flight_id: str, include_estimated_positions: Optional[bool] = None
-    ) -> Optional[Dict[str, Any]]:
+        self,
+        flight_id: str,
+        include_estimated_positions: Optional[bool] = None,
+        as_frame: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Union[Dict[str, Any], TrackFrame, None]:
         """
         Retrieves the track of a specific flight.
 
         Args:
             flight_id (str): The unique identifier of the flight.
             include_estimated_positions (bool): Optional, whether to include estimated positions (default False).
+            as_frame (bool): Optional, whether to return the positions as a
+            columnar `TrackFrame` (default False).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
-            dict: The parsed JSON response, or None if the request failed.
+            dict: The parsed JSON response, or None if the request failed. With
+            `as_frame`, a `TrackFrame` whose `meta` holds `actual_distance`.
         """
-        query = {"include_estimated_positions": include_estimated_positions}
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"flights/{flight_id}/track", query=query
+        endpoint = ENDPOINTS["history/flights/{flight_id}/track"]
+        if as_frame:
+            return self.api_caller.get(
+                endpoint.url(
+                    self.api_caller.base_url,
+                    flight_id,
+                    include_estimated_positions=include_estimated_positions,
+                ),
+                transform=TrackFrame.from_response,
+                timeout=timeout,
+                template=endpoint.metric_template,
+            )
+        return endpoint.get(
+            self.api_caller,
+            flight_id,
+            timeout=timeout,
+            include_estimated_positions=include_estimated_positions,
         )
-        return self.api_caller.get(path)
 
-    def last_flight(self, registration: str) -> Optional[Dict[str, Any]]:
+    def last_flight(
+        self, registration: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the last flight of a specific aircraft.
 
         Args:
             registration (str): The registration of the aircraft.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"aircraft/{registration}/last_flight"
+        return ENDPOINTS["history/aircraft/{registration}/last_flight"].get(
+            self.api_caller, registration, timeout=timeout
+        )
+
+    def last_flights_bulk(
+        self,
+        registrations: Iterable[str],
+        concurrency: int = 8,
+        ordered: bool = True,
+        timeout: Optional[float] = None,
+    ) -> List[BulkResult]:
+        """
+        Retrieves the last flight of many aircraft concurrently.
+
+        Args:
+            registrations (Iterable[str]): The registrations of the aircraft.
+            concurrency (int): Optional, the maximum number of requests in flight
+            (default 8).
+            ordered (bool): Optional, whether to return results in input order
+            rather than completion order (default True).
+            timeout (float): Optional, the time budget of all the lookups together,
+            in seconds (default None).
+
+        Returns:
+            List[BulkResult]: One `(item, result, error)` entry per registration.
+        """
+        return self.api_caller.map_concurrent(
+            self.last_flight, registrations, concurrency, ordered, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def flight_info(
         self,
@@ -145,6 +213,7 @@ class History:
         end: Optional[int] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about a specific flight or set of flights.
@@ -156,18 +225,57 @@ class History:
             end (int): Optional, the end time of the search in seconds since epoch (default None).
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {
-            "ident_type": ident_type,
-            "start": start,
-            "end": end,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"flights/{ident}", query=query
+        return ENDPOINTS["history/flights/{ident}"].get(
+            self.api_caller,
+            ident,
+            ident_type=ident_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_flight_info(
+        self,
+        ident: str,
+        ident_type: Optional[str] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields a specific flight or set of flights, following pagination cursors.
+
+        Args:
+            ident (str): The identifier of the flight or set of flights.
+            ident_type (str): Optional, the type of identifier (default None).
+            start (int): Optional, the start time of the search in seconds since epoch (default None).
+            end (int): Optional, the end time of the search in seconds since epoch (default None).
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `flights` list. With an `AsyncAPICaller` this is an
+            async generator.
+        """
+        return ENDPOINTS["history/flights/{ident}"].iter_records(
+            self.api_caller,
+            ident,
+            ident_type=ident_type,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
@@ -0,0 +1,72 @@
+import json
+from typing import Any, Callable, Dict, Union
+
+Decoder = Callable[[bytes], Any]
+
+
+def _orjson() -> Decoder:
+    import orjson
+
+    return orjson.loads
+
+
+def _msgspec() -> Decoder:
+    import msgspec
+
+    decode = msgspec.json.Decoder().decode
+
+    def loads(data: bytes) -> Any:
+        # Surface decode errors as ValueError, like the other decoders.
+        try:
+            return decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return loads
+
+
+def _stdlib() -> Decoder:
+    return json.loads
+
+
+DECODERS: Dict[str, Callable[[], Decoder]] = {
+    "orjson": _orjson,
+    "msgspec": _msgspec,
+    "json": _stdlib,
+}
+
+# The decoders tried by "auto", fastest first.
+PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_decoder(decoder: Union[str, Decoder] = "auto") -> Decoder:
+    """
+    Resolves a JSON decoder that parses response bodies directly from bytes.
+
+    Args:
+        decoder (str or callable): Optional, `"auto"` for the fastest installed
+        decoder, the name of a decoder (`"orjson"`, `"msgspec"` or `"json"`), or
+        a callable taking the body bytes (default `"auto"`).
+
+    Returns:
+        callable: A function parsing JSON bytes and raising ValueError on
+        malformed input.
+
+    Raises:
+        ImportError: If the named decoder is not installed.
+        ValueError: If the name is unknown.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        for name in PREFERENCE:
+            try:
+                return DECODERS[name]()
+            except ImportError:
+                continue
+    if decoder not in DECODERS:
+        raise ValueError(
+            f"Unknown JSON decoder {decoder!r}; expected one of "
+            f"{', '.join(('auto',) + tuple(DECODERS))}"
+        )
+    return DECODERS[decoder]()
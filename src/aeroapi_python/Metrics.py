@@ -0,0 +1,549 @@
+import math
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aeroapi_python.Endpoints import literal_segments
+
+# Path segments that name a resource rather than identify one. Every other
+# segment (airport codes, flight IDs, idents, dates...) becomes `{id}` in
+# endpoint templates.
+LITERAL_SEGMENTS = frozenset(literal_segments())
+
+# The upper bounds, in seconds, of the Prometheus histogram buckets.
+PROMETHEUS_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+Hook = Callable[["RequestInfo"], None]
+
+
+@lru_cache(maxsize=4096)
+def _template(path: str) -> str:
+    return "/".join(
+        segment if segment in LITERAL_SEGMENTS else "{id}"
+        for segment in path.strip("/").split("/")
+    )
+
+
+def endpoint_template(url: str, base_url: str = "") -> str:
+    """
+    Returns the endpoint template of a request URL, such as
+    `airports/{id}/flights/scheduled_departures`.
+
+    Args:
+        url (str): The request URL or path.
+        base_url (str): Optional, the API base URL to strip from `url`.
+
+    Returns:
+        str: The path relative to the API root, without its query string, with
+        identifiers replaced by `{id}`.
+    """
+    if base_url and url.startswith(base_url):
+        url = url[len(base_url) :]
+    elif "://" in url:
+        url = url.split("://", 1)[1].partition("/")[2]
+    return _template(url.split("?", 1)[0])
+
+
+class RequestInfo:
+    """
+    What happened during one API call, as passed to request hooks.
+
+    Before-request hooks receive it once the URL is known and may add entries to
+    `headers`, such as tracing headers; after-request hooks receive it filled
+    in, whether the call succeeded, failed, was served from the cache or shared
+    the result of an identical call in flight (`coalesced`). Streamed responses
+    are not reported.
+
+    Calls made through the endpoint table carry the template of their entry;
+    for other calls it is derived from the URL when a hook first reads it, so
+    calls made without hooks do not pay for it.
+
+    Timings are in seconds. `requests` does not expose DNS resolution or
+    connection setup, so `connect` is only measured by `AsyncAPICaller`, where
+    it includes DNS resolution and the TLS handshake; it is None when a pooled
+    connection was reused.
+
+    Attributes:
+        method (str): The HTTP method.
+        url (str): The request URL.
+        endpoint (str): The endpoint template, such as `flights/{id}`.
+        headers (dict): The extra headers to send, for before-request hooks.
+        status (int): The HTTP status of the last attempt, or None.
+        attempts (int): The number of attempts made (0 for a cache hit).
+        cache_hit (bool): Whether the response cache answered the call.
+        coalesced (bool): Whether the call waited for an identical call in
+        flight and shared its result; it sent no request of its own.
+        revalidated (bool): Whether a 304 response reused a remembered body.
+        response_bytes (int): The size of the last response body.
+        connect (float): The time to open the connection, or None.
+        ttfb (float): The time from sending the last attempt to its response
+        headers, or None.
+        parse (float): The time spent decoding the body, or None.
+        total (float): The time of the whole call, retries included.
+        error (Exception): The error that failed the call, or None.
+        started (float): The start of the call, in seconds since the epoch.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "_endpoint",
+        "_base_url",
+        "headers",
+        "status",
+        "attempts",
+        "cache_hit",
+        "coalesced",
+        "revalidated",
+        "response_bytes",
+        "connect",
+        "ttfb",
+        "parse",
+        "total",
+        "error",
+        "started",
+        "_start",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        endpoint: Optional[str] = None,
+        base_url: str = "",
+    ) -> None:
+        """
+        Initializes a `RequestInfo` instance.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            endpoint (str): Optional, the endpoint template (default None, derived
+            from `url` when first read).
+            base_url (str): Optional, the API base URL to strip from `url` when
+            deriving the template.
+        """
+        self.method = method
+        self.url = url
+        self._endpoint = endpoint
+        self._base_url = base_url
+        self.headers: Dict[str, Any] = {}
+        self.status: Optional[int] = None
+        self.attempts = 0
+        self.cache_hit = False
+        self.coalesced = False
+        self.revalidated = False
+        self.response_bytes = 0
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.parse: Optional[float] = None
+        self.total = 0.0
+        self.error: Optional[Exception] = None
+        self.started = time.time()
+        self._start = time.perf_counter()
+
+    @property
+    def endpoint(self) -> str:
+        if self._endpoint is None:
+            self._endpoint = endpoint_template(self.url, self._base_url)
+        return self._endpoint
+
+    @endpoint.setter
+    def endpoint(self, value: str) -> None:
+        self._endpoint = value
+
+    def finish(self) -> None:
+        """
+        Records the total time of the call.
+        """
+        self.total = time.perf_counter() - self._start
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo({self.method} {self.endpoint}, status={self.status}, "
+            f"attempts={self.attempts}, cache_hit={self.cache_hit}, "
+            f"coalesced={self.coalesced}, "
+            f"total={self.total:.4f})"
+        )
+
+
+class LatencyHistogram:
+    """
+    A latency histogram with logarithmic bins, accurate to `PRECISION`.
+
+    Quantiles are read from bins whose width grows geometrically, so their
+    relative error is bounded whatever the range of latencies, and memory only
+    grows with the number of distinct bins hit. Counts per Prometheus bucket are
+    kept alongside for export.
+
+    Attributes:
+        count (int): The number of values recorded.
+        sum (float): The sum of the values recorded.
+        max (float): The largest value recorded.
+
+    Methods:
+        record(value: float) -> None:
+            Records a value.
+
+        quantile(q: float) -> float:
+            Returns an estimate of the `q` quantile.
+
+        cumulative_buckets() -> List[Tuple[float, int]]:
+            Returns the cumulative counts per Prometheus bucket.
+    """
+
+    PRECISION = 0.02
+    MIN_VALUE = 1e-6
+
+    __slots__ = ("count", "sum", "max", "_bins", "_buckets")
+
+    _LOG_GROWTH = math.log1p(PRECISION)
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._bins: Dict[int, int] = {}
+        self._buckets = [0] * (len(PROMETHEUS_BUCKETS) + 1)
+
+    def record(self, value: float) -> None:
+        """
+        Records a value.
+
+        Args:
+            value (float): The value, in seconds.
+        """
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+        index = 0
+        if value > self.MIN_VALUE:
+            index = int(math.log(value / self.MIN_VALUE) / self._LOG_GROWTH)
+        self._bins[index] = self._bins.get(index, 0) + 1
+        self._buckets[bisect_left(PROMETHEUS_BUCKETS, value)] += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Returns an estimate of the `q` quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1, such as 0.99.
+
+        Returns:
+            float: The upper bound of the bin holding the quantile, at most `max`,
+            or 0 if nothing was recorded.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index in sorted(self._bins):
+            seen += self._bins[index]
+            if seen >= rank:
+                bound = self.MIN_VALUE * math.exp((index + 1) * self._LOG_GROWTH)
+                return min(bound, self.max)
+        return self.max
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """
+        Returns the cumulative counts per Prometheus bucket.
+
+        Returns:
+            List[Tuple[float, int]]: `(upper bound, count)` pairs, ending with
+            `(inf, count)`.
+        """
+        total = 0
+        buckets = []
+        for bound, count in zip(PROMETHEUS_BUCKETS + (math.inf,), self._buckets):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class _EndpointStats:
+    __slots__ = (
+        "latency",
+        "statuses",
+        "errors",
+        "retries",
+        "cache_hits",
+        "coalesced",
+        "bytes",
+    )
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.statuses: Dict[int, int] = {}
+        self.errors = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.bytes = 0
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class MetricsCollector:
+    """
+    An in-memory aggregator of request metrics, keyed by method and endpoint
+    template.
+
+    Register it as an after-request hook:
+    `APICaller(..., after_request=[metrics])`. Latencies are only recorded for
+    calls that reached the API; cache hits and coalesced calls are counted
+    separately so that they do not hide upstream latency.
+
+    Methods:
+        quantile(endpoint: str, q: float, method: str = "GET") -> float:
+            Returns a latency quantile of an endpoint.
+
+        snapshot() -> Dict[str, Dict[str, float]]:
+            Returns a summary of every endpoint.
+
+        to_prometheus(prefix: str = "aeroapi_client") -> str:
+            Renders the metrics in the Prometheus text exposition format.
+
+        reset() -> None:
+            Forgets everything recorded so far.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a `MetricsCollector` instance.
+        """
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, info: RequestInfo) -> None:
+        """
+        Records a finished call.
+
+        Args:
+            info (RequestInfo): The call.
+        """
+        key = (info.method, info.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats()
+            if info.cache_hit:
+                stats.cache_hits += 1
+                return
+            if info.coalesced:
+                stats.coalesced += 1
+                return
+            stats.latency.record(info.total)
+            stats.retries += max(0, info.attempts - 1)
+            stats.bytes += info.response_bytes
+            if info.status is not None:
+                stats.statuses[info.status] = stats.statuses.get(info.status, 0) + 1
+            if info.error is not None:
+                stats.errors += 1
+
+    def quantile(self, endpoint: str, q: float, method: str = "GET") -> float:
+        """
+        Returns a latency quantile of an endpoint.
+
+        Args:
+            endpoint (str): The endpoint template, such as `flights/{id}`.
+            q (float): The quantile, between 0 and 1, such as 0.99.
+            method (str): Optional, the HTTP method (default GET).
+
+        Returns:
+            float: The latency in seconds, or 0 if the endpoint was not called.
+        """
+        with self._lock:
+            stats = self._stats.get((method, endpoint))
+            return stats.latency.quantile(q) if stats is not None else 0.0
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns a summary of every endpoint.
+
+        Returns:
+            dict: By `"METHOD endpoint"`, the `count`, `errors`, `retries`,
+            `cache_hits`, `coalesced`, `bytes`, `mean`, `p50`, `p90`, `p99` and
+            `max`, with latencies in seconds.
+        """
+        with self._lock:
+            summary = {}
+            for (method, endpoint), stats in sorted(self._stats.items()):
+                latency = stats.latency
+                summary[f"{method} {endpoint}"] = {
+                    "count": latency.count,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "cache_hits": stats.cache_hits,
+                    "coalesced": stats.coalesced,
+                    "bytes": stats.bytes,
+                    "mean": latency.sum / latency.count if latency.count else 0.0,
+                    "p50": latency.quantile(0.5),
+                    "p90": latency.quantile(0.9),
+                    "p99": latency.quantile(0.99),
+                    "max": latency.max,
+                }
+            return summary
+
+    def to_prometheus(self, prefix: str = "aeroapi_client") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Optional, the prefix of the metric names (default
+            `aeroapi_client`).
+
+        Returns:
+            str: The request duration histograms and the request, error, retry,
+            cache hit, coalesced call and response byte counters.
+        """
+        duration = f"{prefix}_request_duration_seconds"
+        lines = [
+            f"# HELP {duration} Duration of AeroAPI calls, retries included.",
+            f"# TYPE {duration} histogram",
+        ]
+        counters: Dict[str, List[str]] = {
+            "requests_total": [],
+            "errors_total": [],
+            "retries_total": [],
+            "cache_hits_total": [],
+            "coalesced_total": [],
+            "response_bytes_total": [],
+        }
+        with self._lock:
+            for (method, endpoint), stats in sorted(self._stats.items()):
+                labels = {"method": method, "endpoint": endpoint}
+                for bound, count in stats.latency.cumulative_buckets():
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f"{duration}_bucket{_labels(**labels, le=le)} {count}")
+                lines.append(f"{duration}_sum{_labels(**labels)} {stats.latency.sum}")
+                lines.append(
+                    f"{duration}_count{_labels(**labels)} {stats.latency.count}"
+                )
+                for status, count in sorted(stats.statuses.items()):
+                    counters["requests_total"].append(
+                        f"{_labels(**labels, status=status)} {count}"
+                    )
+                for name, value in (
+                    ("errors_total", stats.errors),
+                    ("retries_total", stats.retries),
+                    ("cache_hits_total", stats.cache_hits),
+                    ("coalesced_total", stats.coalesced),
+                    ("response_bytes_total", stats.bytes),
+                ):
+                    counters[name].append(f"{_labels(**labels)} {value}")
+        for name, samples in counters.items():
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            lines.extend(f"{prefix}_{name}{sample}" for sample in samples)
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Forgets everything recorded so far.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A copy in another process records its own calls from scratch.
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._after_fork()
+
+    def _after_fork(self) -> None:
+        """
+        Forgets the parent's metrics in a forked child and replaces the lock.
+        """
+        self._stats = {}
+        self._lock = threading.Lock()
+
+
+class OpenTelemetryExporter:
+    """
+    An after-request hook that records calls as OpenTelemetry metrics.
+
+    Requires the `opentelemetry-api` package; the SDK and exporter configured
+    by the application decide where the metrics go.
+
+    Attributes:
+        duration (Histogram): The `aeroapi.client.request.duration` histogram.
+        response_size (Histogram): The `aeroapi.client.response.size` histogram.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        """
+        Initializes an `OpenTelemetryExporter` instance.
+
+        Args:
+            meter (Meter): Optional, the meter to create instruments with
+            (defaults to the global meter provider's `aeroapi_python` meter).
+
+        Raises:
+            ImportError: If `opentelemetry-api` is not installed.
+        """
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetryExporter requires opentelemetry-api; install it "
+                    "with `pip install aeroapi-python[otel]`"
+                ) from e
+            meter = metrics.get_meter("aeroapi_python")
+        self.duration = meter.create_histogram(
+            "aeroapi.client.request.duration",
+            unit="s",
+            description="Duration of AeroAPI calls, retries included.",
+        )
+        self.response_size = meter.create_histogram(
+            "aeroapi.client.response.size",
+            unit="By",
+            description="Size of AeroAPI response bodies.",
+        )
+
+    def __call__(self, info: RequestInfo) -> None:
+        """
+        Records a finished call. Like `MetricsCollector`, calls answered by the
+        response cache or shared with an identical call in flight are left out,
+        as they sent no request.
+
+        Args:
+            info (RequestInfo): The call.
+        """
+        if info.cache_hit or info.coalesced:
+            return
+        attributes = {
+            "http.request.method": info.method,
+            "url.template": info.endpoint,
+            "aeroapi.attempts": info.attempts,
+        }
+        if info.status is not None:
+            attributes["http.response.status_code"] = info.status
+        if info.error is not None:
+            attributes["error.type"] = type(info.error).__name__
+        self.duration.record(info.total, attributes)
+        self.response_size.record(info.response_bytes, attributes)
@@ -1,17 +1,21 @@
-from typing import Optional, Dict, Any
-from aeroapi_python.APICaller import APICaller
+from typing import Any, Dict, Iterator, Optional
+from aeroapi_python.APICaller import BaseAPICaller
+from aeroapi_python.Endpoints import ENDPOINTS
 
 
 class Miscellaneous:
     """
     A class for interacting with miscellaneous FlightAware AeroAPI.
 
+    Every method that calls the API also takes an optional `timeout`, the time
+    budget of the call (or of the whole iteration or bulk lookup) in seconds.
+
     Attributes:
         api_caller (APICaller): An instance of the `APICaller` class.
         endpoint (str): The API endpoint for miscellaneous APIs.
 
     Methods:
-        __init__(self, api_caller: APICaller) -> None:
+        __init__(self, api_caller: BaseAPICaller) -> None:
             Initializes a `Miscellaneous` instance.
 
         aircraft_owner(self, ident: str) -> Optional[Dict[str, Any]]:
@@ -32,45 +36,56 @@ class Miscellaneous:
                            flight_number: Optional[str] = None, include_codeshares: bool = True,
                            include_regional: bool = True, max_pages: int = 1, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
             Retrieves scheduled flights for a specific time period and set of filters.
+
+        iter_global_disruption_counts(...) / iter_scheduled_flights(...) -> Iterator[Dict[str, Any]]:
+            Lazily yield the records of the paginated methods above across pages.
     """
 
-    def __init__(self, api_caller: APICaller) -> None:
+    def __init__(self, api_caller: BaseAPICaller) -> None:
         """
         Initializes a `Miscellaneous` instance.
 
         Args:
-            api_caller (APICaller): An instance of the `APICaller` class.
+            api_caller (BaseAPICaller): An instance of `APICaller` or `AsyncAPICaller`.
         """
         self.api_caller = api_caller
         self.endpoint = ""
 
-    def aircraft_owner(self, ident: str) -> Optional[Dict[str, Any]]:
+    def aircraft_owner(
+        self, ident: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the owner of a specific aircraft.
 
         Args:
             ident (str): The identifier of the aircraft.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path("aircraft", sub_path=f"{ident}/owner")
-        return self.api_caller.get(path)
+        return ENDPOINTS["aircraft/{ident}/owner"].get(
+            self.api_caller, ident, timeout=timeout
+        )
 
-    def aircraft_type(self, aircraft_type: str) -> Optional[Dict[str, Any]]:
+    def aircraft_type(
+        self, aircraft_type: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves information about a specific aircraft type.
 
         Args:
             aircraft_type (str): The name of the aircraft type.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path(
-            "aircraft", sub_path=f"types/{aircraft_type}"
+        return ENDPOINTS["aircraft/types/{aircraft_type}"].get(
+            self.api_caller, aircraft_type, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def global_disruption_counts(
         self,
@@ -78,6 +93,7 @@ class Miscellaneous:
         time_period: str = "today",
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves global disruption counts for a specific entity type.
@@ -87,18 +103,60 @@ class Miscellaneous:
             time_period (str): Optional, the time period to retrieve disruption counts for (default 'today').
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"time_period": time_period, "max_pages": max_pages, "cursor": cursor}
-        path = self.api_caller._build_path(
-            "disruption_counts", sub_path=f"{entity_type}", query=query
+        return ENDPOINTS["disruption_counts/{entity_type}"].get(
+            self.api_caller,
+            entity_type,
+            time_period=time_period,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_global_disruption_counts(
+        self,
+        entity_type: str,
+        time_period: str = "today",
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields global disruption counts for a specific entity type, following
+        pagination cursors.
+
+        Args:
+            entity_type (str): The type of entity to retrieve disruption counts for.
+            time_period (str): Optional, the time period to retrieve disruption counts for (default 'today').
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `entities` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["disruption_counts/{entity_type}"].iter_records(
+            self.api_caller,
+            entity_type,
+            time_period=time_period,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def disruption_counts(
-        self, entity_type: str, entity_id: str, time_period: str = "today"
+        self,
+        entity_type: str,
+        entity_id: str,
+        time_period: str = "today",
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves disruption counts for a specific entity.
@@ -107,15 +165,19 @@ class Miscellaneous:
             entity_type (str): The type of entity to retrieve disruption counts for.
             entity_id (str): The identifier of the entity to retrieve disruption counts for.
             time_period (str): Optional, the time period to retrieve disruption counts for (default 'today').
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"time_period": time_period}
-        path = self.api_caller._build_path(
-            "disruption_counts", sub_path=f"{entity_type}/{entity_id}", query=query
+        return ENDPOINTS["disruption_counts/{entity_type}/{entity_id}"].get(
+            self.api_caller,
+            entity_type,
+            entity_id,
+            time_period=time_period,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
 
     def scheduled_flights(
         self,
@@ -129,6 +191,7 @@ class Miscellaneous:
         include_regional: bool = True,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves scheduled flights for a specific time period and set of filters.
@@ -144,21 +207,74 @@ class Miscellaneous:
             include_regional (bool): Optional, whether to include regional flights (default True).
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {
-            "origin": origin,
-            "destination": destination,
-            "airline": airline,
-            "flight_number": flight_number,
-            "include_codeshares": include_codeshares,
-            "include_regional": include_regional,
-            "max_pages": max_pages,
-            "cursor": cursor,
-        }
-        path = self.api_caller._build_path(
-            "schedules", sub_path=f"{date_start}/{date_end}", query=query
+        return ENDPOINTS["schedules/{date_start}/{date_end}"].get(
+            self.api_caller,
+            date_start,
+            date_end,
+            origin=origin,
+            destination=destination,
+            airline=airline,
+            flight_number=flight_number,
+            include_codeshares=include_codeshares,
+            include_regional=include_regional,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_scheduled_flights(
+        self,
+        date_start: str,
+        date_end: str,
+        origin: Optional[str] = None,
+        destination: Optional[str] = None,
+        airline: Optional[str] = None,
+        flight_number: Optional[str] = None,
+        include_codeshares: bool = True,
+        include_regional: bool = True,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields scheduled flights for a specific time period and set of filters,
+        following pagination cursors.
+
+        Args:
+            date_start (str): The start date of the search in YYYY-MM-DD format.
+            date_end (str): The end date of the search in YYYY-MM-DD format.
+            origin (str): Optional, the origin airport code.
+            destination (str): Optional, the destination airport code.
+            airline (str): Optional, the airline code.
+            flight_number (str): Optional, the flight number.
+            include_codeshares (bool): Optional, whether to include codeshare flights (default True).
+            include_regional (bool): Optional, whether to include regional flights (default True).
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `scheduled` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["schedules/{date_start}/{date_end}"].iter_records(
+            self.api_caller,
+            date_start,
+            date_end,
+            origin=origin,
+            destination=destination,
+            airline=airline,
+            flight_number=flight_number,
+            include_codeshares=include_codeshares,
+            include_regional=include_regional,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
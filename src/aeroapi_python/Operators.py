@@ -1,17 +1,21 @@
-from typing import Optional, Dict, Any
-from aeroapi_python.APICaller import APICaller
+from typing import Any, Dict, Iterator, Optional
+from aeroapi_python.APICaller import BaseAPICaller
+from aeroapi_python.Endpoints import ENDPOINTS
 
 
 class Operators:
     """
     A class for interacting with the FlightAware AeroAPI Operators API.
 
+    Every method that calls the API also takes an optional `timeout`, the time
+    budget of the call (or of the whole iteration or bulk lookup) in seconds.
+
     Attributes:
         api_caller (APICaller): An instance of the `APICaller` class.
         endpoint (str): The API endpoint for the Operators API.
 
     Methods:
-        __init__(self, api_caller: APICaller) -> None:
+        __init__(self, api_caller: BaseAPICaller) -> None:
             Initializes an `Operators` instance.
 
         get_all_operators(self, max_pages: int = 1, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -26,20 +30,29 @@ class Operators:
         get_operator_flights(self, operator_id: str, start: Optional[str] = None, end: Optional[str] = None,
                               max_pages: int = 1, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
             Retrieves recent and upcoming flights for a specific operator.
+
+        iter_all_operators(...) / iter_operator_flights(...) -> Iterator[Dict[str, Any]]:
+            Lazily yield the records of the paginated methods above across pages.
+
+        stream_operator_flights(...) -> Iterator[Dict[str, Any]]:
+            Yields operator flights while each response is still downloading.
     """
 
-    def __init__(self, api_caller: APICaller) -> None:
+    def __init__(self, api_caller: BaseAPICaller) -> None:
         """
         Initializes an `Operators` instance.
 
         Args:
-            api_caller (APICaller): An instance of the `APICaller` class.
+            api_caller (BaseAPICaller): An instance of `APICaller` or `AsyncAPICaller`.
         """
         self.api_caller = api_caller
         self.endpoint = "operators"
 
     def get_all_operators(
-        self, max_pages: int = 1, cursor: Optional[str] = None
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves a list of operator references.
@@ -47,29 +60,62 @@ class Operators:
         Args:
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"max_pages": max_pages, "cursor": cursor}
-        path = self.api_caller._build_path(self.endpoint, query=query)
-        return self.api_caller.get(path)
+        return ENDPOINTS["operators"].get(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
+        )
+
+    def iter_all_operators(
+        self,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields operator references, following pagination cursors.
+
+        Args:
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `operators` list. With an `AsyncAPICaller` this is
+            an async generator.
+        """
+        return ENDPOINTS["operators"].iter_records(
+            self.api_caller, max_pages=max_pages, cursor=cursor, timeout=timeout
+        )
 
-    def get_operator_info(self, operator_id: str) -> Optional[Dict[str, Any]]:
+    def get_operator_info(
+        self, operator_id: str, timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Retrieves static information for a specific operator.
 
         Args:
             operator_id (str): The ICAO or IATA identifier for the operator.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        path = self.api_caller._build_path(self.endpoint, sub_path=operator_id)
-        return self.api_caller.get(path)
+        return ENDPOINTS["operators/{operator_id}"].get(
+            self.api_caller, operator_id, timeout=timeout
+        )
 
     def get_canonical_code(
-        self, operator_id: str, country_code: Optional[str] = None
+        self,
+        operator_id: str,
+        country_code: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves the canonical code for a specific operator.
@@ -77,16 +123,15 @@ class Operators:
         Args:
             operator_id (str): The ICAO or IATA identifier for the operator.
             country_code (str): Optional, an ISO 3166-1 alpha-2 country code.
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        sub_path = f"{operator_id}/canonical"
-        query = {"country_code": country_code}
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=sub_path, query=query
+        return ENDPOINTS["operators/{operator_id}/canonical"].get(
+            self.api_caller, operator_id, country_code=country_code, timeout=timeout
         )
-        return self.api_caller.get(path)
 
     def get_operator_flights(
         self,
@@ -95,6 +140,7 @@ class Operators:
         end: Optional[str] = None,
         max_pages: int = 1,
         cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieves recent and upcoming flights for a specific operator.
@@ -105,12 +151,93 @@ class Operators:
             end (str): Optional, the ending date range for flight results in ISO8601 format.
             max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
             cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the call in seconds,
+            retries included (default None).
 
         Returns:
             dict: The parsed JSON response, or None if the request failed.
         """
-        query = {"start": start, "end": end, "max_pages": max_pages, "cursor": cursor}
-        path = self.api_caller._build_path(
-            self.endpoint, sub_path=f"{operator_id}/flights", query=query
+        return ENDPOINTS["operators/{operator_id}/flights"].get(
+            self.api_caller,
+            operator_id,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def iter_operator_flights(
+        self,
+        operator_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields recent and upcoming flights for a specific operator, following
+        pagination cursors.
+
+        Args:
+            operator_id (str): The ICAO or IATA identifier for the operator.
+            start (str): Optional, the starting date range for flight results in ISO8601 format.
+            end (str): Optional, the ending date range for flight results in ISO8601 format.
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `scheduled`, `arrivals` and `enroute` lists, in
+            that order for each page. With an `AsyncAPICaller` this is an async
+            generator.
+        """
+        return ENDPOINTS["operators/{operator_id}/flights"].iter_records(
+            self.api_caller,
+            operator_id,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
+        )
+
+    def stream_operator_flights(
+        self,
+        operator_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        max_pages: int = 1,
+        cursor: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yields recent and upcoming flights for a specific operator while each
+        response is still downloading, keeping memory bounded for large
+        `max_pages` values.
+
+        Args:
+            operator_id (str): The ICAO or IATA identifier for the operator.
+            start (str): Optional, the starting date range for flight results in ISO8601 format.
+            end (str): Optional, the ending date range for flight results in ISO8601 format.
+            max_pages (int): Optional, the maximum number of pages to retrieve (default 1).
+            cursor (str): Optional, a cursor for pagination (default None).
+            timeout (float): Optional, the time budget of the whole iteration in
+            seconds (default None).
+
+        Yields:
+            dict: Each record of the `scheduled`, `arrivals` and `enroute` lists, in
+            the order they appear in each response. With an `AsyncAPICaller` this
+            is an async generator.
+        """
+        return ENDPOINTS["operators/{operator_id}/flights"].stream_records(
+            self.api_caller,
+            operator_id,
+            start=start,
+            end=end,
+            max_pages=max_pages,
+            cursor=cursor,
+            timeout=timeout,
         )
-        return self.api_caller.get(path)
@@ -0,0 +1,94 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Callable, Iterable, List, Optional
+
+from aeroapi_python.APICaller import BulkResult, _last_error
+
+# The pickled client of this worker process, and the client built from it on
+# first use.
+_client_state: Optional[bytes] = None
+_client: Any = None
+
+
+def _init_worker(state: bytes) -> None:
+    global _client_state, _client
+    _client_state, _client = state, None
+
+
+def worker_client() -> Any:
+    """
+    Returns the client of the current `process_map` worker, unpickling it on
+    first use.
+
+    Returns:
+        Any: The worker's copy of the client passed to `process_map`.
+
+    Raises:
+        RuntimeError: If called outside a `process_map` worker.
+    """
+    global _client
+    if _client is None:
+        if _client_state is None:
+            raise RuntimeError("worker_client() is only available in process_map")
+        _client = pickle.loads(_client_state)
+    return _client
+
+
+def _call(fn: Callable[[Any, Any], Any], item: Any) -> BulkResult:
+    _last_error.set(None)
+    try:
+        result = fn(worker_client(), item)
+    except Exception as e:
+        return BulkResult(item, None, e)
+    return BulkResult(item, result, None if result is not None else _last_error.get())
+
+
+def process_map(
+    fn: Callable[[Any, Any], Any],
+    items: Iterable[Any],
+    client: Any,
+    processes: Optional[int] = None,
+    ordered: bool = True,
+    chunksize: int = 1,
+    mp_context: Any = None,
+) -> List[BulkResult]:
+    """
+    Calls `fn(client, item)` for every item on a pool of worker processes.
+
+    The client, such as an `AeroAPI` or `APICaller`, is pickled once; each
+    worker unpickles its own copy the first time it needs it, with its own
+    connection pool and empty caches. Use it to spread CPU-heavy processing of
+    responses over every core. Use a `FileRateLimiter` to share a rate limit
+    between the workers, as each copy of a `RateLimiter` has a budget of its
+    own.
+
+    Args:
+        fn (callable): A picklable (module-level) function taking the worker's
+        client and an item. Its result must be picklable.
+        items (Iterable[Any]): The items to process.
+        client (Any): The client to give to `fn` in each worker.
+        processes (int): Optional, the number of worker processes (defaults to
+        the number of CPUs).
+        ordered (bool): Optional, whether to return results in input order
+        rather than completion order (default True).
+        chunksize (int): Optional, the number of items sent to a worker at a
+        time when `ordered` (default 1).
+        mp_context (multiprocessing.context.BaseContext): Optional, the
+        multiprocessing context, such as `multiprocessing.get_context("spawn")`.
+
+    Returns:
+        List[BulkResult]: One `(item, result, error)` entry per item.
+    """
+    items = list(items)
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        initargs=(pickle.dumps(client),),
+    ) as executor:
+        call = partial(_call, fn)
+        if ordered:
+            return list(executor.map(call, items, chunksize=max(1, chunksize)))
+        futures = [executor.submit(call, item) for item in items]
+        return [future.result() for future in as_completed(futures)]
@@ -0,0 +1,276 @@
+import os
+import struct
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+def _take(
+    tokens: float, updated: float, now: float, rate: float, capacity: float
+) -> Tuple[float, float, float]:
+    """
+    Refills a token bucket up to `now` and reserves one token from it.
+
+    The balance may go negative: a caller that finds the bucket empty still
+    reserves its token and is told how long to wait for it, so concurrent
+    callers queue up behind each other instead of retrying.
+
+    Args:
+        tokens (float): The current token balance.
+        updated (float): The time of the last refill.
+        now (float): The current time.
+        rate (float): The refill rate in tokens per second.
+        capacity (float): The maximum token balance (burst size).
+
+    Returns:
+        tuple: The new balance, the new refill time and the seconds to wait.
+    """
+    tokens = min(capacity, tokens + (now - updated) * rate) - 1.0
+    wait = -tokens / rate if tokens < 0 else 0.0
+    return tokens, now, wait
+
+
+class TokenBucket:
+    """
+    A thread-safe token bucket.
+
+    Attributes:
+        rate (float): The refill rate in tokens per second.
+        capacity (float): The maximum number of tokens (burst size).
+
+    Methods:
+        reserve() -> float:
+            Reserves one token and returns the seconds to wait before using it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a `TokenBucket` instance.
+
+        Args:
+            rate (float): The refill rate in tokens per second.
+            capacity (float): Optional, the burst size (defaults to one second's
+            worth of tokens, at least 1).
+            clock (callable): Optional, the time source (default `time.monotonic`).
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves one token.
+
+        Returns:
+            float: The number of seconds to wait before the token may be used.
+        """
+        with self._lock:
+            self._tokens, self._updated, wait = _take(
+                self._tokens, self._updated, self._clock(), self.rate, self.capacity
+            )
+            return wait
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # A copy in another process has a budget of its own, starting full.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_tokens"] = self.capacity
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the lock in a forked child, where another thread of the parent
+        may have held it.
+        """
+        self._lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    A client-side rate limiter with per-second and per-minute budgets.
+
+    One instance can be shared by any number of threads and by both the
+    synchronous and asynchronous callers; bursts above the budget are delayed
+    rather than sent and rejected with 429.
+
+    Attributes:
+        buckets (List[TokenBucket]): The token buckets every request draws from.
+
+    Methods:
+        reserve() -> float:
+            Reserves a request slot and returns the seconds to wait for it.
+
+        acquire() -> None:
+            Blocks until a request may be sent.
+
+        acquire_async() -> None:
+            Waits, without blocking the event loop, until a request may be sent.
+    """
+
+    def __init__(
+        self,
+        per_second: Optional[float] = None,
+        per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a `RateLimiter` instance.
+
+        Set the budgets to the limits of your AeroAPI tier.
+
+        Args:
+            per_second (float): Optional, the maximum sustained requests per second.
+            per_minute (float): Optional, the maximum requests per minute.
+            burst (float): Optional, the burst size of the per-second budget
+            (defaults to `per_second`).
+            clock (callable): Optional, the time source (default `time.monotonic`).
+        """
+        if per_second is None and per_minute is None:
+            raise ValueError("at least one of per_second or per_minute is required")
+        self.buckets: List[TokenBucket] = []
+        if per_second is not None:
+            self.buckets.append(TokenBucket(per_second, burst, clock=clock))
+        if per_minute is not None:
+            self.buckets.append(TokenBucket(per_minute / 60.0, per_minute, clock=clock))
+
+    def reserve(self) -> float:
+        """
+        Reserves a request slot from every budget.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        return max(bucket.reserve() for bucket in self.buckets)
+
+    def acquire(self) -> None:
+        """
+        Blocks until a request may be sent.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """
+        Waits, without blocking the event loop, until a request may be sent.
+        """
+        import asyncio
+
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the locks of the buckets in a forked child.
+        """
+        for bucket in self.buckets:
+            bucket._after_fork()
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    A `RateLimiter` whose budgets are shared by every process on the host.
+
+    The bucket state lives in a small file guarded by an exclusive `flock`, so
+    all processes pointing at the same path draw from one budget. Requires a
+    POSIX platform.
+
+    Attributes:
+        path (str): The path of the shared state file.
+    """
+
+    _RECORD = struct.Struct("dd")
+
+    def __init__(
+        self,
+        path: str,
+        per_second: Optional[float] = None,
+        per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initializes a `FileRateLimiter` instance.
+
+        Args:
+            path (str): The path of the shared state file; created if missing.
+            per_second (float): Optional, the maximum sustained requests per second.
+            per_minute (float): Optional, the maximum requests per minute.
+            burst (float): Optional, the burst size of the per-second budget
+            (defaults to `per_second`).
+            clock (callable): Optional, the time source; it must be comparable
+            across processes (default `time.time`).
+        """
+        if fcntl is None:
+            raise RuntimeError("FileRateLimiter requires fcntl (a POSIX platform)")
+        super().__init__(per_second, per_minute, burst, clock=clock)
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves a request slot from every budget in the shared state file.
+
+        Returns:
+            float: The number of seconds to wait before sending the request.
+        """
+        size = self._RECORD.size
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                data = os.pread(fd, size * len(self.buckets), 0)
+                now = self._clock()
+                wait = 0.0
+                states = []
+                for i, bucket in enumerate(self.buckets):
+                    if len(data) >= (i + 1) * size:
+                        tokens, updated = self._RECORD.unpack_from(data, i * size)
+                    else:
+                        tokens, updated = bucket.capacity, now
+                    tokens, updated, bucket_wait = _take(
+                        tokens, updated, now, bucket.rate, bucket.capacity
+                    )
+                    states.append(self._RECORD.pack(tokens, updated))
+                    wait = max(wait, bucket_wait)
+                os.pwrite(fd, b"".join(states), 0)
+                return wait
+            finally:
+                os.close(fd)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The budgets live in the file, so every copy keeps sharing them.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        self._lock = threading.Lock()
@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from aeroapi_python.Endpoints import DAY, HOUR, MINUTE, cache_rules
+
+# Ordered (pattern, ttl) rules matched against the request path relative to the
+# API root, without the query string. The first match wins; `*` also matches `/`.
+# They are generated from the `cache_ttl` of each endpoint in `ENDPOINTS`.
+DEFAULT_TTLS: Sequence[Tuple[str, float]] = cache_rules()
+
+
+class ResponseCache:
+    """
+    An in-memory, thread-safe TTL cache of parsed responses with LRU eviction.
+
+    Entries are keyed on the full request URL. How long a response is kept is
+    decided per endpoint by the first matching `(pattern, ttl)` rule; paths
+    without a matching rule use `default_ttl`, and a TTL of 0 disables caching.
+    Cached responses are shared between callers and should not be mutated.
+
+    Attributes:
+        max_entries (int): The maximum number of cached responses.
+        default_ttl (float): The TTL, in seconds, of paths matching no rule.
+        ttls (Sequence[Tuple[str, float]]): The ordered per-endpoint TTL rules.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that missed or found an expired entry.
+
+    Methods:
+        ttl_for(path: str) -> float:
+            Returns the TTL for a request path.
+
+        get(key: str) -> Any:
+            Returns a fresh cached value, or None.
+
+        set(key: str, value: Any, ttl: float) -> None:
+            Stores a value for `ttl` seconds.
+
+        clear() -> None:
+            Removes every entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: float = 0.0,
+        ttls: Optional[Sequence[Tuple[str, float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes a `ResponseCache` instance.
+
+        Args:
+            max_entries (int): Optional, the maximum number of cached responses
+            (default 1024).
+            default_ttl (float): Optional, the TTL of paths matching no rule
+            (default 0, not cached).
+            ttls (Sequence[Tuple[str, float]]): Optional, ordered `(pattern, ttl)`
+            rules (default `DEFAULT_TTLS`).
+            clock (callable): Optional, the time source (default `time.monotonic`).
+        """
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.ttls = tuple(DEFAULT_TTLS if ttls is None else ttls)
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._ttl_memo: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def ttl_for(self, path: str) -> float:
+        """
+        Returns the TTL for a request path.
+
+        Args:
+            path (str): The request path relative to the API root, without the
+            query string (for example `airports/KLAX`).
+
+        Returns:
+            float: The TTL in seconds; 0 means the response is not cached.
+        """
+        ttl = self._ttl_memo.get(path)
+        if ttl is None:
+            ttl = next(
+                (t for pattern, t in self.ttls if fnmatchcase(path, pattern)),
+                self.default_ttl,
+            )
+            if len(self._ttl_memo) < 4 * self.max_entries:
+                self._ttl_memo[path] = ttl
+        return ttl
+
+    def get(self, key: str) -> Any:
+        """
+        Returns a fresh cached value and marks it as recently used.
+
+        Args:
+            key (str): The cache key (the request URL).
+
+        Returns:
+            Any: The cached value, or None on a miss or an expired entry.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Stores a value, evicting the least recently used entries when full.
+
+        Args:
+            key (str): The cache key (the request URL).
+            value (Any): The value to cache.
+            ttl (float): The number of seconds the value stays fresh.
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the configuration is pickled; the copy starts out empty.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state.update(_entries=OrderedDict(), _ttl_memo={}, hits=0, misses=0)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the lock in a forked child, where another thread of the parent
+        may have held it.
+        """
+        self._lock = threading.Lock()
@@ -0,0 +1,165 @@
+import random
+import time
+from typing import Callable, Collection, Optional
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request should be retried.
+
+    Delays grow exponentially (`backoff_factor * 2 ** (attempt - 1)`, capped at
+    `max_backoff`) and are randomly shortened by up to `jitter` of their length
+    so that clients failing together do not retry together. A `Retry-After`
+    header on a retryable response replaces the computed delay; if it asks for
+    longer than `max_retry_after`, the request is not retried.
+
+    Attributes:
+        max_attempts (int): The maximum number of attempts, including the first.
+        backoff_factor (float): The delay before the first retry, in seconds.
+        max_backoff (float): The upper bound of a computed delay, in seconds.
+        jitter (float): The fraction (0-1) of each delay that is randomized.
+        retry_statuses (Collection[int]): The HTTP statuses that are retried.
+        retry_methods (Collection[str]): The HTTP methods that are safe to retry.
+        respect_retry_after (bool): Whether to honor `Retry-After` headers.
+        max_retry_after (float): The longest `Retry-After` delay that is honored.
+
+    Methods:
+        delay_for_status(method: str, attempt: int, status: int, retry_after:
+          Optional[str] = None) -> Optional[float]:
+            Returns the delay before retrying a response, or None to give up.
+
+        delay_for_error(method: str, attempt: int) -> Optional[float]:
+            Returns the delay before retrying a connection error, or None to give up.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: float = 0.5,
+        retry_statuses: Collection[int] = (429, 500, 502, 503, 504),
+        retry_methods: Collection[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        """
+        Initializes a `RetryPolicy` instance.
+
+        Args:
+            max_attempts (int): Optional, the maximum number of attempts including
+            the first one (default 3).
+            backoff_factor (float): Optional, the delay before the first retry in
+            seconds (default 0.5).
+            max_backoff (float): Optional, the cap of a computed delay (default 30).
+            jitter (float): Optional, the fraction of each delay that is
+            randomized (default 0.5).
+            retry_statuses (Collection[int]): Optional, the retryable HTTP statuses
+            (default 429, 500, 502, 503 and 504).
+            retry_methods (Collection[str]): Optional, the idempotent HTTP methods
+            that may be retried (default GET, HEAD, OPTIONS, PUT and DELETE).
+            respect_retry_after (bool): Optional, whether to honor `Retry-After`
+            (default True).
+            max_retry_after (float): Optional, the longest `Retry-After` delay
+            that is honored (default 60).
+            rng (callable): Optional, the random source used for jitter.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self._rng = rng
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Computes the jittered exponential delay after a failed attempt.
+
+        Args:
+            attempt (int): The number of the attempt that failed, starting at 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * self._rng())
+
+    def delay_for_status(
+        self,
+        method: str,
+        attempt: int,
+        status: int,
+        retry_after: Optional[str] = None,
+    ) -> Optional[float]:
+        """
+        Returns the delay before retrying a request that got an HTTP response.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt that failed, starting at 1.
+            status (int): The HTTP status of the response.
+            retry_after (str): Optional, the response's `Retry-After` header.
+
+        Returns:
+            float: The delay in seconds, or None if the request should not be
+            retried.
+        """
+        if status not in self.retry_statuses or not self._can_retry(method, attempt):
+            return None
+        if self.respect_retry_after and retry_after:
+            seconds = self.parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+    def delay_for_error(self, method: str, attempt: int) -> Optional[float]:
+        """
+        Returns the delay before retrying a request that failed to connect or
+        timed out.
+
+        Args:
+            method (str): The HTTP method of the request.
+            attempt (int): The number of the attempt that failed, starting at 1.
+
+        Returns:
+            float: The delay in seconds, or None if the request should not be
+            retried.
+        """
+        if not self._can_retry(method, attempt):
+            return None
+        return self.backoff(attempt)
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        return attempt < self.max_attempts and method.upper() in self.retry_methods
+
+    @staticmethod
+    def parse_retry_after(value: str) -> Optional[float]:
+        """
+        Parses a `Retry-After` header given in seconds or as an HTTP date.
+
+        Args:
+            value (str): The header value.
+
+        Returns:
+            float: The delay in seconds (never negative), or None if the value
+            cannot be parsed.
+        """
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        # HTTP dates are rare, and email.utils is slow to import.
+        from email.utils import parsedate_to_datetime
+
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
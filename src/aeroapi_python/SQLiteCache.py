@@ -0,0 +1,184 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from aeroapi_python.ResponseCache import ResponseCache
+
+
+class SQLiteCache(ResponseCache):
+    """
+    A persistent `ResponseCache` stored in an SQLite database.
+
+    Any number of processes on one host can point at the same file: the
+    database runs in WAL mode so readers never block each other, and every
+    thread and process opens its own connection. Entries expire by TTL like
+    the in-memory cache; once the file holds more than `max_entries` entries
+    or `max_bytes` of JSON, the least recently read entries are evicted.
+
+    Attributes:
+        path (str): The path of the database file.
+        max_entries (int): The maximum number of cached responses.
+        max_bytes (int): The maximum total size of the cached JSON bodies.
+    """
+
+    # Reads refresh an entry's access time at most this often, so that lookups
+    # of hot entries do not turn into a write each time.
+    TOUCH_INTERVAL = 60.0
+    # Size limits are enforced once every this many writes per process.
+    EVICT_INTERVAL = 64
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100_000,
+        max_bytes: int = 256 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        ttls: Optional[Sequence[Tuple[str, float]]] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initializes an `SQLiteCache` instance.
+
+        Args:
+            path (str): The path of the database file; created if missing.
+            max_entries (int): Optional, the maximum number of cached responses
+            (default 100000).
+            max_bytes (int): Optional, the maximum total size of the cached JSON
+            bodies (default 256 MiB).
+            default_ttl (float): Optional, the TTL of paths matching no rule
+            (default 0, not cached).
+            ttls (Sequence[Tuple[str, float]]): Optional, ordered `(pattern, ttl)`
+            rules (default `DEFAULT_TTLS`).
+            clock (callable): Optional, the time source; it must be comparable
+            across processes (default `time.time`).
+        """
+        super().__init__(max_entries, default_ttl, ttls, clock)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Returns this thread's connection, reopening it after a fork.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Any:
+        """
+        Returns a fresh cached value.
+
+        Args:
+            key (str): The cache key (the request URL).
+
+        Returns:
+            Any: The cached value, or None on a miss or an expired entry.
+        """
+        conn = self._connect()
+        now = self._clock()
+        row = conn.execute(
+            "SELECT value, expires, accessed FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            if row is not None:
+                conn.execute(
+                    "DELETE FROM entries WHERE key = ? AND expires <= ?", (key, now)
+                )
+            with self._lock:
+                self.misses += 1
+            return None
+        if now - row[2] > self.TOUCH_INTERVAL:
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        with self._lock:
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """
+        Stores a value, periodically evicting entries beyond the size limits.
+
+        Args:
+            key (str): The cache key (the request URL).
+            value (Any): The JSON-serializable value to cache.
+            ttl (float): The number of seconds the value stays fresh.
+        """
+        body = json.dumps(value, separators=(",", ":"))
+        now = self._clock()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (key, body, len(body), now + ttl, now),
+        )
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.EVICT_INTERVAL == 0
+        if evict:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Removes expired entries, then the least recently read entries until the
+        cache is within `max_entries` and `max_bytes`.
+        """
+        conn = self._connect()
+        conn.execute("DELETE FROM entries WHERE expires <= ?", (self._clock(),))
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        excess_rows = max(0, count - self.max_entries)
+        excess_bytes = total - self.max_bytes
+        doomed: List[Tuple[str]] = []
+        freed = 0
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ):
+            if len(doomed) >= excess_rows and freed >= excess_bytes:
+                break
+            doomed.append((key,))
+            freed += size
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+
+    def clear(self) -> None:
+        """
+        Removes every entry.
+        """
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
@@ -0,0 +1,107 @@
+from typing import Any, Iterable, Tuple, Union
+from urllib.parse import urlencode
+
+# Operators taking a single field name, such as `{null waypoints}`.
+FLAG_OPERATORS = frozenset({"false", "true", "null", "notnull"})
+# Operators taking a field name and values, or values only.
+VALUE_OPERATORS = frozenset(
+    {
+        "=",
+        "!=",
+        "<",
+        ">",
+        "<=",
+        ">=",
+        "match",
+        "notmatch",
+        "range",
+        "in",
+        "orig_or_dest",
+        "airline",
+        "aircraftType",
+        "ident",
+        "ident_or_reg",
+    }
+)
+
+Operators = Iterable[Tuple[str, Any]]
+
+
+class SearchQuery:
+    """
+    A validated flight search query, compiled once to the AeroAPI query syntax.
+
+    Build a `SearchQuery` once and pass it to `Flights.search_flights`,
+    `count_search_flights`, `search_flights_positions` or `get_states` as often
+    as needed: the operators are checked, and the query string and its URL
+    encoding computed, only when the query is created.
+
+    Attributes:
+        operators (Tuple[Tuple[str, Any], ...]): The `(operator, args)` criteria.
+        query_string (str): The compiled query, such as `{= orig KLAX}{range alt 100 200}`.
+        encoded (str): The URL-encoded `query=...` parameter.
+
+    Methods:
+        coerce(query: Union[SearchQuery, Operators]) -> SearchQuery:
+            Returns `query` compiled, reusing it if it already is a `SearchQuery`.
+    """
+
+    __slots__ = ("operators", "query_string", "encoded")
+
+    def __init__(self, operators: Operators) -> None:
+        """
+        Initializes a `SearchQuery` instance.
+
+        Args:
+            operators (Iterable[Tuple[str, Any]]): The search criteria as
+            `(operator, args)` tuples; `args` is a value or a list of values,
+            such as `("=", ["orig", "KLAX"])`.
+
+        Raises:
+            ValueError: If an operator is not supported by AeroAPI.
+        """
+        self.operators = tuple(operators)
+        parts = []
+        for op, args in self.operators:
+            if op in FLAG_OPERATORS:
+                parts.append(f"{{{op} {args}}}")
+            elif op in VALUE_OPERATORS:
+                if isinstance(args, (list, tuple, set)):
+                    args_str = " ".join(map(str, args))
+                else:
+                    args_str = str(args)
+                parts.append(f"{{{op} {args_str}}}")
+            else:
+                raise ValueError(
+                    f"Unknown search operator {op!r}; expected one of "
+                    f"{', '.join(sorted(FLAG_OPERATORS | VALUE_OPERATORS))}"
+                )
+        self.query_string = "".join(parts)
+        self.encoded = urlencode({"query": self.query_string})
+
+    @classmethod
+    def coerce(cls, query: Union["SearchQuery", Operators]) -> "SearchQuery":
+        """
+        Returns `query` compiled, reusing it if it already is a `SearchQuery`.
+
+        Args:
+            query (SearchQuery or Iterable[Tuple[str, Any]]): The query.
+
+        Returns:
+            SearchQuery: The compiled query.
+        """
+        return query if isinstance(query, SearchQuery) else cls(query)
+
+    def __str__(self) -> str:
+        return self.query_string
+
+    def __repr__(self) -> str:
+        return f"SearchQuery({self.query_string!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SearchQuery):
+            return self.query_string == other.query_string
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.query_string)
@@ -0,0 +1,131 @@
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls made from multiple threads.
+
+    While a call for a key is in flight, other threads asking for the same key
+    wait for it and share its result (or exception) instead of repeating it.
+
+    Methods:
+        do(key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+            Runs `fn` unless a call for `key` is already in flight.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes a `SingleFlight` instance.
+        """
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Runs `fn` unless a call for `key` is already in flight.
+
+        Args:
+            key (Hashable): The identity of the call.
+            fn (callable): The call to run.
+
+        Returns:
+            tuple: The result and whether it was shared with another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent identical calls made from coroutines on one event loop.
+
+    The call runs in a task owned by the group rather than by the first caller,
+    so cancelling any caller, including the first, only cancels its own wait;
+    the call carries on for the others.
+
+    Methods:
+        do(key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+            Awaits `fn()` unless a call for `key` is already in flight.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an `AsyncSingleFlight` instance.
+        """
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(
+        self, key: Hashable, fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Awaits `fn()` unless a call for `key` is already in flight.
+
+        Args:
+            key (Hashable): The identity of the call.
+            fn (callable): A function returning the awaitable to run.
+
+        Returns:
+            tuple: The result and whether it was shared with another caller.
+        """
+        import asyncio  # not at module level: sync callers never need it
+
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(call), shared
+
+    def _release(self, key: Hashable, call: "asyncio.Future[Any]") -> None:
+        """
+        Forgets a finished call, marking its exception as retrieved in case
+        every caller was cancelled before it finished.
+
+        Args:
+            key (Hashable): The identity of the call.
+            call (asyncio.Future): The finished call.
+        """
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()
@@ -0,0 +1,218 @@
+import codecs
+import json
+import re
+from typing import Any, Collection, Dict, Iterable, Iterator, Optional, Tuple
+
+# The default number of body bytes read at a time when streaming.
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+_INCOMPLETE = object()
+
+# Parser states.
+_START = "start"
+_FIRST_KEY = "first_key"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_NEXT_FIELD = "next_field"
+_FIRST_ITEM = "first_item"
+_ITEM = "item"
+_NEXT_ITEM = "next_item"
+_DONE = "done"
+
+
+class ArrayStreamParser:
+    """
+    An incremental parser of a JSON object that yields the elements of its
+    top-level arrays as soon as each one has been received.
+
+    Feed the body in chunks of bytes; elements of the arrays named in `keys` are
+    yielded one at a time and never held together, so memory stays bounded by
+    the chunk size and the largest single element. Every other top-level field
+    (such as `links` or `num_pages`) is parsed whole and kept in `rest`.
+
+    Attributes:
+        keys (frozenset): The names of the arrays to stream, or None for all
+        top-level arrays.
+        rest (dict): The other top-level fields parsed so far.
+
+    Methods:
+        feed(chunk: bytes) -> Iterator[Tuple[str, Any]]:
+            Parses a chunk and yields the completed `(key, element)` pairs.
+
+        close() -> Iterator[Tuple[str, Any]]:
+            Parses what is left once the body has ended.
+    """
+
+    # Consumed text is dropped from the buffer once this much has built up.
+    TRIM_SIZE = 1 << 16
+
+    def __init__(self, keys: Optional[Collection[str]] = None) -> None:
+        """
+        Initializes an `ArrayStreamParser` instance.
+
+        Args:
+            keys (Collection[str]): Optional, the top-level arrays to stream
+            (default None, every top-level array).
+        """
+        self.keys = None if keys is None else frozenset(keys)
+        self.rest: Dict[str, Any] = {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+        self._final = False
+        self._retry_size = 0
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[str, Any]]:
+        """
+        Parses a chunk of the body.
+
+        Args:
+            chunk (bytes): The next bytes of the body.
+
+        Yields:
+            tuple: The key of the array and each element completed by this chunk.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        self._buf += self._text.decode(chunk)
+        return self._parse()
+
+    def close(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Parses what is left once the body has ended.
+
+        Yields:
+            tuple: The key of the array and each remaining element.
+
+        Raises:
+            ValueError: If the body is malformed or truncated.
+        """
+        self._buf += self._text.decode(b"", final=True)
+        self._final = True
+        yield from self._parse()
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON document")
+
+    def _value(self) -> Any:
+        """
+        Decodes the complete JSON value at the current position.
+
+        A value is only accepted if text follows it (or the body has ended):
+        a number or literal at the very end of the buffer may continue in the
+        next chunk.
+
+        Returns:
+            Any: The value, or `_INCOMPLETE` if more data is needed.
+        """
+        pending = len(self._buf) - self._pos
+        if not self._final and pending < self._retry_size:
+            return _INCOMPLETE
+        try:
+            value, end = self._raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError as e:
+            if self._final:
+                raise ValueError(f"Invalid JSON: {e}") from e
+            # Wait for the pending text to double before re-parsing, so that a
+            # large value arriving in many chunks is not parsed quadratically.
+            self._retry_size = 2 * pending
+            return _INCOMPLETE
+        if end == len(self._buf) and not self._final:
+            return _INCOMPLETE
+        self._pos = end
+        self._retry_size = 0
+        return value
+
+    def _expect(self, char: str, expected: str) -> None:
+        if self._buf[self._pos] != char:
+            raise ValueError(
+                f"Expected {expected} at offset {self._pos}, "
+                f"found {self._buf[self._pos]!r}"
+            )
+        self._pos += 1
+
+    def _parse(self) -> Iterator[Tuple[str, Any]]:
+        while True:
+            if self._pos > self.TRIM_SIZE:
+                self._buf = self._buf[self._pos :]
+                self._pos = 0
+            found = _NON_WHITESPACE.search(self._buf, self._pos)
+            self._pos = len(self._buf) if found is None else found.start()
+            if self._pos == len(self._buf):
+                return
+            char = self._buf[self._pos]
+            state = self._state
+            if state == _START:
+                self._expect("{", "a JSON object")
+                self._state = _FIRST_KEY
+            elif state in (_FIRST_KEY, _KEY):
+                if state == _FIRST_KEY and char == "}":
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                if char != '"':
+                    self._expect('"', "a field name")
+                key = self._value()
+                if key is _INCOMPLETE:
+                    return
+                self._key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(":", "':'")
+                self._state = _VALUE
+            elif state == _VALUE:
+                if char == "[" and (self.keys is None or self._key in self.keys):
+                    self._pos += 1
+                    self._state = _FIRST_ITEM
+                    continue
+                value = self._value()
+                if value is _INCOMPLETE:
+                    return
+                self.rest[self._key] = value
+                self._state = _NEXT_FIELD
+            elif state == _NEXT_FIELD:
+                self._expect("," if char == "," else "}", "',' or '}'")
+                self._state = _KEY if char == "," else _DONE
+            elif state in (_FIRST_ITEM, _ITEM):
+                if state == _FIRST_ITEM and char == "]":
+                    self._pos += 1
+                    self._state = _NEXT_FIELD
+                    continue
+                item = self._value()
+                if item is _INCOMPLETE:
+                    return
+                self._state = _NEXT_ITEM
+                yield self._key, item
+            elif state == _NEXT_ITEM:
+                self._expect("," if char == "," else "]", "',' or ']'")
+                self._state = _ITEM if char == "," else _NEXT_FIELD
+            else:
+                raise ValueError(f"Unexpected data after the JSON document: {char!r}")
+
+
+def iter_array_items(
+    chunks: Iterable[bytes], keys: Optional[Collection[str]] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the elements of the top-level arrays of a JSON object read in chunks.
+
+    Args:
+        chunks (Iterable[bytes]): The body, in chunks.
+        keys (Collection[str]): Optional, the top-level arrays to stream
+        (default None, every top-level array).
+
+    Yields:
+        tuple: The key of the array and each of its elements, in body order.
+
+    Raises:
+        ValueError: If the body is malformed or truncated.
+    """
+    parser = ArrayStreamParser(keys)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
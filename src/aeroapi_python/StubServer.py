@@ -0,0 +1,313 @@
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
+from urllib.parse import urlencode
+
+# A response as `(status, body)` or `(status, body, headers)`.
+Response = Union[Tuple[int, Any], Tuple[int, Any, Mapping[str, str]]]
+
+
+class _Disconnect(bytes):
+    """
+    A body that is cut short: the connection drops once it has been sent.
+    """
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    """
+    The HTTP server holding the routes and the request log shared by handlers.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, address: Tuple[str, int], routes: Dict[str, Any], delay: float
+    ) -> None:
+        super().__init__(address, _StubHandler)
+        self.routes = routes
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """
+    Serves the responses registered on the server's `routes` mapping.
+    """
+
+    # Keep connections alive like AeroAPI does; without TCP_NODELAY the separate
+    # header and body writes would stall on delayed ACKs.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _respond(self) -> None:
+        server = cast(_StubHTTPServer, self.server)
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        with server.lock:
+            server.requests.append((self.command, self.path, dict(self.headers)))
+            route = server.routes.get(self.path, (404, {"title": "Not found"}))
+            if isinstance(route, list):
+                route = route.pop(0) if len(route) > 1 else route[0]
+        if server.delay:
+            time.sleep(server.delay)
+        status, body, headers = (tuple(route) + ({},))[:3]
+        if isinstance(body, _Disconnect):
+            # Announce more than is sent, then drop the connection mid-body.
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body) + 1024))
+            self.end_headers()
+            self.wfile.write(body)
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        if isinstance(body, bytes):
+            payload = body
+        else:
+            payload = b"" if status == 304 else json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        if status != 304:
+            self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class StubServer:
+    """
+    A local stand-in for AeroAPI that serves recorded or registered responses.
+
+    Routes map a request path, including its query string, to a response or to
+    a list of responses consumed one per request (the last one repeats), which
+    is how cursors, 429s and transient errors are scripted. Unknown paths get a
+    404. Point an `APICaller` at `base_url` to exercise the client, including
+    its pagination, retry and caching paths, without network access.
+
+    Attributes:
+        routes (Dict[str, Union[Response, List[Response]]]): The responses by path.
+        requests (List[Tuple[str, str, dict]]): The method, path and headers of
+        every request received.
+        delay (float): The latency added to every response, in seconds.
+        base_url (str): The URL to pass to `APICaller`, once started.
+
+    Methods:
+        start() -> StubServer:
+            Starts serving on a background thread.
+
+        stop() -> None:
+            Stops the server.
+
+        add_pages(path: str, key: str, records: Sequence[Any], page_size: int, extra: Optional[Mapping[str, Any]] = None) -> List[str]:
+            Registers `records` as cursor-linked pages.
+
+        add_failures(path: str, status: int = 429, count: int = 1, headers: Optional[Mapping[str, str]] = None) -> None:
+            Makes the next `count` requests for a path fail.
+
+        add_disconnects(path: str, prefix: bytes, count: int = 1) -> None:
+            Makes the next `count` responses for a path drop mid-body.
+
+        load(recording: str) -> None:
+            Registers the responses of a recording file.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[Mapping[str, Any]] = None,
+        delay: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initializes a `StubServer` instance.
+
+        Args:
+            routes (Mapping[str, Any]): Optional, the initial routes.
+            delay (float): Optional, the latency added to every response, in
+            seconds (default 0).
+            host (str): Optional, the interface to listen on (default 127.0.0.1).
+            port (int): Optional, the port to listen on (default 0, any free port).
+        """
+        self._server = _StubHTTPServer((host, port), dict(routes or {}), delay)
+        self._thread: Optional[threading.Thread] = None
+        host, port = cast(Tuple[str, int], self._server.server_address[:2])
+        self.base_url = f"http://{host}:{port}/"
+
+    @property
+    def routes(self) -> Dict[str, Any]:
+        return self._server.routes
+
+    @property
+    def requests(self) -> List[Tuple[str, str, Dict[str, str]]]:
+        return self._server.requests
+
+    @property
+    def delay(self) -> float:
+        return self._server.delay
+
+    @delay.setter
+    def delay(self, value: float) -> None:
+        self._server.delay = value
+
+    def start(self) -> "StubServer":
+        """
+        Starts serving on a background thread.
+
+        Returns:
+            StubServer: The server itself.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops the server and closes its socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def add_pages(
+        self,
+        path: str,
+        key: str,
+        records: Sequence[Any],
+        page_size: int,
+        extra: Optional[Mapping[str, Any]] = None,
+    ) -> List[str]:
+        """
+        Registers `records` as pages linked by `links.next` cursors, the way
+        AeroAPI paginates.
+
+        Args:
+            path (str): The path of the first page, such as
+            `/airports/KLAX/flights/arrivals?max_pages=1`.
+            key (str): The name of the list in each page, such as `arrivals`.
+            records (Sequence[Any]): The records to serve.
+            page_size (int): The number of records per page.
+            extra (Mapping[str, Any]): Optional, other fields of every page.
+
+        Returns:
+            List[str]: The path of each page.
+        """
+        base = path.split("?", 1)[0]
+        count = max(1, -(-len(records) // page_size))
+        paths = [path] + [
+            f"{base}?{urlencode({'cursor': f'page{i}'})}" for i in range(1, count)
+        ]
+        for i, page_path in enumerate(paths):
+            page = dict(extra or {})
+            page[key] = list(records[i * page_size : (i + 1) * page_size])
+            page["links"] = {"next": paths[i + 1]} if i + 1 < count else None
+            page["num_pages"] = 1
+            self.routes[page_path] = (200, page)
+        return paths
+
+    def add_failures(
+        self,
+        path: str,
+        status: int = 429,
+        count: int = 1,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """
+        Makes the next `count` requests for a path fail before its registered
+        response is served.
+
+        Args:
+            path (str): The path, including its query string.
+            status (int): Optional, the error status (default 429).
+            count (int): Optional, the number of failing requests (default 1).
+            headers (Mapping[str, str]): Optional, headers of the failures, such
+            as `Retry-After`.
+        """
+        with self._server.lock:
+            route = self.routes.get(path, (404, {"title": "Not found"}))
+            responses = route if isinstance(route, list) else [route]
+            failure = (status, {"title": f"Error {status}"}, dict(headers or {}))
+            self.routes[path] = [failure] * count + responses
+
+    def add_disconnects(self, path: str, prefix: bytes, count: int = 1) -> None:
+        """
+        Makes the next `count` requests for a path receive a 200 whose body
+        stops after `prefix`, as the connection drops, before its registered
+        response is served.
+
+        Args:
+            path (str): The path, including its query string.
+            prefix (bytes): The part of the body sent before the connection drops.
+            count (int): Optional, the number of dropped responses (default 1).
+        """
+        with self._server.lock:
+            route = self.routes.get(path, (404, {"title": "Not found"}))
+            responses = route if isinstance(route, list) else [route]
+            self.routes[path] = [(200, _Disconnect(prefix))] * count + responses
+
+    def load(self, recording: str) -> None:
+        """
+        Registers the responses of a recording file.
+
+        The file is a JSON object mapping request paths to recorded responses,
+        each an object with a `body` and optional `status` (default 200) and
+        `headers`, or a list of those served in turn.
+
+        Args:
+            recording (str): The path of the recording file.
+        """
+        with open(recording, encoding="utf-8") as f:
+            recorded = json.load(f)
+        for path, entry in recorded.items():
+            entries = entry if isinstance(entry, list) else [entry]
+            responses = [
+                (e.get("status", 200), e.get("body"), e.get("headers") or {})
+                for e in entries
+            ]
+            self.routes[path] = responses if isinstance(entry, list) else responses[0]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Serves recording files until interrupted.
+
+    Run with `python -m aeroapi_python.StubServer recording.json [--port N]`.
+    """
+    parser = argparse.ArgumentParser(description="Serve recorded AeroAPI responses.")
+    parser.add_argument("recordings", nargs="*", help="recording files to serve")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--delay", type=float, default=0.0, help="latency in seconds")
+    args = parser.parse_args(argv)
+    server = StubServer(delay=args.delay, host=args.host, port=args.port)
+    for recording in args.recordings:
+        server.load(recording)
+    print(f"Serving {len(server.routes)} routes on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+import inspect
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
+
+from aeroapi_python.APICaller import _last_error
+from aeroapi_python.SearchQuery import SearchQuery
+
+# A bounding box as `(min_lat, min_lon, max_lat, max_lon)`, in degrees.
+BoundingBox = Tuple[float, float, float, float]
+
+
+def split_tile(tile: BoundingBox) -> List[BoundingBox]:
+    """
+    Splits a bounding box into its four quadrants.
+
+    Args:
+        tile (BoundingBox): The `(min_lat, min_lon, max_lat, max_lon)` box.
+
+    Returns:
+        List[BoundingBox]: The south-west, south-east, north-west and north-east
+        quadrants.
+    """
+    min_lat, min_lon, max_lat, max_lon = tile
+    mid_lat = (min_lat + max_lat) / 2
+    mid_lon = (min_lon + max_lon) / 2
+    return [
+        (min_lat, min_lon, mid_lat, mid_lon),
+        (min_lat, mid_lon, mid_lat, max_lon),
+        (mid_lat, min_lon, max_lat, mid_lon),
+        (mid_lat, mid_lon, max_lat, max_lon),
+    ]
+
+
+def merge_positions(batches: Iterable[Iterable[Any]]) -> List[Any]:
+    """
+    Merges the positions found in several tiles, keeping the latest position of
+    each flight.
+
+    Tiles share their edges, so a flight on a boundary can be reported by two
+    of them; positions without a `fa_flight_id` are all kept.
+
+    Args:
+        batches (Iterable[Iterable[Any]]): The positions of each tile.
+
+    Returns:
+        List[Any]: The positions, one per flight, in the order first seen.
+    """
+    latest: Dict[Any, Any] = {}
+    anonymous = []
+    for positions in batches:
+        for position in positions:
+            flight_id = position.get("fa_flight_id")
+            if flight_id is None:
+                anonymous.append(position)
+                continue
+            current = latest.get(flight_id)
+            if current is None or _later(position, current):
+                latest[flight_id] = position
+    return list(latest.values()) + anonymous
+
+
+def _later(position: Any, current: Any) -> bool:
+    new, old = position.get("timestamp"), current.get("timestamp")
+    return new is not None and (old is None or new > old)
+
+
+class TiledSearch:
+    """
+    Searches the positions of the flights over a large area by splitting it into
+    adaptive tiles.
+
+    A single `search_flights_positions` call over a continental box returns a
+    huge, slow response or hits the result cap. `TiledSearch` counts the
+    matching flights with `count_search_flights`, splits every tile holding more
+    than `max_count` of them into quadrants, level by level, then searches the
+    final tiles concurrently and merges their positions by flight ID. Empty
+    tiles are not searched at all. A tile whose search fails on any page
+    contributes no positions and is listed in the `failed` tiles of the result.
+
+    Attributes:
+        flights (Flights): The `Flights` resource to search with.
+        max_count (int): The number of flights above which a tile is split.
+        min_size (float): The smallest tile side, in degrees, that is split further.
+        max_depth (int): The maximum number of times a tile is split.
+        concurrency (int): The maximum number of requests in flight.
+
+    Methods:
+        tile_query(tile: BoundingBox, operators: Iterable[Tuple[str, Any]] = ()) -> SearchQuery:
+            Returns the search query restricted to a tile.
+
+        search(bbox: BoundingBox, operators: Iterable[Tuple[str, Any]] = ()) -> Dict[str, Any]:
+            Searches the positions of the flights within a bounding box.
+    """
+
+    def __init__(
+        self,
+        flights: Any,
+        max_count: int = 500,
+        min_size: float = 0.5,
+        max_depth: int = 6,
+        concurrency: int = 8,
+    ) -> None:
+        """
+        Initializes a `TiledSearch` instance.
+
+        Args:
+            flights (Flights): The `Flights` resource, using an `APICaller` or an
+            `AsyncAPICaller`.
+            max_count (int): Optional, the number of flights above which a tile is
+            split (default 500).
+            min_size (float): Optional, the smallest tile side, in degrees, that is
+            split further (default 0.5).
+            max_depth (int): Optional, the maximum number of times a tile is split
+            (default 6).
+            concurrency (int): Optional, the maximum number of requests in flight
+            (default 8).
+        """
+        self.flights = flights
+        self.max_count = max_count
+        self.min_size = min_size
+        self.max_depth = max_depth
+        self.concurrency = concurrency
+
+    @staticmethod
+    def tile_query(
+        tile: BoundingBox, operators: Iterable[Tuple[str, Any]] = ()
+    ) -> SearchQuery:
+        """
+        Returns the search query restricted to a tile.
+
+        Args:
+            tile (BoundingBox): The `(min_lat, min_lon, max_lat, max_lon)` box.
+            operators (Iterable[Tuple[str, Any]]): Optional, additional criteria.
+
+        Returns:
+            SearchQuery: The query, with `range` criteria on `lat` and `lon`.
+        """
+        min_lat, min_lon, max_lat, max_lon = tile
+        return SearchQuery(
+            list(operators)
+            + [
+                ("range", ("lat", min_lat, max_lat)),
+                ("range", ("lon", min_lon, max_lon)),
+            ]
+        )
+
+    def search(
+        self,
+        bbox: BoundingBox,
+        operators: Union[SearchQuery, Iterable[Tuple[str, Any]]] = (),
+    ) -> Union[Dict[str, Any], Awaitable[Dict[str, Any]]]:
+        """
+        Searches the positions of the flights within a bounding box.
+
+        A box whose minimum longitude is greater than its maximum crosses the
+        antimeridian and is searched as two boxes.
+
+        Args:
+            bbox (BoundingBox): The `(min_lat, min_lon, max_lat, max_lon)` box.
+            operators (SearchQuery or Iterable[Tuple[str, Any]]): Optional,
+            additional search criteria.
+
+        Returns:
+            dict: The merged `positions`, one per flight, the `tiles` that were
+            searched, and the `failed` tiles, whose search failed on any page and
+            whose positions are missing. With an `AsyncAPICaller` this is an
+            awaitable.
+
+        Raises:
+            ValueError: If a search operator is not supported.
+        """
+        operators = SearchQuery.coerce(operators).operators
+        min_lat, min_lon, max_lat, max_lon = map(float, bbox)
+        if min_lon > max_lon:
+            roots = [
+                (min_lat, min_lon, max_lat, 180.0),
+                (min_lat, -180.0, max_lat, max_lon),
+            ]
+        else:
+            roots = [(min_lat, min_lon, max_lat, max_lon)]
+        if inspect.iscoroutinefunction(self.flights.api_caller.get):
+            return self._search_async(roots, operators)
+        return self._search(roots, operators)
+
+    def _plan(
+        self, counted: List[Tuple[BoundingBox, int]], counts: List[Optional[int]]
+    ) -> Tuple[List[BoundingBox], List[Tuple[BoundingBox, int]]]:
+        """
+        Sorts counted tiles into tiles to search and tiles to count next.
+
+        Args:
+            counted (List[Tuple[BoundingBox, int]]): The tiles and their depth.
+            counts (List[int]): The number of flights in each tile, or None if the
+            count failed.
+
+        Returns:
+            tuple: The tiles to search, and the quadrants to count next.
+        """
+        final: List[BoundingBox] = []
+        pending: List[Tuple[BoundingBox, int]] = []
+        for (tile, depth), count in zip(counted, counts):
+            if count == 0:
+                continue
+            min_lat, min_lon, max_lat, max_lon = tile
+            splittable = (
+                depth < self.max_depth
+                and max(max_lat - min_lat, max_lon - min_lon) / 2 >= self.min_size
+            )
+            if count is not None and count > self.max_count and splittable:
+                pending.extend((quadrant, depth + 1) for quadrant in split_tile(tile))
+            else:
+                final.append(tile)
+        return final, pending
+
+    @staticmethod
+    def _count_of(result: Any) -> Optional[int]:
+        if result.error is not None or not result.result:
+            return None
+        return result.result.get("count")
+
+    @staticmethod
+    def _complete(positions: List[Any]) -> List[Any]:
+        """
+        Returns the positions of a tile, unless its iteration stopped at a
+        failed page.
+
+        Args:
+            positions (List[Any]): The positions read from the tile's pages.
+
+        Returns:
+            List[Any]: The positions.
+
+        Raises:
+            Exception: The error of the failed page, so that `map_concurrent`
+            records the tile as failed.
+        """
+        error = _last_error.get()
+        if error is not None:
+            raise error
+        return positions
+
+    @staticmethod
+    def _merge(tiles: List[BoundingBox], results: List[Any]) -> Dict[str, Any]:
+        return {
+            "positions": merge_positions(r.result or () for r in results),
+            "tiles": tiles,
+            "failed": [r.item for r in results if r.error is not None],
+        }
+
+    def _search(
+        self, roots: List[BoundingBox], operators: Tuple[Tuple[str, Any], ...]
+    ) -> Dict[str, Any]:
+        api_caller = self.flights.api_caller
+        tiles: List[BoundingBox] = []
+        pending = [(root, 0) for root in roots]
+        while pending:
+            results = api_caller.map_concurrent(
+                self.flights.count_search_flights,
+                [self.tile_query(tile, operators) for tile, _ in pending],
+                self.concurrency,
+            )
+            final, pending = self._plan(pending, [self._count_of(r) for r in results])
+            tiles.extend(final)
+
+        def search_tile(tile: BoundingBox) -> List[Any]:
+            query = self.tile_query(tile, operators)
+            positions = list(self.flights.iter_search_flights_positions(query))
+            return self._complete(positions)
+
+        results = api_caller.map_concurrent(search_tile, tiles, self.concurrency)
+        return self._merge(tiles, results)
+
+    async def _search_async(
+        self, roots: List[BoundingBox], operators: Tuple[Tuple[str, Any], ...]
+    ) -> Dict[str, Any]:
+        api_caller = self.flights.api_caller
+        tiles: List[BoundingBox] = []
+        pending = [(root, 0) for root in roots]
+        while pending:
+            results = await api_caller.map_concurrent(
+                self.flights.count_search_flights,
+                [self.tile_query(tile, operators) for tile, _ in pending],
+                self.concurrency,
+            )
+            final, pending = self._plan(pending, [self._count_of(r) for r in results])
+            tiles.extend(final)
+
+        async def search_tile(tile: BoundingBox) -> List[Any]:
+            query = self.tile_query(tile, operators)
+            positions = [
+                position
+                async for position in self.flights.iter_search_flights_positions(query)
+            ]
+            return self._complete(positions)
+
+        results = await api_caller.map_concurrent(search_tile, tiles, self.concurrency)
+        return self._merge(tiles, results)
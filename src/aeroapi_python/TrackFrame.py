@@ -0,0 +1,532 @@
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from aeroapi_python.Models import format_timestamp, parse_timestamp
+
+# NumPy is imported on first use, as it would otherwise dominate the import time
+# of the package. Set `np` to None to force the pure-Python columns.
+_UNLOADED: Any = object()
+np: Any = _UNLOADED
+
+
+def _numpy() -> Any:
+    """
+    Returns the NumPy module, importing it on first use.
+
+    Returns:
+        module: NumPy, or None if it is not installed.
+    """
+    global np
+    if np is _UNLOADED:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover - exercised only without numpy
+            numpy = None  # type: ignore[assignment]
+        np = numpy
+    return np
+
+
+# The mean Earth radius in statute miles, the unit AeroAPI reports distances in.
+EARTH_RADIUS_MILES = 3958.8
+
+COLUMNS = ("timestamp", "latitude", "longitude", "altitude", "groundspeed", "heading")
+
+Time = Union[float, datetime]
+
+
+def _float(value: Any) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _epoch(value: Any) -> float:
+    if value is None:
+        return math.nan
+    if isinstance(value, str):
+        value = parse_timestamp(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+def _column(values: Iterable[float]) -> Sequence[float]:
+    """
+    Stores a column contiguously, as a NumPy array when NumPy is installed.
+    """
+    np = _numpy()
+    if np is not None:
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        return np.asarray(values, dtype=float)
+    return array("d", values)
+
+
+def _interp(
+    x: Sequence[float], xp: Sequence[float], fp: Sequence[float]
+) -> List[float]:
+    """
+    Linearly interpolates `fp`, sampled at increasing `xp`, at increasing `x`.
+    """
+    out = []
+    j = 0
+    last = len(xp) - 2
+    for value in x:
+        while j < last and xp[j + 1] < value:
+            j += 1
+        x0, x1 = xp[j], xp[j + 1]
+        if x1 == x0:
+            out.append(fp[j + 1])
+        else:
+            out.append(fp[j] + (fp[j + 1] - fp[j]) * (value - x0) / (x1 - x0))
+    return out
+
+
+def _unwrap(degrees: Sequence[float]) -> List[float]:
+    """
+    Removes the jumps of headings crossing north, so they interpolate the short
+    way round.
+    """
+    out: List[float] = []
+    offset = 0.0
+    for i, value in enumerate(degrees):
+        if i:
+            delta = value - degrees[i - 1]
+            if delta > 180:
+                offset -= 360
+            elif delta < -180:
+                offset += 360
+        out.append(value + offset)
+    return out
+
+
+class TrackFrame:
+    """
+    A columnar container of flight positions.
+
+    Each field is held in one contiguous array of floats (a NumPy array when
+    NumPy is installed, otherwise an `array('d')`), which is far smaller than a
+    list of position dicts and can be handed to analytics code without
+    conversion. Timestamps are seconds since the epoch and missing values are
+    NaN; altitudes are in hundreds of feet and groundspeeds in knots, as
+    reported by AeroAPI.
+
+    The track operations (`distance_flown`, `time_slice` and `resample`) treat
+    the frame as one flight in chronological order. A position search returns
+    the positions of many flights interleaved; split such a frame with
+    `by_flight()` first, as these operations raise `ValueError` on it.
+
+    Attributes:
+        timestamp, latitude, longitude, altitude, groundspeed, heading
+        (Sequence[float]): The position columns.
+        fa_flight_id (List[Optional[str]]): The flight of each position.
+        meta (dict): The other top-level fields of the response the frame was
+        built from, such as `actual_distance` or `links`.
+
+    Methods:
+        from_positions(positions: Iterable[Mapping[str, Any]], meta:
+          Optional[Dict[str, Any]] = None) -> TrackFrame:
+            Builds a frame from position records.
+
+        from_response(response: Mapping[str, Any], key: str = "positions") ->
+          TrackFrame:
+            Builds a frame from a track or position search response.
+
+        by_flight() -> Dict[Optional[str], TrackFrame]:
+            Splits the frame into one chronological frame per flight.
+
+        distance_flown() -> float:
+            Returns the great-circle distance along the track, in statute miles.
+
+        bounding_box() -> Optional[Tuple[float, float, float, float]]:
+            Returns the box enclosing every position.
+
+        time_slice(start: Optional[Time] = None, end: Optional[Time] = None) ->
+          TrackFrame:
+            Returns the positions within a time range.
+
+        resample(interval: float) -> TrackFrame:
+            Interpolates the track at a regular time interval.
+
+        to_records() -> List[Dict[str, Any]]:
+            Converts the frame back to position dicts.
+    """
+
+    __slots__ = COLUMNS + ("fa_flight_id", "meta")
+
+    def __init__(
+        self,
+        timestamp: Iterable[float],
+        latitude: Iterable[float],
+        longitude: Iterable[float],
+        altitude: Optional[Iterable[float]] = None,
+        groundspeed: Optional[Iterable[float]] = None,
+        heading: Optional[Iterable[float]] = None,
+        fa_flight_id: Optional[Iterable[Optional[str]]] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Initializes a `TrackFrame` instance from columns.
+
+        Args:
+            timestamp (Iterable[float]): Seconds since the epoch, increasing.
+            latitude (Iterable[float]): Latitudes in degrees.
+            longitude (Iterable[float]): Longitudes in degrees.
+            altitude (Iterable[float]): Optional, altitudes in hundreds of feet.
+            groundspeed (Iterable[float]): Optional, groundspeeds in knots.
+            heading (Iterable[float]): Optional, headings in degrees.
+            fa_flight_id (Iterable[str]): Optional, the flight of each position.
+            meta (dict): Optional, other fields of the originating response.
+
+        Raises:
+            ValueError: If the columns have different lengths.
+        """
+        self.timestamp = _column(timestamp)
+        size = len(self.timestamp)
+        self.latitude = _column(latitude)
+        self.longitude = _column(longitude)
+        self.altitude = _column([math.nan] * size if altitude is None else altitude)
+        self.groundspeed = _column(
+            [math.nan] * size if groundspeed is None else groundspeed
+        )
+        self.heading = _column([math.nan] * size if heading is None else heading)
+        self.fa_flight_id: List[Optional[str]] = (
+            [None] * size if fa_flight_id is None else list(fa_flight_id)
+        )
+        self.meta: Dict[str, Any] = dict(meta or {})
+        if any(len(getattr(self, name)) != size for name in COLUMNS) or (
+            len(self.fa_flight_id) != size
+        ):
+            raise ValueError("TrackFrame columns must have the same length")
+
+    @classmethod
+    def from_positions(
+        cls,
+        positions: Iterable[Mapping[str, Any]],
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> "TrackFrame":
+        """
+        Builds a frame from position records.
+
+        Args:
+            positions (Iterable[Mapping[str, Any]]): Position dicts or `Position`
+            models, in chronological order.
+            meta (dict): Optional, other fields of the originating response.
+
+        Returns:
+            TrackFrame: The frame.
+        """
+        timestamps: List[float] = []
+        latitudes: List[float] = []
+        longitudes: List[float] = []
+        altitudes: List[float] = []
+        speeds: List[float] = []
+        headings: List[float] = []
+        ids = []
+        for position in positions:
+            timestamps.append(_epoch(position.get("timestamp")))
+            latitudes.append(_float(position.get("latitude")))
+            longitudes.append(_float(position.get("longitude")))
+            altitudes.append(_float(position.get("altitude")))
+            speeds.append(_float(position.get("groundspeed")))
+            headings.append(_float(position.get("heading")))
+            ids.append(position.get("fa_flight_id"))
+        return cls(
+            timestamps,
+            latitudes,
+            longitudes,
+            altitudes,
+            speeds,
+            headings,
+            fa_flight_id=ids,
+            meta=meta,
+        )
+
+    @classmethod
+    def from_response(
+        cls, response: Mapping[str, Any], key: str = "positions"
+    ) -> "TrackFrame":
+        """
+        Builds a frame from a track or position search response.
+
+        Args:
+            response (Mapping[str, Any]): The parsed JSON response.
+            key (str): Optional, the field holding the positions (default
+            `positions`).
+
+        Returns:
+            TrackFrame: The frame; the response's other fields are kept in `meta`.
+        """
+        meta = {k: v for k, v in response.items() if k != key}
+        return cls.from_positions(response.get(key) or (), meta)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        if name in COLUMNS or name == "fa_flight_id":
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def __repr__(self) -> str:
+        return f"TrackFrame({len(self)} positions)"
+
+    def _with_columns(
+        self,
+        columns: Sequence[Iterable[float]],
+        fa_flight_id: Iterable[Optional[str]],
+    ) -> "TrackFrame":
+        timestamp, latitude, longitude, altitude, groundspeed, heading = columns
+        return TrackFrame(
+            timestamp,
+            latitude,
+            longitude,
+            altitude,
+            groundspeed,
+            heading,
+            fa_flight_id=fa_flight_id,
+            meta=self.meta,
+        )
+
+    def _take(self, start: int, stop: int) -> "TrackFrame":
+        return self._with_columns(
+            [getattr(self, name)[start:stop] for name in COLUMNS],
+            self.fa_flight_id[start:stop],
+        )
+
+    def _check_single_flight(self) -> None:
+        """
+        Checks that the positions belong to at most one flight.
+
+        Raises:
+            ValueError: If the frame holds the positions of more than one flight.
+        """
+        flights = set(self.fa_flight_id)
+        flights.discard(None)
+        if len(flights) > 1:
+            raise ValueError(
+                f"TrackFrame holds {len(flights)} flights; split it with by_flight()"
+            )
+
+    def by_flight(self) -> Dict[Optional[str], "TrackFrame"]:
+        """
+        Splits the frame into one frame per flight, such as the positions of a
+        position search.
+
+        Returns:
+            dict: A frame per `fa_flight_id`, in order of first appearance, each
+            sorted by timestamp.
+        """
+        groups: Dict[Optional[str], List[int]] = {}
+        for i, flight in enumerate(self.fa_flight_id):
+            groups.setdefault(flight, []).append(i)
+        np = _numpy()
+        numpy_columns = np is not None and isinstance(self.timestamp, np.ndarray)
+        frames = {}
+        for flight, index in groups.items():
+            index.sort(key=self.timestamp.__getitem__)
+            if numpy_columns:
+                columns = [getattr(self, name)[index] for name in COLUMNS]
+            else:
+                columns = [
+                    array("d", map(getattr(self, name).__getitem__, index))
+                    for name in COLUMNS
+                ]
+            frames[flight] = self._with_columns(columns, [flight] * len(index))
+        return frames
+
+    def distance_flown(self) -> float:
+        """
+        Returns the great-circle (haversine) distance along the track, skipping
+        positions without coordinates.
+
+        Returns:
+            float: The distance in statute miles.
+
+        Raises:
+            ValueError: If the frame holds more than one flight.
+        """
+        self._check_single_flight()
+        np = _numpy()
+        if np is not None and isinstance(self.latitude, np.ndarray):
+            lat = np.radians(self.latitude)
+            lon = np.radians(self.longitude)
+            known = ~(np.isnan(lat) | np.isnan(lon))
+            lat, lon = lat[known], lon[known]
+            a = (
+                np.sin(np.diff(lat) / 2) ** 2
+                + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lon) / 2) ** 2
+            )
+            return float(
+                2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0))).sum()
+            )
+        total = 0.0
+        previous = None
+        for lat, lon in zip(self.latitude, self.longitude):
+            if math.isnan(lat) or math.isnan(lon):
+                continue
+            lat, lon = math.radians(lat), math.radians(lon)
+            if previous is not None:
+                a = (
+                    math.sin((lat - previous[0]) / 2) ** 2
+                    + math.cos(previous[0])
+                    * math.cos(lat)
+                    * math.sin((lon - previous[1]) / 2) ** 2
+                )
+                total += 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(min(a, 1.0)))
+            previous = (lat, lon)
+        return total
+
+    def bounding_box(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Returns the box enclosing every position, in the order used by the
+        `-latlong` search key.
+
+        Returns:
+            tuple: `(min_lat, min_lon, max_lat, max_lon)`, or None if no position
+            has coordinates.
+        """
+        np = _numpy()
+        if np is not None and isinstance(self.latitude, np.ndarray):
+            known = ~(np.isnan(self.latitude) | np.isnan(self.longitude))
+            if not known.any():
+                return None
+            lat, lon = self.latitude[known], self.longitude[known]
+            return (
+                float(lat.min()),
+                float(lon.min()),
+                float(lat.max()),
+                float(lon.max()),
+            )
+        points = [
+            (lat, lon)
+            for lat, lon in zip(self.latitude, self.longitude)
+            if not (math.isnan(lat) or math.isnan(lon))
+        ]
+        if not points:
+            return None
+        lats, lons = zip(*points)
+        return min(lats), min(lons), max(lats), max(lons)
+
+    def time_slice(
+        self, start: Optional[Time] = None, end: Optional[Time] = None
+    ) -> "TrackFrame":
+        """
+        Returns the positions with `start <= timestamp <= end`.
+
+        Args:
+            start (float or datetime): Optional, the start of the range, as
+            seconds since the epoch or a timezone-aware datetime.
+            end (float or datetime): Optional, the end of the range.
+
+        Returns:
+            TrackFrame: A frame holding the positions within the range.
+
+        Raises:
+            ValueError: If the frame holds more than one flight.
+        """
+        self._check_single_flight()
+        np = _numpy()
+        if np is not None and isinstance(self.timestamp, np.ndarray):
+            search = np.searchsorted
+            lo = 0 if start is None else int(search(self.timestamp, _epoch(start)))
+            hi = (
+                len(self)
+                if end is None
+                else int(search(self.timestamp, _epoch(end), side="right"))
+            )
+        else:
+            lo = 0 if start is None else bisect_left(self.timestamp, _epoch(start))
+            hi = len(self) if end is None else bisect_right(self.timestamp, _epoch(end))
+        return self._take(lo, max(lo, hi))
+
+    def resample(self, interval: float) -> "TrackFrame":
+        """
+        Interpolates the track at a regular time interval, from the first to the
+        last position. Coordinates, altitude and groundspeed are interpolated
+        linearly; headings take the short way round through north, ignoring
+        positions without a heading.
+
+        Args:
+            interval (float): The spacing of the samples, in seconds.
+
+        Returns:
+            TrackFrame: The resampled frame. Each sample keeps the flight ID of the
+            position at or before it.
+
+        Raises:
+            ValueError: If `interval` is not positive, or if the frame holds more
+            than one flight.
+        """
+        self._check_single_flight()
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if len(self) < 2:
+            return self._take(0, len(self))
+        first, last = self.timestamp[0], self.timestamp[-1]
+        count = int((last - first) // interval) + 1
+        np = _numpy()
+        if np is not None and isinstance(self.timestamp, np.ndarray):
+            times = first + interval * np.arange(count)
+            columns = [
+                np.interp(times, self.timestamp, getattr(self, name))
+                for name in COLUMNS[1:-1]
+            ]
+            known = ~np.isnan(self.heading)
+            if known.sum() >= 2:
+                unwrapped = np.unwrap(self.heading[known], period=360)
+                heading = np.interp(times, self.timestamp[known], unwrapped) % 360
+            else:
+                heading = np.full(count, math.nan)
+            index = np.searchsorted(self.timestamp, times, side="right") - 1
+        else:
+            times = [first + interval * i for i in range(count)]
+            columns = [
+                _interp(times, self.timestamp, getattr(self, name))
+                for name in COLUMNS[1:-1]
+            ]
+            known = [
+                (t, h)
+                for t, h in zip(self.timestamp, self.heading)
+                if not math.isnan(h)
+            ]
+            if len(known) >= 2:
+                xp, fp = zip(*known)
+                heading = [h % 360 for h in _interp(times, xp, _unwrap(fp))]
+            else:
+                heading = [math.nan] * count
+            index = [bisect_right(self.timestamp, t) - 1 for t in times]
+        return self._with_columns(
+            [times, *columns, heading], [self.fa_flight_id[i] for i in index]
+        )
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Converts the frame back to position dicts; NaN values become None.
+
+        Returns:
+            list: One dict per position.
+        """
+        records = []
+        for i in range(len(self)):
+            record: Dict[str, Any] = {"fa_flight_id": self.fa_flight_id[i]}
+            for name in COLUMNS:
+                value = float(getattr(self, name)[i])
+                record[name] = None if math.isnan(value) else value
+            if record["timestamp"] is not None:
+                record["timestamp"] = format_timestamp(
+                    datetime.fromtimestamp(record["timestamp"], timezone.utc)
+                )
+            records.append(record)
+        return records
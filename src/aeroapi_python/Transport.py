@@ -0,0 +1,530 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# httpx is imported by the first `HTTPXTransport`, so clients using the default
+# transport do not pay for its import.
+_UNLOADED: Any = object()
+httpx: Any = _UNLOADED
+
+# The connect and read timeouts of an attempt, in seconds or None.
+Timeout = Tuple[Optional[float], Optional[float]]
+
+
+def _httpx() -> Any:
+    """
+    Returns the httpx module, importing it on first use.
+
+    Returns:
+        module: httpx, or None if it is not installed.
+    """
+    global httpx
+    if httpx is _UNLOADED:
+        module: Any
+        try:
+            import httpx as module
+        except ImportError:  # pragma: no cover - exercised only without the extra
+            module = None
+        httpx = module
+    return httpx
+
+
+# Enough connections for the worker pools `map_concurrent` is typically given,
+# so threads do not open and discard connections past the pool size.
+DEFAULT_POOL_SIZE = 64
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of an `APICaller` over a pool of connections.
+
+    Subclasses wrap an HTTP client library and must implement `headers`,
+    `request`, `iter_bytes`, `close`, `_options` and `_new_pool`. Pickling a
+    transport keeps its settings and headers only; the copy opens connections
+    of its own. Every transport can recycle its connection pool once it is
+    older than `max_connection_age`, so long-lived clients pick up DNS and load
+    balancer changes: requests made after that go through a fresh pool, and the
+    retired pool is closed at the next recycle, once its in-flight requests
+    have finished. A forked child replaces its inherited pool the same way.
+
+    Attributes:
+        headers (MutableMapping[str, str]): The headers sent with every request.
+        max_connection_age (float): The seconds after which the pool is
+        replaced, or None to keep connections for as long as the server does.
+        connection_errors (Tuple[Type[Exception], ...]): The exceptions raised
+        when a request failed to connect or timed out, which may be retried.
+        errors (Tuple[Type[Exception], ...]): The exceptions raised for any
+        other failed request, including `raise_for_status()` errors.
+        thread_safe (bool): Whether requests may be sent from many threads at
+        once.
+
+    Methods:
+        request(method: str, url: str, json: Any = None, headers: Optional[Dict[str, Any]] = None, timeout: Optional[Timeout] = None, stream: bool = False) -> Any:
+            Sends a request and returns the response.
+
+        iter_bytes(response: Any, chunk_size: int) -> Iterator[bytes]:
+            Yields the body of a streamed response as it downloads.
+
+        close() -> None:
+            Closes every pooled connection.
+    """
+
+    connection_errors: Tuple[Type[Exception], ...] = ()
+    errors: Tuple[Type[Exception], ...] = ()
+    thread_safe = False
+
+    def __init__(self, max_connection_age: Optional[float] = None) -> None:
+        """
+        Initializes a `Transport` instance.
+
+        Args:
+            max_connection_age (float): Optional, the seconds after which the
+            connection pool is replaced (default None, never).
+        """
+        self.max_connection_age = max_connection_age
+        self._pool_started = time.monotonic()
+        self._retired: List[Any] = []
+        self._recycle_lock = threading.Lock()
+
+    @property
+    @abstractmethod
+    def headers(self) -> Any:
+        """
+        The headers sent with every request. Implemented by subclasses.
+        """
+
+    @abstractmethod
+    def _new_pool(self) -> Any:
+        """
+        Replaces the connection pool, when it reaches `max_connection_age` or
+        in a forked child. Implemented by subclasses.
+
+        Returns:
+            Any: The replaced pool, which has a `close()` method.
+        """
+
+    @abstractmethod
+    def _options(self) -> Dict[str, Any]:
+        """
+        Returns the arguments to recreate the transport with. Implemented by
+        subclasses.
+
+        Returns:
+            dict: The keyword arguments of `__init__`.
+        """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"options": self._options(), "headers": dict(self.headers)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state["options"])  # type: ignore[misc]
+        self.headers.update(state["headers"])
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the connection pool in a forked child.
+
+        The inherited pools are abandoned rather than closed: their sockets are
+        shared with the parent, which may still be using them.
+        """
+        self._recycle_lock = threading.Lock()
+        self._retired = []
+        self._pool_started = time.monotonic()
+        self._new_pool()
+
+    def _check_age(self) -> None:
+        """
+        Replaces the connection pool once it is older than `max_connection_age`.
+        """
+        if self.max_connection_age is None:
+            return
+        now = time.monotonic()
+        if now - self._pool_started < self.max_connection_age:
+            return
+        with self._recycle_lock:
+            if now - self._pool_started < self.max_connection_age:
+                return
+            stale, self._retired = self._retired, [self._new_pool()]
+            self._pool_started = now
+        for pool in stale:
+            self._close_pool(pool)
+
+    def _close_pool(self, pool: Any) -> None:
+        """
+        Closes a retired connection pool.
+
+        Args:
+            pool (Any): A pool returned by `_new_pool`.
+        """
+        pool.close()
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Sends a request. Implemented by subclasses.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The absolute URL.
+            json (Any): Optional, the data to send as a JSON body.
+            headers (dict): Optional, headers to add to the transport's headers.
+            timeout (Timeout): Optional, the connect and read timeouts.
+            stream (bool): Optional, whether to return before the body is read;
+            the caller must then close the response (default False).
+
+        Returns:
+            Any: The response, with `status_code`, `headers`, `content`,
+            `elapsed`, `json()`, `raise_for_status()` and `close()`.
+        """
+
+    @abstractmethod
+    def iter_bytes(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        """
+        Yields the body of a streamed response as it downloads. Implemented by
+        subclasses.
+
+        Args:
+            response (Any): A response returned with `stream=True`.
+            chunk_size (int): The number of bytes read at a time.
+
+        Yields:
+            bytes: Each chunk of the body.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Closes every pooled connection. Implemented by subclasses.
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    A transport backed by `requests` sessions (HTTP/1.1).
+
+    A `requests.Session` is not documented as thread-safe: its cookie jar and
+    adapter table are mutated without locks. With `per_thread` enabled each
+    thread sends requests through a session of its own, created on first use,
+    while every session shares the transport's headers (including the API
+    key) and a single connection pool, so many threads can drive one client
+    without locking or leaking state into each other.
+
+    Attributes:
+        session (requests.Session): The session of the calling thread, or the
+        single shared session.
+        adapter (HTTPAdapter): The adapter, and connection pool, shared by
+        every session.
+        pool_connections (int): The number of hosts with a connection pool.
+        pool_maxsize (int): The maximum number of connections kept per host.
+        pool_block (bool): Whether requests wait for a free connection rather
+        than opening one that is discarded after use.
+        keep_alive (bool): Whether connections are reused between requests.
+        per_thread (bool): Whether each thread uses a session of its own.
+    """
+
+    # A connection dropped while the body downloads surfaces as a
+    # ChunkedEncodingError rather than a ConnectionError.
+    connection_errors = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.ChunkedEncodingError,
+        requests.exceptions.Timeout,
+    )
+    errors = (requests.exceptions.RequestException,)
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = DEFAULT_POOL_SIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        max_connection_age: Optional[float] = None,
+        per_thread: bool = False,
+    ) -> None:
+        """
+        Initializes a `RequestsTransport` instance.
+
+        Args:
+            pool_connections (int): Optional, the number of hosts to keep a
+            connection pool for (default 10).
+            pool_maxsize (int): Optional, the maximum number of connections kept
+            per host (default 64). Size it to the number of threads sending
+            requests at once.
+            pool_block (bool): Optional, whether threads wait for a pooled
+            connection instead of opening a throwaway one when all are busy
+            (default False).
+            keep_alive (bool): Optional, whether to reuse connections (default
+            True); when False every request opens a new connection.
+            max_connection_age (float): Optional, the seconds after which the
+            connection pool is replaced (default None, never).
+            per_thread (bool): Optional, whether each thread gets a session of
+            its own (default False).
+        """
+        super().__init__(max_connection_age)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.per_thread = per_thread
+        self.thread_safe = per_thread
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._shared = self._new_session()
+        if not keep_alive:
+            self._shared.headers["Connection"] = "close"
+        self._local = threading.local()
+
+    def _new_session(self) -> requests.Session:
+        """
+        Creates a session sending requests through the shared adapter.
+
+        Returns:
+            requests.Session: The session.
+        """
+        session = requests.Session()
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        if not self.per_thread:
+            return self._shared
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._new_session()
+            # Shared by reference, so later updates reach every thread.
+            session.headers = self._shared.headers
+            self._local.session = session
+        return session
+
+    def _options(self) -> Dict[str, Any]:
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+            "keep_alive": self.keep_alive,
+            "max_connection_age": self.max_connection_age,
+            "per_thread": self.per_thread,
+        }
+
+    def _after_fork(self) -> None:
+        super()._after_fork()
+        # Only the forking thread survives; its session is recreated on use.
+        self._local = threading.local()
+
+    def _new_pool(self) -> Any:
+        # Swapping the pool manager is atomic, unlike remounting an adapter on
+        # sessions that other threads may be reading.
+        previous = self.adapter.poolmanager
+        self.adapter.init_poolmanager(
+            self.pool_connections, self.pool_maxsize, block=self.pool_block
+        )
+        return previous
+
+    def _close_pool(self, pool: Any) -> None:
+        pool.clear()
+
+    @property
+    def headers(self) -> Any:
+        return self._shared.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        self._check_age()
+        return self.session.request(
+            method, url, json=json, headers=headers, timeout=timeout, stream=stream
+        )
+
+    def iter_bytes(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        return response.iter_content(chunk_size)
+
+    def close(self) -> None:
+        # Per-thread sessions hold no connections of their own.
+        self.adapter.close()
+        for pool in self._retired:
+            self._close_pool(pool)
+        self._retired = []
+
+
+class HTTPXTransport(Transport):
+    """
+    A transport backed by an `httpx.Client`, optionally speaking HTTP/2.
+
+    With HTTP/2 many concurrent requests are multiplexed over a single
+    connection per host, so threads no longer compete for pooled connections.
+    Requires the `http2` extra (`pip install aeroapi-python[http2]`) for
+    HTTP/2, and the `async` extra otherwise. An `httpx.Client` is thread-safe.
+
+    Attributes:
+        client (httpx.Client): The client requests are sent through.
+        http2 (bool): Whether HTTP/2 is negotiated with servers supporting it.
+        max_connections (int): The maximum number of open connections.
+        keep_alive (bool): Whether connections are reused between requests.
+        keepalive_expiry (float): The seconds an idle connection is kept.
+    """
+
+    thread_safe = True
+
+    def __init__(
+        self,
+        http2: bool = True,
+        max_connections: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        keepalive_expiry: float = 5.0,
+        max_connection_age: Optional[float] = None,
+    ) -> None:
+        """
+        Initializes an `HTTPXTransport` instance.
+
+        Args:
+            http2 (bool): Optional, whether to negotiate HTTP/2 (default True).
+            max_connections (int): Optional, the maximum number of open
+            connections (default 64).
+            keep_alive (bool): Optional, whether to reuse connections (default
+            True).
+            keepalive_expiry (float): Optional, the seconds an idle connection is
+            kept open (default 5).
+            max_connection_age (float): Optional, the seconds after which the
+            client and its connections are replaced (default None, never).
+
+        Raises:
+            ImportError: If httpx, or h2 for HTTP/2, is not installed.
+        """
+        if _httpx() is None:
+            raise ImportError(
+                "HTTPXTransport requires httpx; install it with "
+                "`pip install aeroapi-python[http2]`"
+            )
+        super().__init__(max_connection_age)
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keep_alive = keep_alive
+        self.keepalive_expiry = keepalive_expiry
+        self.connection_errors = (httpx.TransportError,)
+        self.errors = (httpx.HTTPError, httpx.InvalidURL)
+        self.client = self._client({})
+
+    def _client(self, headers: Any) -> "httpx.Client":
+        """
+        Creates a client with the transport's settings.
+
+        Args:
+            headers (Any): The headers sent with every request.
+
+        Returns:
+            httpx.Client: The client.
+        """
+        return httpx.Client(
+            headers=headers,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=(
+                    self.max_connections if self.keep_alive else 0
+                ),
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        )
+
+    def _options(self) -> Dict[str, Any]:
+        return {
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "keep_alive": self.keep_alive,
+            "keepalive_expiry": self.keepalive_expiry,
+            "max_connection_age": self.max_connection_age,
+        }
+
+    def _new_pool(self) -> Any:
+        previous = self.client
+        self.client = self._client(previous.headers)
+        return previous
+
+    @property
+    def headers(self) -> Any:
+        return self.client.headers
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        headers: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Timeout] = None,
+        stream: bool = False,
+    ) -> "httpx.Response":
+        self._check_age()
+        connect, read = timeout or (None, None)
+        client = self.client
+        request = client.build_request(
+            method,
+            url,
+            json=json,
+            headers=headers,
+            timeout=httpx.Timeout(connect=connect, read=read, write=read, pool=connect),
+        )
+        return client.send(request, stream=stream)
+
+    def iter_bytes(self, response: Any, chunk_size: int) -> Iterator[bytes]:
+        return response.iter_bytes(chunk_size)
+
+    def close(self) -> None:
+        self.client.close()
+        for pool in self._retired:
+            self._close_pool(pool)
+        self._retired = []
+
+
+TRANSPORTS: Dict[str, Callable[[], Transport]] = {
+    "requests": RequestsTransport,
+    "httpx": lambda: HTTPXTransport(http2=False),
+    "http2": HTTPXTransport,
+}
+
+
+def get_transport(transport: Union[str, Transport, None] = None) -> Transport:
+    """
+    Resolves the transport of an `APICaller`.
+
+    Args:
+        transport (str or Transport): Optional, a `Transport` instance, or the
+        name of a backend with default settings: `"requests"` (the default),
+        `"httpx"` or `"http2"`.
+
+    Returns:
+        Transport: The transport.
+
+    Raises:
+        ImportError: If the backend's library is not installed.
+        ValueError: If the name is unknown.
+    """
+    if isinstance(transport, Transport):
+        return transport
+    name = "requests" if transport is None else transport
+    if name not in TRANSPORTS:
+        raise ValueError(
+            f"Unknown transport {name!r}; expected one of {', '.join(TRANSPORTS)}"
+        )
+    return TRANSPORTS[name]()
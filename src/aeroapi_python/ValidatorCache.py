@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+class ValidatorCache:
+    """
+    Remembers the `ETag`/`Last-Modified` validators and parsed bodies of GET
+    responses so that later requests for the same URL can be made conditional.
+
+    When the server answers a conditional request with 304 Not Modified, the
+    remembered parsed body is returned without transferring or parsing it
+    again. The least recently used URLs are forgotten past `max_entries`.
+
+    Attributes:
+        max_entries (int): The maximum number of URLs remembered.
+
+    Methods:
+        lookup(url: str) -> Optional[Tuple[Dict[str, str], Any]]:
+            Returns the conditional headers and remembered body of a URL.
+
+        store(url: str, headers: Mapping[str, str], body: Any) -> None:
+            Remembers the validators and body of a response.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initializes a `ValidatorCache` instance.
+
+        Args:
+            max_entries (int): Optional, the maximum number of URLs remembered
+            (default 1024).
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Dict[str, str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[Tuple[Dict[str, str], Any]]:
+        """
+        Returns the conditional headers to send for a URL and the body to use if
+        the server answers 304 Not Modified.
+
+        Args:
+            url (str): The request URL.
+
+        Returns:
+            tuple: The `If-None-Match`/`If-Modified-Since` headers and the
+            remembered parsed body, or None if nothing is remembered for the URL.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def store(self, url: str, headers: Mapping[str, str], body: Any) -> None:
+        """
+        Remembers the validators and parsed body of a response, if it has any
+        validators.
+
+        Args:
+            url (str): The request URL.
+            headers (Mapping[str, str]): The (case-insensitive) response headers.
+            body (Any): The parsed response body.
+        """
+        conditional = {}
+        if headers.get("ETag"):
+            conditional["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            conditional["If-Modified-Since"] = headers["Last-Modified"]
+        if not conditional:
+            return
+        with self._lock:
+            self._entries[url] = (conditional, body)
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the configuration is pickled; the copy starts out empty.
+        return {"max_entries": self.max_entries}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _after_fork(self) -> None:
+        """
+        Replaces the lock in a forked child, where another thread of the parent
+        may have held it.
+        """
+        self._lock = threading.Lock()
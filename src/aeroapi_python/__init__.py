@@ -1,3 +1,49 @@
 # SPDX-FileCopyrightText: 2025-present Deren Singh <derens99@gmail.com>
 #
 # SPDX-License-Identifier: MIT
+import importlib
+from typing import Any, List
+
+# Submodules are imported on first attribute access (PEP 562), so that
+# `import aeroapi_python` stays cheap and `aeroapi_python.Flights` still works
+# without importing it first.
+SUBMODULES = (
+    "APICaller",
+    "AeroAPI",
+    "Airports",
+    "AsyncAPICaller",
+    "AsyncAeroAPI",
+    "BoardPoller",
+    "Deadline",
+    "Endpoints",
+    "Flights",
+    "History",
+    "JSONDecoder",
+    "Metrics",
+    "Miscellaneous",
+    "Models",
+    "Operators",
+    "ProcessPool",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteCache",
+    "SearchQuery",
+    "SingleFlight",
+    "StreamingJSON",
+    "StubServer",
+    "TiledSearch",
+    "TrackFrame",
+    "Transport",
+    "ValidatorCache",
+)
+
+
+def __getattr__(name: str) -> Any:
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(SUBMODULES))
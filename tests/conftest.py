@@ -0,0 +1,9 @@
+import pytest
+
+from aeroapi_python.StubServer import StubServer
+
+
+@pytest.fixture
+def stub_server():
+    with StubServer() as server:
+        yield server
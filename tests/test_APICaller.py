@@ -1,6 +1,9 @@
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
-from aeroapi_python.APICaller import APICaller
+from aeroapi_python.APICaller import APICaller, BaseAPICaller
+from aeroapi_python.Airports import Airports
 import requests
 
 def test_init():
@@ -12,11 +15,22 @@ def test_init():
     assert api_caller.base_url == 'https://aeroapi.flightaware.com/aeroapi/'
     assert api_caller.session.headers['x-apikey'] == api_key
 
+def test_base_api_caller_is_abstract():
+    with pytest.raises(TypeError, match="abstract"):
+        BaseAPICaller("https://example.com/", "test_api_key")
+
+    class GetOnly(BaseAPICaller):
+        def get(self, endpoint, headers=None, model=None, transform=None, timeout=None):
+            return endpoint
+
+    with pytest.raises(TypeError, match="post"):
+        GetOnly("https://example.com/", "test_api_key")
+
 @patch.object(APICaller, '_send_request')
 def test_get(mocked_send_request):
     api_caller = APICaller('https://aeroapi.flightaware.com/aeroapi/', 'sample_api_key')
     api_caller.get("test_endpoint")
-    mocked_send_request.assert_called_once_with("GET", "test_endpoint", headers=None)
+    mocked_send_request.assert_called_once_with("GET", "test_endpoint", headers=None, template=None)
 
 @patch.object(APICaller, "_send_request")
 def test_post(mocked_send_request):
@@ -40,7 +54,7 @@ def test_build_path(endpoint, sub_path, query, expected):
     assert result == expected
 
 # Test successful _send_request
-@patch("aeroapi_python.APICaller.requests.Session.request")
+@patch("aeroapi_python.Transport.requests.Session.request")
 def test_send_request_valid_response(mocked_request):
     api_caller = APICaller("https://example.com/", "test_api_key")
     mocked_response = MagicMock()
@@ -51,7 +65,7 @@ def test_send_request_valid_response(mocked_request):
     result = api_caller._send_request("GET", "endpoint")
     assert result == {"status": "ok"}
 
-@patch("aeroapi_python.APICaller.requests.Session.request")
+@patch("aeroapi_python.Transport.requests.Session.request")
 def test_send_request_exception_raised(mocked_request):
     api_caller = APICaller("https://example.com/", "test_api_key")
     mocked_request.side_effect = requests.exceptions.RequestException("Test Exception")
@@ -61,7 +75,7 @@ def test_send_request_exception_raised(mocked_request):
     assert result is None
 
 # Test _send_request with invalid JSON response
-@patch("aeroapi_python.APICaller.requests.Session.request")
+@patch("aeroapi_python.Transport.requests.Session.request")
 def test_send_request_invalid_json(mocked_request):
     api_caller = APICaller("https://example.com/", "test_api_key")
     mocked_response = MagicMock()
@@ -70,4 +84,78 @@ def test_send_request_invalid_json(mocked_request):
     mocked_request.return_value = mocked_response
 
     result = api_caller._send_request("GET", "endpoint")
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+# Test following links.next across pages
+def test_iter_records_follows_cursors(stub_server):
+    board = "/airports/KLAX/flights/scheduled_departures"
+    stub_server.routes[board + "?max_pages=1"] = (200, {
+        "scheduled_departures": [{"fa_flight_id": "A"}, {"fa_flight_id": "B"}],
+        "links": {"next": board + "?cursor=2"},
+    })
+    stub_server.routes[board + "?cursor=2"] = (200, {
+        "scheduled_departures": [{"fa_flight_id": "C"}],
+        "links": None,
+    })
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+    records = Airports(api_caller).iter_scheduled_departures("KLAX")
+
+    assert len(stub_server.requests) == 0
+    assert next(records) == {"fa_flight_id": "A"}
+    assert len(stub_server.requests) == 1
+    assert [r["fa_flight_id"] for r in records] == ["B", "C"]
+    assert len(stub_server.requests) == 2
+
+def test_next_page_path_is_relative_to_api_root():
+    api_caller = APICaller("https://aeroapi.flightaware.com/aeroapi/", "test_api_key")
+    page = {"links": {"next": "/operators/UAL/flights?cursor=abc"}}
+
+    assert api_caller._next_page_path(page) == "https://aeroapi.flightaware.com/aeroapi/operators/UAL/flights?cursor=abc"
+    assert api_caller._next_page_path({"links": None}) is None
+
+# Test prefetching reads ahead while the consumer is busy
+def test_iter_pages_prefetches_next_pages(stub_server):
+    for i in range(3):
+        next_link = {"next": f"/operators/UAL/flights?cursor={i + 1}"} if i < 2 else None
+        stub_server.routes[f"/operators/UAL/flights?cursor={i}"] = (200, {"page": i, "links": next_link})
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+    pages = api_caller.iter_pages(api_caller._build_path("operators", "UAL/flights", {"cursor": 0}), prefetch=2)
+
+    assert next(pages)["page"] == 0
+    deadline = time.monotonic() + 2
+    while len(stub_server.requests) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(stub_server.requests) == 3
+    assert [page["page"] for page in pages] == [1, 2]
+
+# Test bulk lookups keep input order and report per-item errors
+def test_get_flights_bulk(stub_server):
+    from aeroapi_python.Flights import Flights
+    for i in range(10):
+        stub_server.routes[f"/flights/F{i}"] = (200, {"fa_flight_id": f"F{i}"})
+    stub_server.delay = 0.05
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+
+    start = time.monotonic()
+    results = Flights(api_caller).get_flights_bulk([f"F{i}" for i in range(10)] + ["missing"], concurrency=11)
+    elapsed = time.monotonic() - start
+
+    assert [r.item for r in results] == [f"F{i}" for i in range(10)] + ["missing"]
+    assert [r.result["fa_flight_id"] for r in results[:10]] == [f"F{i}" for i in range(10)]
+    assert results[10].result is None
+    assert results[10].error.response.status_code == 404
+    assert all(r.error is None for r in results[:10])
+    assert elapsed < 0.5
+
+def test_map_concurrent_captures_exceptions():
+    api_caller = APICaller("https://example.com/", "test_api_key")
+
+    def lookup(item):
+        if item == 2:
+            raise KeyError(item)
+        return item * 10
+
+    results = api_caller.map_concurrent(lookup, [1, 2, 3], ordered=False)
+
+    assert sorted((r.item, r.result) for r in results) == [(1, 10), (2, None), (3, 30)]
+    assert [type(r.error) for r in results if r.item == 2] == [KeyError]
@@ -0,0 +1,48 @@
+import pickle
+import subprocess
+import sys
+
+import aeroapi_python
+from aeroapi_python.AeroAPI import AeroAPI
+from aeroapi_python.Flights import Flights
+
+
+def run_isolated(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.split()
+
+
+def test_construction_imports_no_heavy_dependencies():
+    loaded = run_isolated(
+        "import sys\n"
+        "from aeroapi_python.AeroAPI import AeroAPI\n"
+        "aeroapi = AeroAPI('key')\n"
+        "heavy = ('requests', 'httpx', 'numpy', 'asyncio', 'multiprocessing',\n"
+        "         'aeroapi_python.Flights', 'aeroapi_python.Transport')\n"
+        "print(*[name for name in heavy if name in sys.modules])\n"
+        "aeroapi.flights\n"
+        "print('aeroapi_python.Flights' in sys.modules, 'requests' in sys.modules)\n"
+        "aeroapi.api_caller.session\n"
+        "print('requests' in sys.modules)\n"
+    )
+    assert loaded == ["True", "False", "True"]
+
+
+def test_submodules_are_attributes():
+    assert aeroapi_python.Flights.Flights is Flights
+    assert "TrackFrame" in dir(aeroapi_python)
+
+
+def test_resources_are_created_once():
+    aeroapi = AeroAPI("test_api_key")
+    flights = aeroapi.flights
+
+    assert isinstance(flights, Flights)
+    assert aeroapi.flights is flights
+    assert flights.api_caller is aeroapi.api_caller
+    assert aeroapi.api_caller.session.headers["x-apikey"] == "test_api_key"
+
+    copy = pickle.loads(pickle.dumps(aeroapi))
+    assert copy.airports.api_caller is copy.api_caller
+    assert copy.api_caller.session.headers["x-apikey"] == "test_api_key"
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from aeroapi_python.Airports import Airports
+from aeroapi_python.AsyncAeroAPI import AsyncAeroAPI
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+
+
+def test_init():
+    api_caller = AsyncAPICaller("https://example.com/", "test_api_key")
+
+    assert api_caller.base_url == "https://example.com/"
+    assert api_caller.client.headers["x-apikey"] == "test_api_key"
+    asyncio.run(api_caller.aclose())
+
+
+def test_get_against_stub(stub_server):
+    stub_server.routes["/airports/KLAX"] = (200, {"airport_code": "KLAX"})
+
+    async def run():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            return await Airports(api_caller).get_airport("KLAX")
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(run()) == {"airport_code": "KLAX"}
+    assert stub_server.requests[0][2]["x-apikey"] == "test_api_key"
+
+
+def test_http_error_returns_none(stub_server):
+    async def run():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            return await api_caller.get(api_caller._build_path("missing"))
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(run()) is None
+
+
+def test_concurrent_requests_share_client(stub_server):
+    for i in range(20):
+        stub_server.routes[f"/flights/F{i}"] = (200, {"fa_flight_id": f"F{i}"})
+
+    async def run():
+        async with AsyncAeroAPI("test_api_key") as api:
+            api.api_caller.base_url = stub_server.base_url
+            return await asyncio.gather(
+                *(api.flights.get_flight(f"F{i}") for i in range(20))
+            )
+
+    results = asyncio.run(run())
+    assert [r["fa_flight_id"] for r in results] == [f"F{i}" for i in range(20)]
+
+
+def test_iter_records_follows_cursors(stub_server):
+    path = "/operators/UAL/flights"
+    stub_server.routes[path + "?max_pages=1"] = (
+        200,
+        {
+            "scheduled": [{"ident": "UAL1"}],
+            "arrivals": [{"ident": "UAL2"}],
+            "enroute": [],
+            "links": {"next": path + "?cursor=2"},
+        },
+    )
+    stub_server.routes[path + "?cursor=2"] = (
+        200,
+        {"scheduled": [], "arrivals": [], "enroute": [{"ident": "UAL3"}]},
+    )
+
+    async def run():
+        async with AsyncAeroAPI("test_api_key") as api:
+            api.api_caller.base_url = stub_server.base_url
+            return [
+                r["ident"] async for r in api.operators.iter_operator_flights("UAL")
+            ]
+
+    assert asyncio.run(run()) == ["UAL1", "UAL2", "UAL3"]
+
+
+def test_iter_pages_prefetch_matches_serial(stub_server):
+    for i in range(4):
+        links = {"next": f"/operators/UAL/flights?cursor={i + 1}"} if i < 3 else None
+        stub_server.routes[f"/operators/UAL/flights?cursor={i}"] = (
+            200,
+            {"page": i, "links": links},
+        )
+
+    async def run():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            path = api_caller._build_path("operators", "UAL/flights", {"cursor": 0})
+            return [p["page"] async for p in api_caller.iter_pages(path, prefetch=2)]
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+
+
+def test_coalesces_identical_requests(stub_server):
+    stub_server.routes["/airports/KLAX/weather/observations"] = (
+        200,
+        {"conditions": []},
+    )
+    stub_server.delay = 0.1
+
+    async def run():
+        async with AsyncAeroAPI("test_api_key", coalesce=True) as api:
+            api.api_caller.base_url = stub_server.base_url
+            return await asyncio.gather(
+                *(
+                    api.api_caller.get(
+                        api.api_caller._build_path(
+                            "airports", "KLAX/weather/observations"
+                        )
+                    )
+                    for _ in range(10)
+                )
+            )
+
+    assert asyncio.run(run()) == [{"conditions": []}] * 10
+    assert len(stub_server.requests) == 1
+
+
+def test_last_flights_bulk(stub_server):
+    for reg in ("N1", "N2", "N3"):
+        stub_server.routes[f"/history/aircraft/{reg}/last_flight"] = (
+            200,
+            {"flights": [{"registration": reg}]},
+        )
+
+    async def run():
+        async with AsyncAeroAPI("test_api_key") as api:
+            api.api_caller.base_url = stub_server.base_url
+            return await api.history.last_flights_bulk(
+                ["N1", "N2", "N3"], concurrency=2
+            )
+
+    results = asyncio.run(run())
+    assert [r.item for r in results] == ["N1", "N2", "N3"]
+    assert [r.result["flights"][0]["registration"] for r in results] == [
+        "N1",
+        "N2",
+        "N3",
+    ]
+    assert all(r.error is None for r in results)
+
+
+def test_last_flights_bulk_reports_errors(stub_server):
+    stub_server.routes["/history/aircraft/N1/last_flight"] = (200, {"flights": []})
+    stub_server.add_failures("/history/aircraft/N2/last_flight", 500, 10)
+
+    async def run():
+        async with AsyncAeroAPI("test_api_key") as api:
+            api.api_caller.base_url = stub_server.base_url
+            return await api.history.last_flights_bulk(["N1", "N2", "N3"])
+
+    results = asyncio.run(run())
+    assert results[0].result == {"flights": []} and results[0].error is None
+    assert [r.result for r in results[1:]] == [None, None]
+    assert [r.error.response.status_code for r in results[1:]] == [500, 404]
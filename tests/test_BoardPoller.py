@@ -0,0 +1,207 @@
+import asyncio
+
+import pytest
+
+from aeroapi_python.Airports import Airports
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.BoardPoller import BoardEvent, BoardPoller
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def board(key, *flights):
+    return {key: [{"fa_flight_id": f, "status": s} for f, s in flights]}
+
+
+@pytest.fixture
+def boards(monkeypatch):
+    """
+    Replaces the arrivals boards of KLAX with `responses[board]`.
+    """
+    api_caller = APICaller("https://example.com/", "test_api_key")
+    airports = Airports(api_caller)
+    responses = {"scheduled_arrivals": None, "recent_arrivals": None}
+    calls = []
+
+    def fake(name):
+        def method(airport_id, max_pages=1):
+            calls.append((name, airport_id, max_pages))
+            return responses[name]
+
+        return method
+
+    for name in responses:
+        monkeypatch.setattr(airports, name, fake(name))
+    return airports, responses, calls
+
+
+def test_events_are_diffs_between_snapshots(boards):
+    airports, responses, calls = boards
+    clock = Clock()
+    poller = BoardPoller(
+        airports,
+        ["KLAX"],
+        boards=["scheduled_arrivals", "recent_arrivals"],
+        clock=clock,
+    )
+    responses["scheduled_arrivals"] = board(
+        "scheduled_arrivals", ("A", "En Route"), ("B", "Scheduled")
+    )
+    responses["recent_arrivals"] = board("arrivals", ("C", "Arrived"))
+
+    assert [(e.kind, e.flight_id) for e in poller.poll_due()] == [
+        ("added", "A"),
+        ("added", "B"),
+        ("added", "C"),
+    ]
+    assert len(calls) == 2
+    # Not due again until the interval has elapsed.
+    assert poller.poll_due() == []
+    assert len(calls) == 2
+
+    responses["scheduled_arrivals"] = board(
+        "scheduled_arrivals", ("B", "Delayed"), ("D", "Scheduled")
+    )
+    responses["recent_arrivals"] = board("arrivals", ("A", "Arrived"), ("C", "Arrived"))
+    clock.now = 60
+    events = poller.poll_due()
+
+    assert [(e.kind, e.board, e.flight_id) for e in events] == [
+        ("changed", "scheduled_arrivals", "B"),
+        ("added", "scheduled_arrivals", "D"),
+        ("changed", "recent_arrivals", "A"),
+    ]
+    assert events[0].previous == {"fa_flight_id": "B", "status": "Scheduled"}
+    assert events[0].flight == {"fa_flight_id": "B", "status": "Delayed"}
+
+    responses["recent_arrivals"] = board("arrivals", ("C", "Arrived"))
+    clock.now = 1000
+    assert poller.poll_due() == [
+        BoardEvent(
+            "removed",
+            "KLAX",
+            "recent_arrivals",
+            "A",
+            {"fa_flight_id": "A", "status": "Arrived"},
+            None,
+        )
+    ]
+
+
+def test_failed_polls_keep_the_snapshot(boards):
+    airports, responses, calls = boards
+    clock = Clock()
+    poller = BoardPoller(
+        airports, ["KLAX"], boards=["scheduled_arrivals"], interval=60, clock=clock
+    )
+    responses["scheduled_arrivals"] = board("scheduled_arrivals", ("A", "Scheduled"))
+    assert len(poller.poll_due()) == 1
+
+    responses["scheduled_arrivals"] = None
+    clock.now = 60
+    assert poller.poll_due() == []
+
+    responses["scheduled_arrivals"] = board("scheduled_arrivals", ("A", "Scheduled"))
+    clock.now = 120
+    assert poller.poll_due() == []
+    assert poller.interval("KLAX") > 60
+
+
+def test_interval_adapts_to_change_rate(boards):
+    airports, responses, _ = boards
+    clock = Clock()
+    poller = BoardPoller(
+        airports,
+        ["KLAX"],
+        boards=["scheduled_arrivals"],
+        min_interval=10,
+        max_interval=300,
+        ignore_fields=["status"],
+        clock=clock,
+    )
+
+    def poll(*flights):
+        responses["scheduled_arrivals"] = board("scheduled_arrivals", *flights)
+        clock.now += poller.interval("KLAX")
+        return poller.poll_due()
+
+    poll(("A", "Scheduled"))
+    intervals = []
+    for _ in range(5):
+        # Only ignored fields change: no events, and polling slows down.
+        assert poll(("A", "Delayed")) == []
+        intervals.append(poller.interval("KLAX"))
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 300
+
+    for i in range(10):
+        poll(*[(f"F{i}-{j}", "Scheduled") for j in range(20)])
+    assert poller.interval("KLAX") == 10
+
+
+def test_truncated_boards_do_not_report_removals(boards):
+    airports, responses, calls = boards
+    clock = Clock()
+    poller = BoardPoller(
+        airports, ["KLAX"], boards=["scheduled_arrivals"], max_pages=2, clock=clock
+    )
+    responses["scheduled_arrivals"] = board(
+        "scheduled_arrivals", ("A", "Scheduled"), ("B", "Scheduled")
+    )
+    poller.poll_due()
+    assert calls == [("scheduled_arrivals", "KLAX", 2)]
+
+    # B moved past the pages read: it is kept, not removed.
+    responses["scheduled_arrivals"] = board(
+        "scheduled_arrivals", ("A", "Scheduled"), ("C", "Scheduled")
+    )
+    responses["scheduled_arrivals"]["links"] = {"next": "/airports?cursor=x"}
+    clock.now = 60
+    assert [(e.kind, e.flight_id) for e in poller.poll_due()] == [("added", "C")]
+
+    responses["scheduled_arrivals"] = board(
+        "scheduled_arrivals", ("A", "Scheduled"), ("B", "Scheduled")
+    )
+    clock.now = 600
+    assert [(e.kind, e.flight_id) for e in poller.poll_due()] == [("removed", "C")]
+
+
+def test_unknown_board_raises(boards):
+    with pytest.raises(ValueError, match="'arrivals'"):
+        BoardPoller(boards[0], boards=["arrivals"])
+
+
+@pytest.mark.parametrize("smoothing", [0, -0.5, 1.5])
+def test_smoothing_out_of_range_raises(boards, smoothing):
+    with pytest.raises(ValueError, match="smoothing"):
+        BoardPoller(boards[0], smoothing=smoothing)
+
+
+def test_async_poll_due(stub_server):
+    stub_server.routes["/airports/KLAX/flights/scheduled_departures?max_pages=1"] = (
+        200,
+        board("scheduled_departures", ("A", "Scheduled")),
+    )
+
+    async def main():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            poller = BoardPoller(
+                Airports(api_caller), ["KLAX"], boards=["scheduled_departures"]
+            )
+            return await poller.poll_due()
+        finally:
+            await api_caller.aclose()
+
+    events = asyncio.run(main())
+
+    assert [(e.kind, e.airport_id, e.flight_id) for e in events] == [
+        ("added", "KLAX", "A")
+    ]
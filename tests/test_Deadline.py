@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.Deadline import current_deadline, deadline, time_left
+from aeroapi_python.Flights import Flights
+from aeroapi_python.RetryPolicy import RetryPolicy
+
+PAGED_PATH = "/airports/KLAX/flights/arrivals?max_pages=1"
+
+
+def test_nested_deadlines_only_shorten():
+    assert current_deadline() is None and time_left() is None
+    with deadline(10) as outer:
+        with deadline(60) as inner:
+            assert inner == outer
+        with deadline(1) as inner:
+            assert inner < outer
+            assert 0 < time_left() <= 1
+        assert current_deadline() == outer
+    assert current_deadline() is None
+
+
+def test_read_timeout(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    stub_server.delay = 0.5
+    api_caller = APICaller(stub_server.base_url, "test_api_key", read_timeout=0.1)
+
+    assert api_caller.get("flights/UAL1") is None
+
+
+def test_per_call_timeout_bounds_retries(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    stub_server.add_failures("/flights/UAL1", 503, 5, {"Retry-After": "1"})
+    flights = Flights(
+        APICaller(
+            stub_server.base_url,
+            "test_api_key",
+            retry_policy=RetryPolicy(max_attempts=5),
+        )
+    )
+
+    start = time.monotonic()
+    assert flights.get_flight("UAL1", timeout=0.5) is None
+    # The one-second retry cannot finish in time, so it is not attempted.
+    assert time.monotonic() - start < 0.5
+    assert len(stub_server.requests) == 1
+
+
+def test_deadline_stops_pagination(stub_server):
+    stub_server.add_pages(PAGED_PATH, "arrivals", list(range(10)), 1)
+    stub_server.delay = 0.05
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+    path = api_caller.base_url + PAGED_PATH.lstrip("/")
+
+    with deadline(0.28):
+        records = list(api_caller.iter_records(path, ("arrivals",)))
+
+    assert 0 < len(records) < 10
+    assert len(stub_server.requests) == len(records) + 1
+
+
+def test_bulk_timeout(stub_server):
+    for i in range(8):
+        stub_server.routes[f"/flights/UAL{i}"] = (200, {"flights": [{"ident": i}]})
+    stub_server.delay = 0.2
+    flights = Flights(APICaller(stub_server.base_url, "test_api_key"))
+
+    results = flights.get_flights_bulk(
+        [f"UAL{i}" for i in range(8)], concurrency=2, timeout=0.3
+    )
+
+    completed = [r for r in results if r.result is not None]
+    assert 0 < len(completed) < 8
+    assert current_deadline() is None
+
+
+def test_async_deadline(stub_server):
+    stub_server.add_pages(PAGED_PATH, "arrivals", list(range(10)), 1)
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    stub_server.delay = 0.05
+
+    async def main():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            missed = await api_caller.get("flights/UAL1", timeout=0.01)
+            path = api_caller.base_url + PAGED_PATH.lstrip("/")
+            with deadline(0.28):
+                records = [
+                    r async for r in api_caller.iter_records(path, ("arrivals",))
+                ]
+            return missed, records
+        finally:
+            await api_caller.aclose()
+
+    missed, records = asyncio.run(main())
+
+    assert missed is None
+    assert 0 < len(records) < 10
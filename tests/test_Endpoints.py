@@ -0,0 +1,83 @@
+import re
+from unittest.mock import patch
+
+import pytest
+
+from aeroapi_python.Airports import Airports
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Endpoints import ENDPOINTS, Endpoint
+from aeroapi_python.Metrics import endpoint_template
+from aeroapi_python.Models import Flight
+from aeroapi_python.ResponseCache import ResponseCache
+
+BASE_URL = "https://example.com/"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {},
+        {"airline": "UAL", "type": None, "max_pages": 2, "cursor": None},
+        {"start": "2024-01-01T00:00:00Z", "airline": "A B&C/é", "type": True},
+        {"cursor": b"a b", "max_pages": -1},
+    ],
+)
+def test_path_matches_build_path(query):
+    api_caller = APICaller(BASE_URL, "test_api_key")
+    endpoint = ENDPOINTS["airports/{airport_id}/flights/arrivals"]
+    ordered = {name: query[name] for name in endpoint.query if name in query}
+
+    assert endpoint.url(BASE_URL, "KLAX", **query) == api_caller._build_path(
+        "airports", "KLAX/flights/arrivals", ordered
+    )
+
+
+def test_path_checks_parameters():
+    endpoint = Endpoint("airports/{origin_id}/flights/to/{dest_id}", ("type",))
+
+    assert endpoint.params == ("origin_id", "dest_id")
+    assert endpoint.path("KLAX", "KSFO", encoded="a=1") == (
+        "airports/KLAX/flights/to/KSFO?a=1"
+    )
+    assert endpoint.path("KLAX", "KSFO", type="Airline", encoded="a=1") == (
+        "airports/KLAX/flights/to/KSFO?type=Airline&a=1"
+    )
+    with pytest.raises(TypeError, match="2 path parameters"):
+        endpoint.path("KLAX")
+    with pytest.raises(TypeError, match="does not accept cursor"):
+        endpoint.path("KLAX", "KSFO", cursor="x")
+
+
+@pytest.mark.parametrize("template", sorted(ENDPOINTS))
+def test_endpoints_share_metrics_and_cache_policy(template):
+    endpoint = ENDPOINTS[template]
+    path = endpoint.path(*(f"ID{i}" for i in range(len(endpoint.params))))
+    cache = ResponseCache(default_ttl=1.0)
+
+    assert endpoint_template(BASE_URL + path, BASE_URL) == re.sub(
+        r"\{\w+\}", "{id}", template
+    )
+    expected = 1.0 if endpoint.cache_ttl is None else endpoint.cache_ttl
+    assert cache.ttl_for(path) == expected
+    assert endpoint.paginated <= bool(endpoint.records)
+
+
+@patch.object(APICaller, "iter_records")
+@patch.object(APICaller, "get")
+def test_resource_methods_use_endpoint(mocked_get, mocked_iter):
+    airports = Airports(APICaller(BASE_URL, "test_api_key"))
+    airports.recent_arrivals("KLAX", airline="UAL", timeout=5)
+    airports.iter_recent_arrivals("KLAX", max_pages=3)
+
+    url = BASE_URL + "airports/KLAX/flights/arrivals?airline=UAL&max_pages=1"
+    template = "airports/{id}/flights/arrivals"
+    mocked_get.assert_called_once_with(
+        url, model={"arrivals": Flight}, timeout=5, template=template
+    )
+    mocked_iter.assert_called_once_with(
+        BASE_URL + "airports/KLAX/flights/arrivals?max_pages=3",
+        ("arrivals",),
+        model=Flight,
+        timeout=None,
+        template=template,
+    )
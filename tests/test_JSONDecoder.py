@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.JSONDecoder import get_decoder
+
+
+def test_auto_prefers_orjson():
+    orjson = pytest.importorskip("orjson")
+
+    assert get_decoder("auto") is orjson.loads
+
+
+def test_named_and_callable_decoders():
+    assert get_decoder("json") is json.loads
+    assert get_decoder(len) is len
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec", "json"])
+def test_decoders_parse_bytes_and_reject_bad_input(name):
+    try:
+        decode = get_decoder(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    assert decode(b'{"flights": [{"ident": "UAL1"}]}') == {
+        "flights": [{"ident": "UAL1"}]
+    }
+    with pytest.raises(ValueError):
+        decode(b'{"flights": [')
+
+
+def test_api_caller_decodes_from_bytes(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": [{"ident": "UAL1"}]})
+    seen = []
+
+    def decode(data):
+        seen.append(data)
+        return json.loads(data)
+
+    api_caller = APICaller(stub_server.base_url, "test_api_key", json_decoder=decode)
+
+    assert api_caller.get("flights/UAL1") == {"flights": [{"ident": "UAL1"}]}
+    assert seen == [b'{"flights": [{"ident": "UAL1"}]}']
+
+
+def test_decode_errors_return_none(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+
+    def decode(data):
+        raise ValueError("bad JSON")
+
+    api_caller = APICaller(stub_server.base_url, "test_api_key", json_decoder=decode)
+
+    assert api_caller.get("flights/UAL1") is None
+
+
+def test_async_api_caller_uses_decoder(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+
+    async def main():
+        api_caller = AsyncAPICaller(
+            stub_server.base_url, "test_api_key", json_decoder="json"
+        )
+        try:
+            return await api_caller.get("flights/UAL1")
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(main()) == {"flights": []}
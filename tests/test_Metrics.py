@@ -0,0 +1,251 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from aeroapi_python.Airports import Airports
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.Metrics import (
+    LatencyHistogram,
+    MetricsCollector,
+    OpenTelemetryExporter,
+    endpoint_template,
+)
+from aeroapi_python.Operators import Operators
+from aeroapi_python.ResponseCache import ResponseCache
+from aeroapi_python.RetryPolicy import RetryPolicy
+
+BASE_URL = "https://aeroapi.flightaware.com/aeroapi/"
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        (
+            BASE_URL + "airports/KLAX/flights/scheduled_departures?max_pages=1",
+            "airports/{id}/flights/scheduled_departures",
+        ),
+        (BASE_URL + "airports/KLAX/flights/to/KSFO", "airports/{id}/flights/to/{id}"),
+        (BASE_URL + "flights/search/count?query=x", "flights/search/count"),
+        (BASE_URL + "flights/UAL1-1234-airline-0001", "flights/{id}"),
+        ("/history/flights/UAL1/track", "history/flights/{id}/track"),
+        ("https://other.example/operators/UAL", "operators/{id}"),
+    ],
+)
+def test_endpoint_template(url, template):
+    assert endpoint_template(url, BASE_URL) == template
+
+
+def test_histogram_quantiles():
+    histogram = LatencyHistogram()
+    for i in range(1, 1001):
+        histogram.record(i / 1000)
+
+    assert histogram.count == 1000
+    assert histogram.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+    assert histogram.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+    assert histogram.quantile(1.0) == 1.0
+    assert LatencyHistogram().quantile(0.99) == 0.0
+
+
+def test_hooks_and_metrics(stub_server):
+    stub_server.routes["/airports/KLAX/flights/arrivals?max_pages=1"] = (
+        200,
+        {"arrivals": []},
+    )
+    stub_server.add_failures(
+        "/airports/KLAX/flights/arrivals?max_pages=1", 503, 1, {"Retry-After": "0"}
+    )
+    metrics = MetricsCollector()
+    seen = []
+
+    def add_header(info):
+        info.headers["traceparent"] = "00-abc-def-01"
+
+    def broken(info):
+        raise RuntimeError("hook failure")
+
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        retry_policy=RetryPolicy(backoff_factor=0),
+        cache=ResponseCache(default_ttl=60),
+        before_request=[add_header, broken],
+        after_request=[metrics, seen.append],
+    )
+    airports = Airports(api_caller)
+
+    assert airports.recent_arrivals("KLAX") == {"arrivals": []}
+    assert airports.recent_arrivals("KLAX") == {"arrivals": []}
+    assert airports.recent_arrivals("KSFO") is None
+
+    assert stub_server.requests[0][2]["traceparent"] == "00-abc-def-01"
+    first, cached, missing = seen
+    assert (first.status, first.attempts, first.cache_hit) == (200, 2, False)
+    assert first.response_bytes == len(b'{"arrivals": []}')
+    assert first.ttfb is not None and first.parse is not None
+    assert cached.cache_hit and cached.attempts == 0
+    assert missing.status == 404 and missing.error is not None
+
+    summary = metrics.snapshot()["GET airports/{id}/flights/arrivals"]
+    assert summary["count"] == 2
+    assert summary["cache_hits"] == 1
+    assert summary["retries"] == 1
+    assert summary["errors"] == 1
+    assert summary["p99"] == metrics.quantile("airports/{id}/flights/arrivals", 0.99)
+    assert 0 < summary["p50"] <= summary["p99"] <= summary["max"]
+
+    text = metrics.to_prometheus()
+    labels = 'method="GET",endpoint="airports/{id}/flights/arrivals"'
+    assert "# TYPE aeroapi_client_request_duration_seconds histogram" in text
+    assert (
+        f'aeroapi_client_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2'
+        in text
+    )
+    assert f'aeroapi_client_requests_total{{{labels},status="200"}} 1' in text
+    assert f'aeroapi_client_requests_total{{{labels},status="404"}} 1' in text
+    assert f"aeroapi_client_cache_hits_total{{{labels}}} 1" in text
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_endpoint_template_is_only_derived_for_hooks(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+
+    with patch(
+        "aeroapi_python.Metrics.endpoint_template", return_value="flights/{id}"
+    ) as mocked_template:
+        api_caller.get("flights/UAL1")
+        assert mocked_template.call_count == 0
+        api_caller.add_hooks(after=lambda info: info.endpoint)
+        api_caller.get("flights/UAL1")
+        assert mocked_template.call_count == 1
+
+
+def test_coalesced_calls_are_reported(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    stub_server.delay = 0.2
+    metrics = MetricsCollector()
+    seen = []
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        coalesce=True,
+        after_request=[metrics, seen.append],
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: api_caller.get("flights/UAL1"), range(4)))
+
+    coalesced = [info for info in seen if info.coalesced]
+    assert len(coalesced) == 4 - len(stub_server.requests) > 0
+    assert all(info.attempts == 0 and info.status is None for info in coalesced)
+    summary = metrics.snapshot()["GET flights/{id}"]
+    assert summary["count"] == len(stub_server.requests)
+    assert summary["coalesced"] == len(coalesced)
+
+
+def test_async_hooks_record_connection_timings(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    seen = []
+
+    async def main():
+        api_caller = AsyncAPICaller(
+            stub_server.base_url, "test_api_key", after_request=[seen.append]
+        )
+        try:
+            await api_caller.get("flights/UAL1")
+            await api_caller.get("flights/UAL1")
+        finally:
+            await api_caller.aclose()
+
+    asyncio.run(main())
+
+    first, second = seen
+    assert first.endpoint == "flights/{id}"
+    assert first.status == 200
+    assert first.connect is not None and first.ttfb is not None
+    # The second request reuses the pooled connection.
+    assert second.connect is None and second.ttfb is not None
+
+
+def test_open_telemetry_exporter():
+    class Histogram:
+        def __init__(self):
+            self.records = []
+
+        def record(self, value, attributes):
+            self.records.append((value, attributes))
+
+    class Meter:
+        def __init__(self):
+            self.histograms = {}
+
+        def create_histogram(self, name, unit, description):
+            return self.histograms.setdefault(name, Histogram())
+
+    class Info:
+        method = "GET"
+        endpoint = "flights/{id}"
+        status = 200
+        attempts = 1
+        cache_hit = False
+        coalesced = False
+        error = None
+        total = 0.25
+        response_bytes = 100
+
+    meter = Meter()
+    OpenTelemetryExporter(meter)(Info())
+
+    duration = meter.histograms["aeroapi.client.request.duration"].records
+    assert duration == [
+        (
+            0.25,
+            {
+                "http.request.method": "GET",
+                "url.template": "flights/{id}",
+                "aeroapi.attempts": 1,
+                "http.response.status_code": 200,
+            },
+        )
+    ]
+    assert meter.histograms["aeroapi.client.response.size"].records[0][0] == 100
+
+    class CacheHit(Info):
+        cache_hit = True
+        attempts = 0
+
+    class Coalesced(Info):
+        coalesced = True
+        attempts = 0
+
+    # Like MetricsCollector, calls that sent no request are left out.
+    exporter = OpenTelemetryExporter(meter)
+    exporter(CacheHit())
+    exporter(Coalesced())
+    assert len(duration) == 1
+    assert len(meter.histograms["aeroapi.client.response.size"].records) == 1
+
+
+def test_endpoint_table_calls_report_their_template(stub_server):
+    seen = []
+    api_caller = APICaller(
+        stub_server.base_url, "test_api_key", after_request=[seen.append]
+    )
+    operators = Operators(api_caller)
+
+    # An operator named like a resource is still an identifier.
+    operators.get_operator_info("flights")
+    operators.get_operator_flights("flights")
+    list(operators.iter_operator_flights("flights"))
+
+    assert [info.endpoint for info in seen] == [
+        "operators/{id}",
+        "operators/{id}/flights",
+        "operators/{id}/flights",
+    ]
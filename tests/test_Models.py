@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from aeroapi_python.AeroAPI import AeroAPI
+from aeroapi_python.Models import Airport, Flight, Position, Track, decode
+
+FLIGHT = {
+    "ident": "UAL123",
+    "fa_flight_id": "UAL123-1",
+    "scheduled_out": "2024-10-01T12:30:00Z",
+    "actual_out": None,
+    "origin": {"code": "KSFO", "name": "San Francisco Intl"},
+    "future_field": 1,
+}
+
+
+def test_flight_decodes_lazily():
+    flight = Flight(FLIGHT)
+
+    assert flight._scheduled_out == "2024-10-01T12:30:00Z"
+    assert flight.scheduled_out == datetime(2024, 10, 1, 12, 30, tzinfo=timezone.utc)
+    assert isinstance(flight._scheduled_out, datetime)
+    assert flight.actual_out is None
+    assert isinstance(flight.origin, Airport)
+    assert flight.origin.code == "KSFO"
+    assert flight.registration is None
+
+
+def test_models_are_slotted():
+    flight = Flight(FLIGHT)
+
+    assert not hasattr(flight, "__dict__")
+    with pytest.raises(AttributeError):
+        flight.unknown = 1
+
+
+def test_unknown_fields_and_dict_access():
+    flight = Flight(FLIGHT)
+
+    assert flight.extra == {"future_field": 1}
+    assert flight["ident"] == "UAL123"
+    assert flight["future_field"] == 1
+    assert flight.get("missing", "x") == "x"
+    with pytest.raises(KeyError):
+        flight["missing"]
+
+
+def test_to_dict_round_trips():
+    flight = Flight(FLIGHT)
+    flight.scheduled_out
+    flight.origin
+
+    data = flight.to_dict()
+
+    assert data == FLIGHT
+    assert Flight(data) == flight
+
+
+def test_track_positions():
+    track = Track(
+        {
+            "actual_distance": 10,
+            "positions": [{"latitude": 1.0, "timestamp": "2024-10-01T12:30:00Z"}],
+        }
+    )
+
+    assert isinstance(track.positions, tuple)
+    assert isinstance(track.positions[0], Position)
+    assert track.positions[0].timestamp.year == 2024
+
+
+def test_decode_spec():
+    page = {"flights": [FLIGHT], "links": {"next": None}}
+
+    decoded = decode(page, {"flights": Flight})
+
+    assert isinstance(decoded["flights"][0], Flight)
+    assert decoded["links"] == {"next": None}
+    assert page["flights"][0] is FLIGHT
+    assert decode(None, Flight) is None
+
+
+def test_aeroapi_returns_models_when_enabled(stub_server):
+    stub_server.routes["/flights/UAL123-1"] = (200, {"flights": [FLIGHT]})
+    stub_server.routes["/airports/KSFO"] = (200, {"code": "KSFO"})
+
+    plain = AeroAPI("test_api_key", models=False)
+    typed = AeroAPI("test_api_key", models=True)
+    for api in (plain, typed):
+        api.api_caller.base_url = stub_server.base_url
+
+    assert plain.flights.get_flight("UAL123-1")["flights"][0] == FLIGHT
+    flight = typed.flights.get_flight("UAL123-1")["flights"][0]
+    assert isinstance(flight, Flight)
+    assert flight.origin.code == "KSFO"
+    assert isinstance(typed.airports.get_airport("KSFO"), Airport)
+
+
+def test_iter_records_yields_models(stub_server):
+    stub_server.routes["/airports/KSFO/flights/arrivals?max_pages=1"] = (
+        200,
+        {"arrivals": [FLIGHT, FLIGHT], "links": None},
+    )
+    api = AeroAPI("test_api_key", models=True)
+    api.api_caller.base_url = stub_server.base_url
+
+    records = list(api.airports.iter_recent_arrivals("KSFO"))
+
+    assert [type(r) for r in records] == [Flight, Flight]
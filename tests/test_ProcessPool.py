@@ -0,0 +1,124 @@
+import multiprocessing
+import os
+import pickle
+
+import pytest
+
+from aeroapi_python.AeroAPI import AeroAPI
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Metrics import MetricsCollector
+from aeroapi_python.ProcessPool import process_map, worker_client
+from aeroapi_python.RateLimiter import RateLimiter
+from aeroapi_python.ResponseCache import ResponseCache
+from aeroapi_python.Transport import RequestsTransport
+from aeroapi_python.ValidatorCache import ValidatorCache
+
+fork_only = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+
+
+def idents(api_caller, flight_id):
+    response = api_caller.get(f"flights/{flight_id}")
+    return os.getpid(), response["flights"][0]["ident"]
+
+
+def pool_id(_):
+    return id(api_caller_in_parent.transport.adapter.poolmanager), idents(
+        api_caller_in_parent, "UAL1"
+    )
+
+
+api_caller_in_parent = None
+
+
+def test_pickle_keeps_configuration_only():
+    metrics = MetricsCollector()
+    api_caller = APICaller(
+        "https://example.com/",
+        "test_api_key",
+        transport=RequestsTransport(pool_maxsize=16, per_thread=True),
+        rate_limiter=RateLimiter(per_second=5),
+        cache=ResponseCache(default_ttl=60),
+        validator_cache=ValidatorCache(),
+        after_request=[metrics],
+        coalesce=True,
+        json_decoder="json",
+        read_timeout=5,
+    )
+    api_caller.cache.set("key", {"cached": True}, 60)
+    api_caller._count("retries")
+
+    copy = pickle.loads(pickle.dumps(api_caller))
+
+    assert copy.base_url == api_caller.base_url
+    assert copy.session.headers["x-apikey"] == "test_api_key"
+    assert copy.transport.pool_maxsize == 16 and copy.transport.per_thread
+    assert copy.rate_limiter.buckets[0].rate == 5
+    assert copy.cache.default_ttl == 60 and len(copy.cache) == 0
+    assert copy.read_timeout == 5 and copy.stats == {}
+    assert copy._single_flight is not None
+    assert isinstance(copy.after_request[0], MetricsCollector)
+
+    aeroapi = pickle.loads(pickle.dumps(AeroAPI("test_api_key")))
+    assert aeroapi.flights.api_caller is aeroapi.api_caller
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_process_map(stub_server, ordered):
+    for i in range(6):
+        stub_server.routes[f"/flights/UAL{i}"] = (200, {"flights": [{"ident": i}]})
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+
+    results = process_map(
+        idents, [f"UAL{i}" for i in range(7)], api_caller, processes=2, ordered=ordered
+    )
+
+    if not ordered:
+        results.sort(key=lambda result: result.item)
+    assert [r.result[1] for r in results[:6]] == list(range(6))
+    assert {r.result[0] for r in results[:6]} - {os.getpid()}
+    assert results[6].result is None and isinstance(results[6].error, TypeError)
+    with pytest.raises(RuntimeError):
+        worker_client()
+
+
+@fork_only
+def test_forked_child_replaces_connection_pool(stub_server):
+    global api_caller_in_parent
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": [{"ident": "UAL1"}]})
+    api_caller_in_parent = APICaller(
+        stub_server.base_url, "test_api_key", coalesce=True
+    )
+    api_caller_in_parent.get("flights/UAL1")
+    parent_pool = id(api_caller_in_parent.transport.adapter.poolmanager)
+
+    with multiprocessing.get_context("fork").Pool(1) as pool:
+        child_pool, (pid, ident) = pool.map(pool_id, [None])[0]
+
+    assert child_pool != parent_pool
+    assert pid != os.getpid() and ident == "UAL1"
+    # The parent's pooled connection is still usable.
+    assert api_caller_in_parent.get("flights/UAL1") is not None
+    assert len(stub_server.requests) == 3
+
+
+def flight_ident(aeroapi, flight_id):
+    return aeroapi.flights.get_flight(flight_id)["flights"][0]["ident"]
+
+
+def test_process_map_with_spawned_workers(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": [{"ident": "UAL1"}]})
+    aeroapi = AeroAPI("test_api_key")
+    aeroapi.api_caller.base_url = stub_server.base_url
+
+    results = process_map(
+        flight_ident,
+        ["UAL1", "UAL1"],
+        aeroapi,
+        processes=1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    assert [r.result for r in results] == ["UAL1", "UAL1"]
+    assert stub_server.requests[0][2]["x-apikey"] == "test_api_key"
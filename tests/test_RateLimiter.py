@@ -0,0 +1,68 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.RateLimiter import FileRateLimiter, RateLimiter, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 2.0
+    assert bucket.reserve() == 0.0
+
+
+def test_rate_limiter_uses_tightest_budget():
+    clock = FakeClock()
+    limiter = RateLimiter(per_second=10, per_minute=3, clock=clock)
+
+    waits = [limiter.reserve() for _ in range(4)]
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(20.0)
+
+
+def test_rate_limiter_requires_a_budget():
+    with pytest.raises(ValueError):
+        RateLimiter()
+
+
+def test_acquire_async_sleeps_for_reservation():
+    limiter = RateLimiter(per_second=1)
+    limiter.reserve = lambda: 0.25
+
+    with patch("asyncio.sleep") as mocked_sleep:
+        asyncio.run(limiter.acquire_async())
+    mocked_sleep.assert_awaited_once_with(0.25)
+
+
+def test_file_rate_limiter_shares_budget(tmp_path):
+    clock = FakeClock()
+    path = str(tmp_path / "aeroapi.bucket")
+    first = FileRateLimiter(path, per_second=1, clock=clock)
+    second = FileRateLimiter(path, per_second=1, clock=clock)
+
+    assert first.reserve() == 0.0
+    assert second.reserve() == pytest.approx(1.0)
+    assert first.reserve() == pytest.approx(2.0)
+
+
+@patch("aeroapi_python.Transport.requests.Session.request")
+def test_api_caller_waits_on_rate_limiter(mocked_request):
+    limiter = RateLimiter(per_second=5)
+    api_caller = APICaller("https://example.com/", "test_api_key", rate_limiter=limiter)
+
+    with patch.object(limiter, "acquire") as mocked_acquire:
+        api_caller.get("endpoint")
+    mocked_acquire.assert_called_once_with()
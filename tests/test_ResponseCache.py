@@ -0,0 +1,69 @@
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.ResponseCache import DAY, ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("airports/KLAX", DAY),
+        ("airports/KLAX/canonical", DAY),
+        ("airports/KLAX/flights/scheduled_departures", 30.0),
+        ("flights/search", 15.0),
+        ("flights/UAL1-123", 0.0),
+        ("operators/UAL", DAY),
+        ("aircraft/types/B738", DAY),
+    ],
+)
+def test_default_ttl_rules(path, expected):
+    assert ResponseCache().ttl_for(path) == expected
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = ResponseCache(clock=clock)
+    cache.set("key", {"a": 1}, ttl=10)
+
+    assert cache.get("key") == {"a": 1}
+    clock.now = 11
+    assert cache.get("key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")
+    cache.set("c", 3, ttl=60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_api_caller_serves_reference_data_from_cache(stub_server):
+    stub_server.routes["/airports/KLAX"] = (200, {"airport_code": "KLAX"})
+    stub_server.routes["/flights/F1"] = (200, {"fa_flight_id": "F1"})
+    api_caller = APICaller(stub_server.base_url, "test_api_key", cache=ResponseCache())
+
+    for _ in range(3):
+        assert api_caller.get(api_caller._build_path("airports", "KLAX")) == {
+            "airport_code": "KLAX"
+        }
+        api_caller.get(api_caller._build_path("flights", "F1"))
+
+    paths = [path for _, path, _ in stub_server.requests]
+    assert paths.count("/airports/KLAX") == 1
+    assert paths.count("/flights/F1") == 3
+    assert api_caller.cache.hits == 2
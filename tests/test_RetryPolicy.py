@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.RetryPolicy import RetryPolicy
+
+
+def test_backoff_grows_exponentially_and_is_capped():
+    policy = RetryPolicy(
+        max_attempts=10, backoff_factor=1, max_backoff=5, jitter=0.5, rng=lambda: 0
+    )
+
+    assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+
+def test_jitter_shortens_delay():
+    policy = RetryPolicy(backoff_factor=2, jitter=0.5, rng=lambda: 1)
+
+    assert policy.backoff(1) == 1
+
+
+@pytest.mark.parametrize(
+    "method, attempt, status, expected",
+    [
+        ("GET", 1, 503, 0.5),
+        ("GET", 1, 404, None),
+        ("GET", 3, 503, None),
+        ("POST", 1, 503, None),
+    ],
+)
+def test_delay_for_status(method, attempt, status, expected):
+    policy = RetryPolicy(max_attempts=3, jitter=0)
+
+    assert policy.delay_for_status(method, attempt, status) == expected
+
+
+def test_retry_after_is_honored_up_to_limit():
+    policy = RetryPolicy(max_retry_after=10)
+
+    assert policy.delay_for_status("GET", 1, 429, "7") == 7
+    assert policy.delay_for_status("GET", 1, 429, "120") is None
+    assert policy.delay_for_status("GET", 1, 429, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+def test_api_caller_retries_transient_errors(stub_server):
+    stub_server.routes["/flights/F1"] = [
+        (503, {}),
+        (429, {}, {"Retry-After": "0"}),
+        (200, {"fa_flight_id": "F1"}),
+    ]
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0.01),
+    )
+
+    assert api_caller.get(api_caller._build_path("flights", "F1")) == {
+        "fa_flight_id": "F1"
+    }
+    assert len(stub_server.requests) == 3
+    assert api_caller.stats["retries"] == 2
+
+
+def test_api_caller_gives_up_after_max_attempts(stub_server):
+    stub_server.routes["/flights/F1"] = (502, {})
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0.01),
+    )
+
+    assert api_caller.get(api_caller._build_path("flights", "F1")) is None
+    assert len(stub_server.requests) == 2
+
+
+def test_async_api_caller_retries_transient_errors(stub_server):
+    pytest.importorskip("httpx")
+    from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+
+    stub_server.routes["/flights/F1"] = [(503, {}), (200, {"fa_flight_id": "F1"})]
+
+    async def run():
+        api_caller = AsyncAPICaller(
+            stub_server.base_url,
+            "test_api_key",
+            retry_policy=RetryPolicy(backoff_factor=0.01),
+        )
+        try:
+            return await api_caller.get(api_caller._build_path("flights", "F1"))
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(run()) == {"fa_flight_id": "F1"}
@@ -0,0 +1,76 @@
+import multiprocessing
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.SQLiteCache import SQLiteCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _warm(path):
+    SQLiteCache(path).set("https://example.com/airports/KLAX", {"code": "KLAX"}, 60)
+
+
+def test_entries_are_shared_between_processes(tmp_path):
+    path = str(tmp_path / "cache.db")
+    process = multiprocessing.get_context("spawn").Process(target=_warm, args=(path,))
+    process.start()
+    process.join()
+
+    assert SQLiteCache(path).get("https://example.com/airports/KLAX") == {
+        "code": "KLAX"
+    }
+
+
+def test_entries_expire(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), clock=clock)
+    cache.set("key", [1, 2], ttl=10)
+
+    assert cache.get("key") == [1, 2]
+    clock.now += 10
+    assert cache.get("key") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evicts_least_recently_read_entries(tmp_path):
+    clock = FakeClock()
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=2, clock=clock)
+    for key in ("a", "b", "c"):
+        clock.now += 100
+        cache.set(key, key, ttl=3600)
+    clock.now += 100
+    cache.get("a")
+    cache.evict()
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+
+
+def test_evicts_down_to_max_bytes(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=15)
+    for key in ("a", "b", "c"):
+        cache.set(key, "x" * 10, ttl=3600)
+    cache.evict()
+
+    assert len(cache) == 1
+
+
+def test_api_caller_uses_disk_cache(tmp_path, stub_server):
+    stub_server.routes["/operators/UAL"] = (200, {"icao": "UAL"})
+    path = str(tmp_path / "cache.db")
+    for _ in range(2):
+        api_caller = APICaller(
+            stub_server.base_url, "test_api_key", cache=SQLiteCache(path)
+        )
+        assert api_caller.get(api_caller._build_path("operators", "UAL")) == {
+            "icao": "UAL"
+        }
+
+    assert len(stub_server.requests) == 1
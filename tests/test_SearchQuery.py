@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Flights import Flights
+from aeroapi_python.SearchQuery import SearchQuery
+
+BASE_URL = "https://example.com/"
+
+
+def test_compiles_once():
+    query = SearchQuery(
+        [("=", ["orig", "KLAX"]), ("range", ("alt", 100, 200)), ("null", "waypoints")]
+    )
+
+    assert query.query_string == "{= orig KLAX}{range alt 100 200}{null waypoints}"
+    assert query.encoded == (
+        "query=%7B%3D+orig+KLAX%7D%7Brange+alt+100+200%7D%7Bnull+waypoints%7D"
+    )
+    assert SearchQuery.coerce(query) is query
+    assert SearchQuery.coerce([("=", ["orig", "KLAX"])]) == SearchQuery(
+        [("=", ["orig", "KLAX"])]
+    )
+
+
+def test_unknown_operator_raises():
+    with pytest.raises(ValueError, match="'like'"):
+        SearchQuery([("like", ["ident", "UAL*"])])
+
+
+@pytest.mark.parametrize(
+    "method, sub_path",
+    [
+        ("search_flights", "search"),
+        ("count_search_flights", "search/count"),
+        ("search_flights_positions", "search/positions"),
+    ],
+)
+@patch.object(APICaller, "get")
+def test_search_methods_accept_queries(mocked_get, method, sub_path):
+    flights = Flights(APICaller(BASE_URL, "test_api_key"))
+    query = SearchQuery([("=", ["orig", "KLAX"])])
+
+    getattr(flights, method)(query)
+    getattr(flights, method)([("=", ["orig", "KLAX"])])
+
+    expected = f"{BASE_URL}flights/{sub_path}?{query.encoded}"
+    assert [c.args[0] for c in mocked_get.call_args_list] == [expected, expected]
+
+
+@patch.object(APICaller, "get")
+def test_get_states_with_query(mocked_get):
+    flights = Flights(APICaller(BASE_URL, "test_api_key"))
+
+    flights.get_states(time=10, query=[("airline", "UAL")])
+    flights.get_states()
+
+    assert [c.args[0] for c in mocked_get.call_args_list] == [
+        f"{BASE_URL}flights/states?time=10&query=%7Bairline+UAL%7D",
+        f"{BASE_URL}flights/states",
+    ]
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.SingleFlight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        release.wait()
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        futures = [pool.submit(flight.do, "key", slow) for _ in range(5)]
+        while not calls:
+            pass
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert {result for result, _ in results} == {"result"}
+
+
+def test_exceptions_propagate_and_key_is_released():
+    flight = SingleFlight()
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", fail)
+    assert flight.do("key", lambda: 1) == (1, False)
+
+
+def test_async_calls_share_one_execution():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", slow) for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["result"] * 5
+
+
+def test_cancelling_the_first_caller_leaves_the_call_running():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def run():
+        leader = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", slow))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(run()) == ("result", True)
+    assert len(calls) == 1
+
+
+def test_api_caller_coalesces_identical_requests(stub_server):
+    stub_server.routes["/flights/F1"] = (200, {"fa_flight_id": "F1"})
+    stub_server.delay = 0.2
+    api_caller = APICaller(stub_server.base_url, "test_api_key", coalesce=True)
+    path = api_caller._build_path("flights", "F1")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: api_caller.get(path), range(8)))
+
+    assert results == [{"fa_flight_id": "F1"}] * 8
+    assert len(stub_server.requests) < 8
+    assert api_caller.stats["coalesced"] == 8 - len(stub_server.requests)
@@ -0,0 +1,172 @@
+import asyncio
+import json
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.Models import Flight
+from aeroapi_python.Operators import Operators
+from aeroapi_python.RetryPolicy import RetryPolicy
+from aeroapi_python.StreamingJSON import ArrayStreamParser, iter_array_items
+
+DOCUMENT = {
+    "links": {"next": None},
+    "num_pages": 1,
+    "arrivals": [
+        {"ident": f"UAL{i}", "note": "é" * i, "delay": i * 1.5} for i in range(40)
+    ],
+    "departures": [],
+    "counts": [1, 2, 3],
+    "total": 123456,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 100000])
+def test_parser_yields_items_across_chunks(chunk_size):
+    body = json.dumps(DOCUMENT, ensure_ascii=False, indent=1).encode()
+    parser = ArrayStreamParser(["arrivals", "departures"])
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[i : i + chunk_size]))
+    items.extend(parser.close())
+
+    assert items == [("arrivals", item) for item in DOCUMENT["arrivals"]]
+    assert parser.rest == {
+        "links": {"next": None},
+        "num_pages": 1,
+        "counts": [1, 2, 3],
+        "total": 123456,
+    }
+
+
+def test_numbers_split_across_chunks_are_not_truncated():
+    items = list(iter_array_items([b'{"a": [1, 23', b"4, 5", b"6]}"]))
+
+    assert items == [("a", 1), ("a", 234), ("a", 56)]
+
+
+def test_items_are_yielded_before_the_body_ends():
+    parser = ArrayStreamParser(["flights"])
+
+    assert list(parser.feed(b'{"flights": [{"ident": "A"}, {"id')) == [
+        ("flights", {"ident": "A"})
+    ]
+
+
+@pytest.mark.parametrize(
+    "body", [b'{"a": [1, 2', b"[1, 2]", b'{"a" 1}', b'{"a": 1} x', b'{"a": [1 2]}']
+)
+def test_malformed_bodies_raise(body):
+    with pytest.raises(ValueError):
+        list(iter_array_items([body]))
+
+
+def test_stream_records_follows_cursors(stub_server):
+    path = "/operators/UAL/flights"
+    stub_server.routes[path + "?max_pages=1"] = (
+        200,
+        {
+            "links": {"next": path + "?cursor=2"},
+            "scheduled": [{"ident": "A"}],
+            "arrivals": [{"ident": "B"}],
+        },
+    )
+    stub_server.routes[path + "?cursor=2"] = (
+        200,
+        {"links": None, "enroute": [{"ident": "C"}]},
+    )
+    api_caller = APICaller(stub_server.base_url, "test_api_key", models=True)
+
+    records = list(Operators(api_caller).stream_operator_flights("UAL"))
+
+    assert [r.ident for r in records] == ["A", "B", "C"]
+    assert all(isinstance(r, Flight) for r in records)
+
+
+def test_stream_records_stops_on_error(stub_server):
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+
+    assert list(api_caller.stream_records("missing", ("flights",))) == []
+
+
+def test_stream_records_raises_on_truncated_body(stub_server):
+    stub_server.routes["/flights/search?max_pages=1"] = (
+        200,
+        b'{"flights": [{"ident": "A"}, {"ident": "B"}, ',
+    )
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+    records = []
+
+    with pytest.raises(ValueError, match="Truncated"):
+        for record in api_caller.stream_records(
+            "flights/search?max_pages=1", ("flights",)
+        ):
+            records.append(record)
+    assert records == [{"ident": "A"}, {"ident": "B"}]
+
+    async def main():
+        async_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            async for record in async_caller.stream_records(
+                "flights/search?max_pages=1", ("flights",)
+            ):
+                records.append(record)
+        finally:
+            await async_caller.aclose()
+
+    with pytest.raises(ValueError, match="Truncated"):
+        asyncio.run(main())
+    assert len(records) == 4
+
+
+def test_stream_records_retries_a_dropped_body(stub_server):
+    path = "/airports/KLAX/flights?max_pages=1"
+    stub_server.routes[path] = (200, {"departures": [{"ident": "A"}], "links": None})
+    stub_server.add_disconnects(path, b'{"departures": [', count=2)
+    retry_policy = RetryPolicy(backoff_factor=0)
+
+    api_caller = APICaller(
+        stub_server.base_url, "test_api_key", retry_policy=retry_policy
+    )
+    records = list(api_caller.stream_records(path, ("departures",), chunk_size=4))
+
+    async def main():
+        async_caller = AsyncAPICaller(
+            stub_server.base_url, "test_api_key", retry_policy=retry_policy
+        )
+        try:
+            return [
+                record
+                async for record in async_caller.stream_records(
+                    path, ("departures",), chunk_size=4
+                )
+            ]
+        finally:
+            await async_caller.aclose()
+
+    stub_server.add_disconnects(path, b'{"departures": [', count=2)
+    assert records == asyncio.run(main()) == [{"ident": "A"}]
+    assert len(stub_server.requests) == 6
+
+
+def test_async_stream_records(stub_server):
+    stub_server.routes["/airports/KLAX/flights?max_pages=1"] = (
+        200,
+        {"arrivals": [{"ident": "A"}], "departures": [{"ident": "B"}]},
+    )
+
+    async def main():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            path = api_caller._build_path("airports", "KLAX/flights", {"max_pages": 1})
+            return [
+                record
+                async for record in api_caller.stream_records(
+                    path, ("arrivals", "departures"), chunk_size=4
+                )
+            ]
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(main()) == [{"ident": "A"}, {"ident": "B"}]
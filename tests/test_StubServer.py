@@ -0,0 +1,59 @@
+import json
+
+import requests
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.RetryPolicy import RetryPolicy
+from aeroapi_python.StubServer import StubServer
+
+
+def test_pages_are_linked_by_cursors(stub_server):
+    records = [{"ident": f"UAL{i}"} for i in range(7)]
+    paths = stub_server.add_pages(
+        "/airports/KLAX/flights/arrivals?max_pages=1", "arrivals", records, 3
+    )
+    api_caller = APICaller(stub_server.base_url, "test_api_key")
+
+    path = api_caller._build_path("airports", "KLAX/flights/arrivals", {"max_pages": 1})
+    assert list(api_caller.iter_records(path, ("arrivals",))) == records
+    assert [p for _, p, _ in stub_server.requests] == paths
+    assert len(paths) == 3
+
+
+def test_failures_precede_the_response(stub_server):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    stub_server.add_failures("/flights/UAL1", 429, 2, {"Retry-After": "0"})
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+    )
+
+    assert api_caller.get("flights/UAL1") == {"flights": []}
+    assert len(stub_server.requests) == 3
+
+
+def test_load_recording(tmp_path):
+    recording = tmp_path / "recording.json"
+    recording.write_text(
+        json.dumps(
+            {
+                "/flights/UAL1": {"body": {"flights": []}},
+                "/flights/UAL2": [
+                    {"status": 503, "body": {"title": "Unavailable"}},
+                    {"body": {"flights": [{"ident": "UAL2"}]}},
+                ],
+            }
+        )
+    )
+
+    with StubServer() as server:
+        server.load(str(recording))
+
+        def get(path):
+            return requests.get(server.base_url + path)
+
+        assert get("flights/UAL1").json() == {"flights": []}
+        assert get("flights/UAL2").status_code == 503
+        assert get("flights/UAL2").json() == {"flights": [{"ident": "UAL2"}]}
+        assert get("flights/UAL3").status_code == 404
@@ -0,0 +1,179 @@
+import asyncio
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+from aeroapi_python.Flights import Flights
+from aeroapi_python.TiledSearch import TiledSearch, merge_positions, split_tile
+
+# Flights as (fa_flight_id, latitude, longitude, timestamp).
+FLIGHTS = [
+    ("A", 10.0, 10.0, "2024-01-01T00:00:00Z"),
+    ("B", 11.0, 12.0, "2024-01-01T00:00:00Z"),
+    ("C", 12.0, 14.0, "2024-01-01T00:00:00Z"),
+    ("D", 30.0, 30.0, "2024-01-01T00:00:00Z"),
+    ("E", 0.0, 20.0, "2024-01-01T00:00:00Z"),
+    ("F", 5.0, 175.0, "2024-01-01T00:00:00Z"),
+    ("G", 5.0, -175.0, "2024-01-01T00:00:00Z"),
+]
+
+
+def _ranges(query):
+    ranges = {}
+    for part in query.strip("{}").split("}{"):
+        op, field, low, high = part.split()
+        assert op == "range"
+        ranges[field] = (float(low), float(high))
+    return ranges
+
+
+def _matching(url):
+    query = parse_qs(urlsplit(url).query)["query"][0]
+    ranges = _ranges(query)
+    return [
+        {"fa_flight_id": ident, "latitude": lat, "longitude": lon, "timestamp": ts}
+        for ident, lat, lon, ts in FLIGHTS
+        if ranges["lat"][0] <= lat <= ranges["lat"][1]
+        and ranges["lon"][0] <= lon <= ranges["lon"][1]
+    ]
+
+
+def fake_get(
+    url, headers=None, model=None, transform=None, timeout=None, template=None
+):
+    positions = _matching(url)
+    if "/search/count" in url:
+        return {"count": len(positions)}
+    return {"positions": positions, "links": None}
+
+
+def test_split_tile():
+    assert split_tile((0, 0, 2, 4)) == [
+        (0, 0, 1, 2),
+        (0, 2, 1, 4),
+        (1, 0, 2, 2),
+        (1, 2, 2, 4),
+    ]
+
+
+def test_merge_keeps_latest_position_per_flight():
+    old = {"fa_flight_id": "A", "timestamp": "2024-01-01T00:00:00Z"}
+    new = {"fa_flight_id": "A", "timestamp": "2024-01-01T00:05:00Z"}
+    anonymous = {"timestamp": "2024-01-01T00:00:00Z"}
+
+    assert merge_positions([[old, anonymous], [new, old]]) == [new, anonymous]
+
+
+def test_dense_tiles_are_split(monkeypatch):
+    api_caller = APICaller("https://example.com/", "test_api_key")
+    monkeypatch.setattr(api_caller, "get", fake_get)
+    flights = Flights(api_caller)
+
+    result = TiledSearch(flights, max_count=2, min_size=1).search((0, 0, 40, 40))
+
+    assert sorted(p["fa_flight_id"] for p in result["positions"]) == list("ABCDE")
+    # The dense south-west quadrant is split again; empty tiles are skipped.
+    assert (20.0, 20.0, 40.0, 40.0) in result["tiles"]
+    assert (0.0, 0.0, 20.0, 20.0) not in result["tiles"]
+    assert all(len(_matching_tile(tile)) <= 2 for tile in result["tiles"])
+
+
+def _matching_tile(tile):
+    return [
+        f for f in FLIGHTS if tile[0] <= f[1] <= tile[2] and tile[1] <= f[2] <= tile[3]
+    ]
+
+
+def test_max_depth_and_failed_counts_stop_splitting(monkeypatch):
+    api_caller = APICaller("https://example.com/", "test_api_key")
+    monkeypatch.setattr(api_caller, "get", fake_get)
+    flights = Flights(api_caller)
+
+    shallow = TiledSearch(flights, max_count=1, max_depth=0)
+    assert shallow.search((0, 0, 40, 40))["tiles"] == [(0, 0, 40, 40)]
+
+    monkeypatch.setattr(
+        api_caller,
+        "get",
+        lambda url, **kwargs: None if "/count" in url else fake_get(url),
+    )
+    result = TiledSearch(flights, max_count=1).search((0, 0, 40, 40))
+    assert result["tiles"] == [(0, 0, 40, 40)]
+    assert len(result["positions"]) == 5
+
+
+def test_antimeridian_boxes_are_searched_in_two_parts(monkeypatch):
+    api_caller = APICaller("https://example.com/", "test_api_key")
+    monkeypatch.setattr(api_caller, "get", fake_get)
+
+    result = TiledSearch(Flights(api_caller)).search((0, 170, 10, -170))
+
+    assert result["tiles"] == [(0, 170, 10, 180), (0, -180, 10, -170)]
+    assert [p["fa_flight_id"] for p in result["positions"]] == ["F", "G"]
+
+
+def test_async_tiled_search(stub_server):
+    def route(tile, count, positions):
+        query = TiledSearch.tile_query(tile).encoded
+        stub_server.routes[f"/flights/search/count?{query}"] = (200, {"count": count})
+        stub_server.routes[f"/flights/search/positions?{query}"] = (
+            200,
+            {"positions": positions, "links": None},
+        )
+
+    a = {"fa_flight_id": "A", "timestamp": "2024-01-01T00:00:00Z"}
+    b = {"fa_flight_id": "B", "timestamp": "2024-01-01T00:00:00Z"}
+    route((0.0, 0.0, 2.0, 2.0), 3, [])
+    route((0.0, 0.0, 1.0, 1.0), 1, [a])
+    route((0.0, 1.0, 1.0, 2.0), 2, [a, b])
+    route((1.0, 0.0, 2.0, 1.0), 0, [])
+    route((1.0, 1.0, 2.0, 2.0), 0, [])
+
+    async def main():
+        api_caller = AsyncAPICaller(stub_server.base_url, "test_api_key")
+        try:
+            return await Flights(api_caller).search_flights_positions_tiled(
+                (0, 0, 2, 2), max_count=2, min_size=0.5
+            )
+        finally:
+            await api_caller.aclose()
+
+    result = asyncio.run(main())
+
+    assert result == {
+        "positions": [a, b],
+        "tiles": [(0, 0, 1, 1), (0, 1, 1, 2)],
+        "failed": [],
+    }
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_tiles_failing_mid_pagination_are_reported(stub_server, prefetch):
+    tile = (0.0, 0.0, 2.0, 2.0)
+    query = TiledSearch.tile_query(tile).encoded
+    stub_server.routes[f"/flights/search/count?{query}"] = (200, {"count": 2})
+    positions = [{"fa_flight_id": "A"}, {"fa_flight_id": "B"}]
+    pages = stub_server.add_pages(
+        f"/flights/search/positions?{query}", "positions", positions, 1
+    )
+    # The second page is not found.
+    del stub_server.routes[pages[1]]
+
+    api_caller = APICaller(
+        stub_server.base_url, "test_api_key", prefetch_pages=prefetch
+    )
+    result = TiledSearch(Flights(api_caller)).search(tile)
+    assert result == {"positions": [], "tiles": [tile], "failed": [tile]}
+
+    async def main():
+        api_caller = AsyncAPICaller(
+            stub_server.base_url, "test_api_key", prefetch_pages=prefetch
+        )
+        try:
+            return await TiledSearch(Flights(api_caller)).search(tile)
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(main()) == result
@@ -0,0 +1,150 @@
+import math
+from array import array
+
+import pytest
+
+from aeroapi_python import TrackFrame as track_frame_module
+from aeroapi_python.AeroAPI import AeroAPI
+from aeroapi_python.TrackFrame import TrackFrame
+
+POSITIONS = [
+    {
+        "fa_flight_id": "UAL1-1",
+        "timestamp": "2024-10-01T12:00:00Z",
+        "latitude": 0.0,
+        "longitude": 0.0,
+        "altitude": 10,
+        "groundspeed": 300,
+        "heading": 350,
+    },
+    {
+        "fa_flight_id": "UAL1-1",
+        "timestamp": "2024-10-01T12:01:00Z",
+        "latitude": 0.0,
+        "longitude": 1.0,
+        "altitude": 20,
+        "groundspeed": None,
+        "heading": 10,
+    },
+    {
+        "fa_flight_id": "UAL1-1",
+        "timestamp": "2024-10-01T12:02:00Z",
+        "latitude": 1.0,
+        "longitude": 1.0,
+        "altitude": 30,
+        "groundspeed": 320,
+        "heading": None,
+    },
+]
+START = 1727784000.0
+
+
+@pytest.fixture(params=["numpy", "array"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(track_frame_module, "np", None)
+    return request.param
+
+
+def test_from_positions(backend):
+    frame = TrackFrame.from_response({"positions": POSITIONS, "actual_distance": 138})
+
+    assert len(frame) == 3
+    assert list(frame.timestamp) == [START, START + 60, START + 120]
+    assert math.isnan(frame.groundspeed[1])
+    assert frame.fa_flight_id == ["UAL1-1"] * 3
+    assert frame.meta == {"actual_distance": 138}
+    if backend == "array":
+        assert isinstance(frame.latitude, array)
+    else:
+        assert type(frame.latitude).__module__ == "numpy"
+
+
+def test_distance_and_bounding_box(backend):
+    frame = TrackFrame.from_positions(POSITIONS)
+
+    # Two one-degree legs along the equator and a meridian, ~69.1 miles each.
+    assert frame.distance_flown() == pytest.approx(138.18, abs=0.05)
+    assert frame.bounding_box() == (0.0, 0.0, 1.0, 1.0)
+    assert TrackFrame.from_positions([]).bounding_box() is None
+
+
+def test_time_slice(backend):
+    frame = TrackFrame.from_positions(POSITIONS)
+
+    sliced = frame.time_slice(START + 30, START + 120)
+
+    assert list(sliced.altitude) == [20.0, 30.0]
+    assert len(frame.time_slice(end=START - 1)) == 0
+
+
+def test_resample(backend):
+    frame = TrackFrame.from_positions(POSITIONS)
+
+    resampled = frame.resample(30)
+
+    assert list(resampled.timestamp) == [START + 30 * i for i in range(5)]
+    assert list(resampled.altitude) == [10.0, 15.0, 20.0, 25.0, 30.0]
+    assert list(resampled.longitude) == [0.0, 0.5, 1.0, 1.0, 1.0]
+    # 350 -> 10 degrees turns through north rather than back through south.
+    assert resampled.heading[1] == pytest.approx(0.0)
+    assert resampled.fa_flight_id == ["UAL1-1"] * 5
+    with pytest.raises(ValueError):
+        frame.resample(0)
+
+
+def test_to_records_round_trips(backend):
+    records = TrackFrame.from_positions(POSITIONS).to_records()
+
+    assert records == [
+        {key: (float(v) if isinstance(v, int) else v) for key, v in p.items()}
+        for p in POSITIONS
+    ]
+
+
+def test_mixed_flights(backend):
+    other = [
+        dict(p, fa_flight_id="DAL2-1", latitude=p["latitude"] + 10) for p in POSITIONS
+    ]
+    # Interleaved and out of order, as returned by a position search.
+    mixed = [POSITIONS[2], other[1], POSITIONS[0], other[0], POSITIONS[1], other[2]]
+    frame = TrackFrame.from_positions(mixed)
+
+    for operation in (
+        frame.distance_flown,
+        frame.time_slice,
+        lambda: frame.resample(30),
+    ):
+        with pytest.raises(ValueError, match="by_flight"):
+            operation()
+    flights = frame.by_flight()
+    assert list(flights) == ["UAL1-1", "DAL2-1"]
+    assert (
+        flights["UAL1-1"].to_records()
+        == TrackFrame.from_positions(POSITIONS).to_records()
+    )
+    assert list(flights["DAL2-1"].latitude) == [10.0, 10.0, 11.0]
+    # The one-degree leg east is shorter at 10 degrees north.
+    assert flights["DAL2-1"].distance_flown() == pytest.approx(137.14, abs=0.05)
+
+
+def test_mismatched_columns():
+    with pytest.raises(ValueError):
+        TrackFrame([1.0, 2.0], [0.0], [0.0, 1.0])
+
+
+def test_flight_track_as_frame(stub_server):
+    stub_server.routes["/history/flights/UAL1-1/track"] = (
+        200,
+        {"actual_distance": 138, "positions": POSITIONS},
+    )
+    api = AeroAPI("test_api_key")
+    api.api_caller.base_url = stub_server.base_url
+
+    frame = api.history.flight_track("UAL1-1", as_frame=True)
+
+    assert isinstance(frame, TrackFrame)
+    assert frame.meta["actual_distance"] == 138
+    assert api.history.flight_track("UAL1-1")["positions"] == POSITIONS
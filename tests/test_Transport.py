@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from aeroapi_python.AeroAPI import AeroAPI
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.Flights import Flights
+from aeroapi_python.RetryPolicy import RetryPolicy
+from aeroapi_python.Transport import (
+    HTTPXTransport,
+    RequestsTransport,
+    Transport,
+    get_transport,
+)
+
+PAGED_PATH = "/airports/KLAX/flights/arrivals?max_pages=1"
+
+
+def test_get_transport():
+    assert isinstance(get_transport(), RequestsTransport)
+    assert isinstance(get_transport("httpx"), HTTPXTransport)
+    transport = RequestsTransport()
+    assert get_transport(transport) is transport
+    with pytest.raises(ValueError):
+        get_transport("curl")
+
+
+def test_incomplete_transport_is_rejected():
+    class NoStreaming(Transport):
+        headers = {}
+
+        def _options(self):
+            return {}
+
+        def request(self, method, url, json=None, headers=None, timeout=None):
+            raise NotImplementedError
+
+        def close(self):
+            pass
+
+    with pytest.raises(TypeError, match="iter_bytes"):
+        NoStreaming()
+
+    class NoPoolRecycling(NoStreaming):
+        def iter_bytes(self, response, chunk_size):
+            yield b""
+
+    # Forked children and `max_connection_age` both need a fresh pool.
+    with pytest.raises(TypeError, match="_new_pool"):
+        NoPoolRecycling()
+
+
+def test_requests_transport_pool_settings():
+    transport = RequestsTransport(pool_maxsize=128, pool_block=True, keep_alive=False)
+    api_caller = APICaller("https://example.com/", "test_api_key", transport=transport)
+
+    adapter = api_caller.session.get_adapter("https://example.com/")
+    assert adapter._pool_maxsize == 128 and adapter._pool_block
+    assert api_caller.session.headers["Connection"] == "close"
+    assert api_caller.session.headers["x-apikey"] == "test_api_key"
+    assert AeroAPI("test_api_key", transport="httpx").api_caller.session is None
+
+
+@pytest.mark.parametrize("transport", ["requests", "httpx"])
+def test_transports_against_stub_server(stub_server, transport):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": [{"ident": "UAL1"}]})
+    stub_server.add_failures("/flights/UAL1", 503, 1, {"Retry-After": "0"})
+    stub_server.add_pages(PAGED_PATH, "arrivals", list(range(5)), 2)
+    api_caller = APICaller(
+        stub_server.base_url,
+        "test_api_key",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+    path = api_caller.base_url + PAGED_PATH.lstrip("/")
+
+    try:
+        assert api_caller.get("flights/UAL1") == {"flights": [{"ident": "UAL1"}]}
+        assert api_caller.get("flights/UAL2") is None
+        assert list(api_caller.iter_records(path, ("arrivals",))) == list(range(5))
+        assert list(api_caller.stream_records(path, ("arrivals",))) == list(range(5))
+    finally:
+        api_caller.close()
+
+    assert api_caller.stats["retries"] == 1
+    assert stub_server.requests[0][2]["x-apikey"] == "test_api_key"
+
+
+@pytest.mark.parametrize("transport_class", [RequestsTransport, HTTPXTransport])
+def test_max_connection_age(stub_server, transport_class):
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    options = {} if transport_class is RequestsTransport else {"http2": False}
+    transport = transport_class(max_connection_age=0, **options)
+    api_caller = APICaller(stub_server.base_url, "test_api_key", transport=transport)
+
+    for _ in range(3):
+        assert api_caller.get("flights/UAL1") == {"flights": []}
+    # Each request went through a fresh pool; only the last one retired is kept.
+    assert len(transport._retired) == 1
+    api_caller.close()
+    assert transport._retired == []
+
+
+def test_http2_transport_falls_back_to_http11(stub_server):
+    pytest.importorskip("h2")
+    stub_server.routes["/flights/UAL1"] = (200, {"flights": []})
+    api_caller = APICaller(stub_server.base_url, "test_api_key", transport="http2")
+
+    # HTTP/2 is only negotiated over TLS; the plain-text stub speaks HTTP/1.1.
+    assert api_caller.get("flights/UAL1") == {"flights": []}
+    api_caller.close()
+
+
+def test_thread_safe_mode_uses_per_thread_sessions(stub_server):
+    for i in range(32):
+        stub_server.routes[f"/flights/UAL{i}"] = (200, {"flights": [{"ident": i}]})
+    api_caller = APICaller(stub_server.base_url, "test_api_key", thread_safe=True)
+    api_caller.transport.headers["x-client"] = "worker"
+    flights = Flights(api_caller)
+    sessions = set()
+
+    def lookup(i):
+        sessions.add(id(api_caller.session))
+        return flights.get_flight(f"UAL{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lookup, range(32)))
+
+    assert results == [{"flights": [{"ident": i}]} for i in range(32)]
+    assert 1 < len(sessions) <= 8
+    assert api_caller.session is not api_caller.transport._shared
+    assert api_caller.session.get_adapter(stub_server.base_url) is (
+        api_caller.transport.adapter
+    )
+    for _, _, headers in stub_server.requests:
+        assert headers["x-apikey"] == "test_api_key"
+        assert headers["x-client"] == "worker"
+    api_caller.close()
+
+
+def test_thread_safe_mode_rejects_shared_sessions():
+    with pytest.raises(ValueError):
+        APICaller(
+            "https://example.com/",
+            "test_api_key",
+            transport=RequestsTransport(),
+            thread_safe=True,
+        )
+    api_caller = APICaller(
+        "https://example.com/", "test_api_key", transport="httpx", thread_safe=True
+    )
+    assert api_caller.transport.thread_safe
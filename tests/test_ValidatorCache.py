@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from aeroapi_python.APICaller import APICaller
+from aeroapi_python.ValidatorCache import ValidatorCache
+
+
+def test_store_requires_validators():
+    cache = ValidatorCache()
+    cache.store("a", {}, {"x": 1})
+    cache.store("b", {"ETag": '"v1"', "Last-Modified": "Tue, 01 Oct 2024"}, {"x": 2})
+
+    assert cache.lookup("a") is None
+    assert cache.lookup("b") == (
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Tue, 01 Oct 2024"},
+        {"x": 2},
+    )
+
+
+def test_least_recently_used_url_is_forgotten():
+    cache = ValidatorCache(max_entries=1)
+    cache.store("a", {"ETag": "1"}, 1)
+    cache.store("b", {"ETag": "2"}, 2)
+
+    assert cache.lookup("a") is None
+    assert len(cache) == 1
+
+
+def test_api_caller_revalidates_with_etag(stub_server):
+    stub_server.routes["/airports/KLAX/flights/counts"] = [
+        (200, {"departed": 10}, {"ETag": '"v1"'}),
+        (304, None),
+    ]
+    api_caller = APICaller(
+        stub_server.base_url, "test_api_key", validator_cache=ValidatorCache()
+    )
+    path = api_caller._build_path("airports", "KLAX/flights/counts")
+
+    first = api_caller.get(path)
+    second = api_caller.get(path)
+
+    assert first == second == {"departed": 10}
+    assert "If-None-Match" not in stub_server.requests[0][2]
+    assert stub_server.requests[1][2]["If-None-Match"] == '"v1"'
+    assert api_caller.stats["not_modified"] == 1
+
+
+def test_async_api_caller_revalidates_with_last_modified(stub_server):
+    pytest.importorskip("httpx")
+    from aeroapi_python.AsyncAPICaller import AsyncAPICaller
+
+    modified = "Wed, 02 Oct 2024 10:00:00 GMT"
+    stub_server.routes["/airports/delays"] = [
+        (200, {"delays": []}, {"Last-Modified": modified}),
+        (304, None),
+    ]
+
+    async def run():
+        api_caller = AsyncAPICaller(
+            stub_server.base_url, "test_api_key", validator_cache=ValidatorCache()
+        )
+        try:
+            path = api_caller._build_path("airports", "delays")
+            return [await api_caller.get(path) for _ in range(2)]
+        finally:
+            await api_caller.aclose()
+
+    assert asyncio.run(run()) == [{"delays": []}] * 2
+    assert stub_server.requests[1][2]["If-Modified-Since"] == modified